@@ -1,4 +1,6 @@
 PRAGMA foreign_keys = ON;
+-- Only takes effect on a new, empty database; app/retention.py returns freed pages in steps.
+PRAGMA auto_vacuum = INCREMENTAL;
 
 BEGIN TRANSACTION;
 
@@ -21,6 +23,9 @@ CREATE TABLE IF NOT EXISTS marinas (
     last_seen_on_web_utc TEXT,
     features_last_checked_at_utc TEXT,
     last_fuel_checked_at_utc TEXT,
+    -- Written by fuel_extractor: consecutive price-hidden outcomes and anti-clog cooldown.
+    fuel_hidden_streak INTEGER NOT NULL DEFAULT 0 CHECK (fuel_hidden_streak >= 0),
+    fuel_cooldown_until_utc TEXT,
     sync_dirty INTEGER NOT NULL CHECK (sync_dirty IN (0, 1)),
     created_at_utc TEXT NOT NULL,
     updated_at_utc TEXT NOT NULL,
@@ -69,6 +74,14 @@ CREATE TABLE IF NOT EXISTS fuel_seed_queue (
     last_fuel_checked_at_utc TEXT,
     priority_hint TEXT,
     queue_status TEXT NOT NULL CHECK (queue_status IN ('pending', 'processing', 'done', 'failed')),
+    -- Set while a worker holds the seed in 'processing'; expired leases are reaped back to 'pending'.
+    lease_owner TEXT,
+    lease_expires_at_utc TEXT,
+    -- Failed attempts so far; a retry waits in 'pending' until next_attempt_at_utc, and a seed
+    -- that runs out of attempts (or fails non-retryably) is dead-lettered as 'failed'.
+    attempt_count INTEGER NOT NULL DEFAULT 0 CHECK (attempt_count >= 0),
+    next_attempt_at_utc TEXT,
+    last_error_class TEXT,
     FOREIGN KEY (marina_uid) REFERENCES marinas(marina_uid) ON DELETE CASCADE,
     CHECK (
         dockwa_url IS NOT NULL
@@ -80,6 +93,10 @@ CREATE TABLE IF NOT EXISTS fuel_seed_queue (
 CREATE INDEX IF NOT EXISTS idx_fuel_seed_queue_status
     ON fuel_seed_queue(queue_status, seeded_at_utc);
 
+CREATE INDEX IF NOT EXISTS idx_fuel_seed_queue_retry_due
+    ON fuel_seed_queue(next_attempt_at_utc)
+    WHERE queue_status = 'pending' AND next_attempt_at_utc IS NOT NULL;
+
 -- Owned by fuel_extractor
 CREATE TABLE IF NOT EXISTS fuel_logs (
     fuel_log_id INTEGER PRIMARY KEY,
@@ -109,6 +126,13 @@ CREATE TABLE IF NOT EXISTS fuel_logs (
     price_source TEXT NOT NULL CHECK (price_source IN ('dockwa_json', 'marinas_web', 'website_text', 'not_published_online', 'none')),
     confidence REAL NOT NULL CHECK (confidence >= 0.0 AND confidence <= 1.0),
     extraction_hash TEXT,
+    -- Set by the worker's insert and the change_log triggers; read and cleared by
+    -- src/services/MasterSyncService.js when it pushes the row to the Master.
+    sync_dirty INTEGER NOT NULL DEFAULT 1 CHECK (sync_dirty IN (0, 1)),
+    -- Run-length encoding: fetched_at_utc is the first sighting of this outcome,
+    -- last_confirmed_at_utc/observation_count track identical re-observations.
+    last_confirmed_at_utc TEXT,
+    observation_count INTEGER NOT NULL DEFAULT 1 CHECK (observation_count >= 1),
     created_at_utc TEXT NOT NULL,
     FOREIGN KEY (marina_uid) REFERENCES marinas(marina_uid) ON DELETE CASCADE,
     CHECK (json_valid(provenance_json)),
@@ -168,6 +192,31 @@ CREATE TABLE IF NOT EXISTS sync_events (
 CREATE INDEX IF NOT EXISTS idx_sync_events_pending
     ON sync_events(master_acknowledged, occurred_at_utc);
 
+-- Owned by fuel_extractor: per-host token bucket, error-class cooldowns and circuit breaker
+CREATE TABLE IF NOT EXISTS host_throttle_state (
+    host TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    tokens_refilled_at_epoch REAL NOT NULL,
+    consecutive_failures INTEGER NOT NULL DEFAULT 0 CHECK (consecutive_failures >= 0),
+    last_blocked_reason TEXT,
+    cooldown_until_utc TEXT,
+    -- Circuit breaker: 'open' fails seeds fast, 'half_open' lets one probe through.
+    circuit_state TEXT NOT NULL DEFAULT 'closed' CHECK (circuit_state IN ('closed', 'open', 'half_open')),
+    probe_expires_at_utc TEXT,
+    updated_at_utc TEXT NOT NULL
+);
+
+-- Owned by fuel_extractor: rolling extract_fuel latency / pages-to-first-hit per host,
+-- used to size each host's timeout and page budget
+CREATE TABLE IF NOT EXISTS host_fetch_profile (
+    host TEXT PRIMARY KEY,
+    latency_samples_json TEXT NOT NULL,
+    pages_samples_json TEXT NOT NULL,
+    updated_at_utc TEXT NOT NULL,
+    CHECK (json_valid(latency_samples_json)),
+    CHECK (json_valid(pages_samples_json))
+);
+
 -- Marina discovery state tracking
 CREATE TABLE IF NOT EXISTS discovery_state (
     id INTEGER PRIMARY KEY CHECK (id = 1),
@@ -211,4 +260,73 @@ CREATE INDEX IF NOT EXISTS idx_pricing_logs_marina_time
 CREATE INDEX IF NOT EXISTS idx_pricing_logs_sync_dirty
     ON pricing_logs(sync_dirty);
 
+-- Owned by fuel_extractor: one row per marina mirroring its newest fuel_logs /
+-- pricing_logs row, maintained by the triggers below in the writer's transaction.
+-- fuel_extractor_v2/app/latest_state.py rebuilds them for older databases.
+CREATE TABLE IF NOT EXISTS marina_fuel_latest (
+    marina_uid TEXT PRIMARY KEY,
+    fuel_log_id INTEGER NOT NULL,
+    fetched_at_utc TEXT NOT NULL,
+    last_confirmed_at_utc TEXT,
+    observation_count INTEGER NOT NULL DEFAULT 1,
+    outcome_state TEXT NOT NULL,
+    reason_tag TEXT NOT NULL,
+    blocked_reason TEXT,
+    diesel_price REAL,
+    gasoline_price REAL,
+    fuel_dock INTEGER,
+    last_updated TEXT,
+    source_url TEXT,
+    price_source TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    extraction_hash TEXT
+);
+
+CREATE TABLE IF NOT EXISTS marina_pricing_latest (
+    marina_uid TEXT PRIMARY KEY,
+    pricing_log_id INTEGER NOT NULL,
+    fetched_at_utc TEXT NOT NULL,
+    monthly_base REAL,
+    is_per_ft INTEGER,
+    catamaran_multiplier REAL,
+    liveaboard_fee REAL,
+    min_air_draft_ft REAL,
+    air_draft_source TEXT,
+    min_depth_ft REAL,
+    depth_source TEXT,
+    lift_max_beam_ft REAL,
+    lift_max_tons REAL,
+    diy_allowed INTEGER,
+    electricity_metered INTEGER,
+    water_metered INTEGER,
+    liveaboard_permitted INTEGER,
+    source_quotes TEXT,
+    extraction_hash TEXT
+);
+
+-- The triggers that keep marina_fuel_latest / marina_pricing_latest current are generated
+-- by fuel_extractor_v2/app/latest_state.py (ensure_latest_state_schema), the only copy of
+-- their DDL. Both workers create them on startup.
+
+-- Owned by fuel_extractor: change data capture for the Master API sync. Triggers on marinas,
+-- fuel_logs and pricing_logs append (table, primary key) to sync_change_log whenever a synced
+-- row changes, so a consumer reads change_seq past its sync_change_cursor row instead of
+-- scanning sync_dirty; they also set sync_dirty for MasterSyncService.js. Their DDL depends
+-- on the tables' current columns, so it is generated by fuel_extractor_v2/app/change_log.py
+-- (ensure_change_log_schema) and nowhere else. Both workers create them on startup.
+CREATE TABLE IF NOT EXISTS sync_change_log (
+    change_seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    marina_uid TEXT,
+    change_op TEXT NOT NULL CHECK (change_op IN ('insert', 'update', 'delete')),
+    changed_at_utc TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS sync_change_cursor (
+    consumer TEXT PRIMARY KEY,
+    last_change_seq INTEGER NOT NULL CHECK (last_change_seq >= 0),
+    updated_at_utc TEXT NOT NULL
+);
+
 COMMIT;
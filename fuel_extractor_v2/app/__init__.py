@@ -1,12 +1,82 @@
-from .contracts import validate_extractor_output, validate_seed_payload
-from .fuel_worker import process_pending_seeds, process_pending_seeds_in_db
-from .seed_consumer import mark_seed_status, read_pending_seeds
-
-__all__ = [
-    "validate_seed_payload",
-    "validate_extractor_output",
-    "read_pending_seeds",
-    "mark_seed_status",
-    "process_pending_seeds",
-    "process_pending_seeds_in_db",
-]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .change_log import advance_change_cursor, read_changes
+    from .contracts import (
+        check_extractor_outputs,
+        check_seed_payloads,
+        validate_extractor_output,
+        validate_seed_payload,
+    )
+    from .fuel_worker import FuelWorkerOptions, process_pending_seeds, process_pending_seeds_in_db
+    from .host_throttle import HostThrottleConfig
+    from .latest_state import read_latest_fuel, read_latest_pricing, rebuild_latest_state
+    from .retention import RetentionConfig, run_retention
+    from .seed_consumer import (
+        SeedRetryConfig,
+        claim_pending_seeds,
+        iter_pending_seeds,
+        mark_seed_status,
+        mark_seed_statuses,
+        read_pending_seeds,
+        reap_expired_leases,
+        release_seed_claims,
+        renew_seed_leases,
+        requeue_dead_lettered_seeds,
+    )
+    from .sync_outbox import SyncOutboxConfig, ship_sync_events
+    from .worker_daemon import FuelWorkerDaemon, notify_fuel_worker, send_daemon_command
+
+# Exports resolve on first access so that importing one submodule (marina_management_v2
+# only needs sync_event_writer and change_log) does not load the worker, thread pool and
+# daemon chain.
+_EXPORTS = {
+    "validate_seed_payload": "contracts",
+    "validate_extractor_output": "contracts",
+    "check_seed_payloads": "contracts",
+    "check_extractor_outputs": "contracts",
+    "read_pending_seeds": "seed_consumer",
+    "iter_pending_seeds": "seed_consumer",
+    "mark_seed_status": "seed_consumer",
+    "mark_seed_statuses": "seed_consumer",
+    "claim_pending_seeds": "seed_consumer",
+    "release_seed_claims": "seed_consumer",
+    "reap_expired_leases": "seed_consumer",
+    "renew_seed_leases": "seed_consumer",
+    "requeue_dead_lettered_seeds": "seed_consumer",
+    "SeedRetryConfig": "seed_consumer",
+    "process_pending_seeds": "fuel_worker",
+    "process_pending_seeds_in_db": "fuel_worker",
+    "FuelWorkerOptions": "fuel_worker",
+    "HostThrottleConfig": "host_throttle",
+    "read_latest_fuel": "latest_state",
+    "read_latest_pricing": "latest_state",
+    "rebuild_latest_state": "latest_state",
+    "read_changes": "change_log",
+    "advance_change_cursor": "change_log",
+    "SyncOutboxConfig": "sync_outbox",
+    "ship_sync_events": "sync_outbox",
+    "RetentionConfig": "retention",
+    "run_retention": "retention",
+    "FuelWorkerDaemon": "worker_daemon",
+    "notify_fuel_worker": "worker_daemon",
+    "send_daemon_command": "worker_daemon",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any
+
+
+class ChangeLogError(Exception):
+    pass
+
+
+# Tables whose changes the Master API sync cares about: (primary key, columns whose
+# changes are not sync-relevant). Excluded columns are the sync flag itself, updated_at_utc
+# (which only moves with another column) and the fuel worker's own crawl bookkeeping,
+# which never marked a marina dirty either.
+_CAPTURED_TABLES = {
+    "marinas": (
+        "marina_uid",
+        frozenset(
+            {
+                "sync_dirty",
+                "updated_at_utc",
+                "last_fuel_checked_at_utc",
+                "fuel_hidden_streak",
+                "fuel_cooldown_until_utc",
+            }
+        ),
+    ),
+    "fuel_logs": ("fuel_log_id", frozenset({"sync_dirty"})),
+    "pricing_logs": ("pricing_log_id", frozenset({"sync_dirty"})),
+}
+
+# Deletes are captured for marinas only; fuel_logs / pricing_logs rows are history and
+# are only ever deleted by the retention pass, which must not look like a sync change.
+_CAPTURE_DELETES = frozenset({"marinas"})
+
+_TRIGGER_NAME = re.compile(r"CREATE TRIGGER IF NOT EXISTS (\w+)")
+
+_CREATE_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS sync_change_log (
+    change_seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    marina_uid TEXT,
+    change_op TEXT NOT NULL CHECK (change_op IN ('insert', 'update', 'delete')),
+    changed_at_utc TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+);
+
+CREATE TABLE IF NOT EXISTS sync_change_cursor (
+    consumer TEXT PRIMARY KEY,
+    last_change_seq INTEGER NOT NULL CHECK (last_change_seq >= 0),
+    updated_at_utc TEXT NOT NULL
+);
+"""
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _table_exists(connection: sqlite3.Connection, table_name: str) -> bool:
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table_name,),
+    ).fetchone()
+    return row is not None
+
+
+def _trigger_sql(table_name: str, columns: list[str]) -> str:
+    primary_key, ignored = _CAPTURED_TABLES[table_name]
+    watched = [column for column in columns if column not in ignored and column != primary_key]
+    old_values = ", ".join(f"OLD.{column}" for column in watched)
+    new_values = ", ".join(f"NEW.{column}" for column in watched)
+
+    def log_insert(ref: str, change_op: str) -> str:
+        return (
+            "INSERT INTO sync_change_log (table_name, row_key, marina_uid, change_op)\n"
+            f"    VALUES ('{table_name}', {ref}.{primary_key}, {ref}.marina_uid, '{change_op}');"
+        )
+
+    # sync_dirty is still what MasterSyncService.js reads; the triggers are the one place
+    # that sets it, so writers no longer have to. Clearing it is not a watched change.
+    mark_dirty = ""
+    if "sync_dirty" in columns:
+        mark_dirty = (
+            f"\n    UPDATE {table_name} SET sync_dirty = 1\n"
+            f"    WHERE {primary_key} = NEW.{primary_key} AND sync_dirty = 0;"
+        )
+
+    # The UPDATE trigger fires only when a watched column really changed, so setting
+    # sync_dirty or re-writing identical values adds nothing to the log.
+    sql = f"""
+CREATE TRIGGER IF NOT EXISTS trg_{table_name}_change_insert
+AFTER INSERT ON {table_name}
+BEGIN
+    {log_insert("NEW", "insert")}{mark_dirty}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_{table_name}_change_update
+AFTER UPDATE ON {table_name}
+WHEN ({old_values}) IS NOT ({new_values})
+BEGIN
+    {log_insert("NEW", "update")}{mark_dirty}
+END;
+"""
+    if table_name in _CAPTURE_DELETES:
+        sql += f"""
+CREATE TRIGGER IF NOT EXISTS trg_{table_name}_change_delete
+AFTER DELETE ON {table_name}
+BEGIN
+    {log_insert("OLD", "delete")}
+END;
+"""
+    return sql
+
+
+def _split_statements(script: str) -> list[str]:
+    # sqlite3.complete_statement keeps trigger bodies (which contain ';') in one piece.
+    statements: list[str] = []
+    pending = ""
+    for line in script.splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            if pending.strip():
+                statements.append(pending.strip())
+            pending = ""
+    if pending.strip():
+        raise ChangeLogError(f"incomplete schema statement: {pending.strip()[:80]}")
+    return statements
+
+
+def _normalized_trigger_sql(sql: str) -> str:
+    # sqlite_master keeps a trigger's text as written, minus IF NOT EXISTS and the closing
+    # ';'. Layout is not part of the definition: whitespace runs, and whitespace just
+    # inside parentheses or before a comma, are normalized away.
+    normalized = " ".join(sql.replace("IF NOT EXISTS ", "", 1).split()).rstrip(";")
+    return re.sub(r"\s*([(),])\s*", r"\1 ", normalized).replace("( ", "(").strip()
+
+
+def _sync_trigger(connection: sqlite3.Connection, statement: str) -> None:
+    """Create a capture trigger, or replace it when its definition has changed."""
+    match = _TRIGGER_NAME.match(statement)
+    if match is None:
+        raise ChangeLogError(f"not a CREATE TRIGGER statement: {statement[:80]}")
+    trigger_name = match.group(1)
+    row = connection.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+        (trigger_name,),
+    ).fetchone()
+    if row is None:
+        connection.execute(statement)
+        return
+    if _normalized_trigger_sql(row[0] or "") == _normalized_trigger_sql(statement):
+        return
+    # Drop and create together so no write can land while the table is uncaptured.
+    connection.execute("SAVEPOINT change_log_trigger")
+    try:
+        connection.execute(f"DROP TRIGGER {trigger_name}")
+        connection.execute(statement)
+    except BaseException:
+        connection.execute("ROLLBACK TO change_log_trigger")
+        connection.execute("RELEASE change_log_trigger")
+        raise
+    connection.execute("RELEASE change_log_trigger")
+
+
+def ensure_change_log_schema(connection: sqlite3.Connection) -> list[str]:
+    """Create sync_change_log, its consumer cursors and the capture triggers.
+
+    Triggers watch every current column of the captured tables except the excluded
+    ones, and set sync_dirty on the row they log. This is the only source of their DDL. A trigger whose definition no longer matches (a column was added or dropped
+    since it was created) is dropped and recreated, so run this after schema upgrades.
+    Returns the captured tables present. Leaves committing to the caller, except that
+    a trigger replaced outside a transaction is committed with its savepoint.
+    """
+    if connection is None:
+        raise ChangeLogError("connection is required")
+
+    present = [table_name for table_name in _CAPTURED_TABLES if _table_exists(connection, table_name)]
+    for statement in _split_statements(_CREATE_TABLES_SQL):
+        connection.execute(statement)
+    for table_name in present:
+        columns = [row[1] for row in connection.execute(f"PRAGMA table_info({table_name})").fetchall()]
+        for statement in _split_statements(_trigger_sql(table_name, columns)):
+            _sync_trigger(connection, statement)
+    return present
+
+
+def read_change_cursor(connection: sqlite3.Connection, consumer: str) -> int:
+    """Return the last change_seq the consumer has acknowledged (0 for a new consumer)."""
+    if connection is None:
+        raise ChangeLogError("connection is required")
+    if not isinstance(consumer, str) or not consumer.strip():
+        raise ChangeLogError("consumer must be a non-empty string")
+    row = connection.execute(
+        "SELECT last_change_seq FROM sync_change_cursor WHERE consumer = ?",
+        (consumer.strip(),),
+    ).fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+def read_changes(
+    connection: sqlite3.Connection,
+    consumer: str,
+    limit: int = 500,
+) -> list[dict[str, Any]]:
+    """Return the consumer's next changes in change_seq order.
+
+    This is a primary-key range read after the consumer's cursor; nothing is marked.
+    A row changed several times appears once per change, so consumers that only need
+    the current row should de-duplicate on (table_name, row_key).
+    """
+    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+        raise ChangeLogError("limit must be an int >= 1")
+    after_seq = read_change_cursor(connection, consumer)
+    rows = connection.execute(
+        """
+        SELECT change_seq, table_name, row_key, marina_uid, change_op, changed_at_utc
+        FROM sync_change_log
+        WHERE change_seq > ?
+        ORDER BY change_seq
+        LIMIT ?
+        """,
+        (after_seq, limit),
+    ).fetchall()
+    keys = ("change_seq", "table_name", "row_key", "marina_uid", "change_op", "changed_at_utc")
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def advance_change_cursor(
+    connection: sqlite3.Connection,
+    consumer: str,
+    change_seq: int,
+    *,
+    commit: bool = True,
+) -> None:
+    """Record that the consumer has handled every change up to change_seq.
+
+    The cursor never moves backwards, so a consumer acknowledging an older batch late
+    cannot re-expose changes it already handled.
+    """
+    if connection is None:
+        raise ChangeLogError("connection is required")
+    if not isinstance(consumer, str) or not consumer.strip():
+        raise ChangeLogError("consumer must be a non-empty string")
+    if not isinstance(change_seq, int) or isinstance(change_seq, bool) or change_seq < 0:
+        raise ChangeLogError("change_seq must be an int >= 0")
+
+    connection.execute(
+        """
+        INSERT INTO sync_change_cursor (consumer, last_change_seq, updated_at_utc)
+        VALUES (?, ?, ?)
+        ON CONFLICT(consumer) DO UPDATE SET
+            last_change_seq = MAX(last_change_seq, excluded.last_change_seq),
+            updated_at_utc = excluded.updated_at_utc
+        """,
+        (consumer.strip(), change_seq, _utc_now_iso()),
+    )
+    if commit:
+        connection.commit()
+
+
+def prune_change_log(connection: sqlite3.Connection, chunk_size: int = 5000) -> int:
+    """Delete changes every registered consumer has moved past; returns rows deleted.
+
+    With no registered consumer nothing is pruned. Deletes in chunk_size-row
+    transactions; AUTOINCREMENT keeps change_seq increasing after the newest rows go.
+    """
+    if connection is None:
+        raise ChangeLogError("connection is required")
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ChangeLogError("chunk_size must be an int >= 1")
+    if not _table_exists(connection, "sync_change_log"):
+        return 0
+    row = connection.execute("SELECT MIN(last_change_seq) FROM sync_change_cursor").fetchone()
+    if row is None or row[0] is None:
+        return 0
+    safe_seq = int(row[0])
+
+    deleted = 0
+    while True:
+        cursor = connection.execute(
+            """
+            DELETE FROM sync_change_log
+            WHERE change_seq IN (
+                SELECT change_seq FROM sync_change_log
+                WHERE change_seq <= ?
+                ORDER BY change_seq
+                LIMIT ?
+            )
+            """,
+            (safe_seq, chunk_size),
+        )
+        connection.commit()
+        deleted += max(cursor.rowcount, 0)
+        if cursor.rowcount < chunk_size:
+            return deleted
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
 
 
 class ContractValidationError(Exception):
@@ -24,137 +25,222 @@ _BLOCKED_REASONS = {
     "timeout",
 }
 
+# Returns None for a valid payload, otherwise the message of the first failed rule.
+ContractCheck = Callable[[Any], "str | None"]
+
+
+@dataclass(frozen=True)
+class ContractRule:
+    """One declarative check; compile_contract turns an ordered tuple of them into a function.
+
+    fields are the payload keys the rule reads. Single-value kinds are applied to each
+    field in turn and may use {field} in message; "required", "any_non_empty_str" and
+    "any_not_none" look at the fields together. when=(field, value) applies the rule only
+    if payload[field] == value. choices lists the allowed values of the *one_of kinds.
+    """
+
+    kind: str
+    fields: tuple[str, ...]
+    message: str
+    when: tuple[str, Any] | None = None
+    choices: tuple[Any, ...] = ()
+
+
+# Failure condition per single-value kind, over the expression {v}.
+_VALUE_CONDITIONS = {
+    "non_empty_str": "not isinstance({v}, str) or not {v}.strip()",
+    "number": "not isinstance({v}, _number)",
+    "object": "not isinstance({v}, dict)",
+    "one_of": "{v} not in {choices}",
+    "str_one_of": "not isinstance({v}, str) or {v} not in {choices}",
+    "optional_number": "{v} is not None and not isinstance({v}, _number)",
+    "optional_bool": "{v} is not None and not isinstance({v}, bool)",
+    "optional_str": "{v} is not None and not isinstance({v}, str)",
+    "optional_str_one_of": "{v} is not None and (not isinstance({v}, str) or {v} not in {choices})",
+    "not_none": "{v} is None",
+    "is_true": "{v} is not True",
+}
+
+_GROUP_KINDS = frozenset({"required", "any_non_empty_str", "any_not_none"})
+
+
+def _rule_lines(rule: ContractRule, index: int, namespace: dict[str, Any], required: set[str]) -> list[str]:
+    def lookup(field: str) -> str:
+        # A field an earlier "required" rule has checked is read by subscript, not .get().
+        return f"payload[{field!r}]" if field in required else f"get({field!r})"
+
+    if rule.kind == "required":
+        # One C-level superset test on the common path; the per-field scan only runs to
+        # name the first missing field.
+        fields_name = f"_required_{index}"
+        namespace[fields_name] = frozenset(rule.fields)
+        lines: list[str] = [f"if not {fields_name} <= payload.keys():"]
+        for field in rule.fields:
+            lines.append(f"    if {field!r} not in payload:")
+            lines.append(f"        return {rule.message.format(field=field)!r}")
+        return lines
+
+    if rule.kind == "any_non_empty_str":
+        # One lookup per field; the walrus keeps the looked-up value for .strip().
+        passes = " or ".join(
+            f"(isinstance(v{n} := {lookup(field)}, str) and v{n}.strip())"
+            for n, field in enumerate(rule.fields)
+        )
+        return [f"if not ({passes}):", f"    return {rule.message!r}"]
+
+    if rule.kind == "any_not_none":
+        fails = " and ".join(f"{lookup(field)} is None" for field in rule.fields)
+        return [f"if {fails}:", f"    return {rule.message!r}"]
+
+    choices = ""
+    if rule.kind in ("str_one_of", "optional_str_one_of"):
+        choices = f"_choices_{index}"
+        namespace[choices] = frozenset(rule.choices)
+    elif rule.kind == "one_of":
+        # A tuple compares with ==, like the `in (0, 1)` checks it replaces, and never
+        # hashes the value, so an unhashable value fails the rule instead of raising.
+        choices = f"_choices_{index}"
+        namespace[choices] = tuple(rule.choices)
+
+    lines = []
+    for field in rule.fields:
+        lines.append(f"v = {lookup(field)}")
+        lines.append(f"if {_VALUE_CONDITIONS[rule.kind].format(v='v', choices=choices)}:")
+        lines.append(f"    return {rule.message.format(field=field)!r}")
+    return lines
+
+
+def compile_contract(name: str, type_message: str, rules: tuple[ContractRule, ...]) -> ContractCheck:
+    """Generate one flat check function for the rules, evaluated in order.
+
+    The rules are turned into straight-line Python source once, so a check is a run of
+    inline isinstance tests and local dict lookups with no per-rule calls or loops. The
+    function returns None for a valid payload, or the message of the first failed rule.
+    """
+    if not isinstance(name, str) or not name.isidentifier():
+        raise ContractValidationError("contract name must be an identifier")
+    namespace: dict[str, Any] = {}
+    required: set[str] = set()
+    body: list[str] = ["if not isinstance(payload, dict):", f"    return {type_message!r}", "get = payload.get"]
+    for index, rule in enumerate(rules):
+        if not isinstance(rule, ContractRule):
+            raise ContractValidationError("rules must be ContractRule instances")
+        if rule.kind not in _VALUE_CONDITIONS and rule.kind not in _GROUP_KINDS:
+            raise ContractValidationError(f"unknown contract rule kind: {rule.kind}")
+        if not rule.fields or not all(isinstance(field, str) for field in rule.fields):
+            raise ContractValidationError("rule fields must be a non-empty tuple of strings")
+        lines = _rule_lines(rule, index, namespace, required)
+        if rule.when is not None:
+            when_field, when_value = rule.when
+            when_lookup = f"payload[{when_field!r}]" if when_field in required else f"get({when_field!r})"
+            body.append(f"if {when_lookup} == {when_value!r}:")
+            body.extend(f"    {line}" for line in lines)
+        else:
+            body.extend(lines)
+            if rule.kind == "required":
+                required.update(rule.fields)
+    body.append("return None")
+
+    # Builtins are bound as defaults so every lookup in the body is a local one.
+    signature = "payload, isinstance=isinstance, dict=dict, str=str, bool=bool, _number=(float, int)"
+    source = f"def check_{name}({signature}):\n" + "".join(f"    {line}\n" for line in body)
+    exec(compile(source, f"<contract {name}>", "exec"), namespace)
+    check = namespace[f"check_{name}"]
+    check.__module__ = __name__
+    return check
+
+
+_SEED_PAYLOAD_RULES = (
+    ContractRule(
+        "required",
+        ("marina_uid", "name", "lat", "lon", "fuel_candidate", "seed_reason", "seeded_at_utc"),
+        "Missing required seed field: {field}",
+    ),
+    ContractRule("non_empty_str", ("marina_uid", "name"), "{field} must be a non-empty string"),
+    ContractRule("number", ("lat", "lon"), "{field} must be numeric"),
+    ContractRule("one_of", ("fuel_candidate",), "fuel_candidate must be 0 or 1", choices=(0, 1)),
+    ContractRule("non_empty_str", ("seed_reason", "seeded_at_utc"), "{field} must be a non-empty string"),
+    ContractRule(
+        "any_non_empty_str",
+        ("dockwa_url", "marinas_url", "website_url"),
+        "At least one source URL is required: dockwa_url, marinas_url, or website_url",
+    ),
+)
+
+_EXTRACTOR_OUTPUT_RULES = (
+    ContractRule(
+        "required",
+        (
+            "marina_uid",
+            "outcome_state",
+            "reason_tag",
+            "diesel_price",
+            "gasoline_price",
+            "fuel_dock",
+            "last_updated",
+            "source_url",
+            "source_text",
+            "provenance",
+            "fetched_at_utc",
+        ),
+        "Missing required output field: {field}",
+    ),
+    ContractRule("non_empty_str", ("marina_uid",), "marina_uid must be a non-empty string"),
+    ContractRule("str_one_of", ("outcome_state",), "outcome_state is invalid", choices=tuple(_OUTCOME_STATES)),
+    ContractRule("non_empty_str", ("reason_tag",), "reason_tag must be a non-empty string"),
+    ContractRule("optional_number", ("diesel_price", "gasoline_price"), "{field} must be numeric or null"),
+    ContractRule("optional_bool", ("fuel_dock",), "fuel_dock must be boolean or null"),
+    ContractRule("optional_str", ("last_updated", "source_url", "source_text"), "{field} must be a string or null"),
+    ContractRule("object", ("provenance",), "provenance must be an object"),
+    ContractRule("non_empty_str", ("fetched_at_utc",), "fetched_at_utc must be a non-empty string"),
+    ContractRule(
+        "optional_str_one_of", ("blocked_reason",), "blocked_reason is invalid", choices=tuple(_BLOCKED_REASONS)
+    ),
+    ContractRule(
+        "any_not_none",
+        ("diesel_price", "gasoline_price"),
+        "has_public_price requires at least one non-null price",
+        when=("outcome_state", "has_public_price"),
+    ),
+    ContractRule(
+        "is_true",
+        ("fuel_dock",),
+        "fuel_available_price_hidden requires fuel_dock=true",
+        when=("outcome_state", "fuel_available_price_hidden"),
+    ),
+    ContractRule(
+        "not_none",
+        ("blocked_reason",),
+        "fetch_blocked requires blocked_reason",
+        when=("outcome_state", "fetch_blocked"),
+    ),
+)
+
+check_seed_payload = compile_contract("seed_payload", "seed payload must be a dict", _SEED_PAYLOAD_RULES)
+check_extractor_output = compile_contract(
+    "extractor_output", "extractor output must be a dict", _EXTRACTOR_OUTPUT_RULES
+)
+
 
 def validate_seed_payload(seed: dict[str, Any]) -> None:
-    if not isinstance(seed, dict):
-        raise ContractValidationError("seed payload must be a dict")
-
-    required_fields = (
-        "marina_uid",
-        "name",
-        "lat",
-        "lon",
-        "fuel_candidate",
-        "seed_reason",
-        "seeded_at_utc",
-    )
-    for field in required_fields:
-        if field not in seed:
-            raise ContractValidationError(f"Missing required seed field: {field}")
-
-    marina_uid = seed.get("marina_uid")
-    if not isinstance(marina_uid, str) or not marina_uid.strip():
-        raise ContractValidationError("marina_uid must be a non-empty string")
-
-    name = seed.get("name")
-    if not isinstance(name, str) or not name.strip():
-        raise ContractValidationError("name must be a non-empty string")
-
-    lat = seed.get("lat")
-    lon = seed.get("lon")
-    if not isinstance(lat, (float, int)):
-        raise ContractValidationError("lat must be numeric")
-    if not isinstance(lon, (float, int)):
-        raise ContractValidationError("lon must be numeric")
-
-    fuel_candidate = seed.get("fuel_candidate")
-    if fuel_candidate not in (0, 1):
-        raise ContractValidationError("fuel_candidate must be 0 or 1")
-
-    seed_reason = seed.get("seed_reason")
-    if not isinstance(seed_reason, str) or not seed_reason.strip():
-        raise ContractValidationError("seed_reason must be a non-empty string")
-
-    seeded_at_utc = seed.get("seeded_at_utc")
-    if not isinstance(seeded_at_utc, str) or not seeded_at_utc.strip():
-        raise ContractValidationError("seeded_at_utc must be a non-empty string")
-
-    has_source_url = False
-    for url_field in ("dockwa_url", "marinas_url", "website_url"):
-        value = seed.get(url_field)
-        if isinstance(value, str) and value.strip():
-            has_source_url = True
-            break
-
-    if not has_source_url:
-        raise ContractValidationError("At least one source URL is required: dockwa_url, marinas_url, or website_url")
+    message = check_seed_payload(seed)
+    if message is not None:
+        raise ContractValidationError(message)
 
 
 def validate_extractor_output(payload: dict[str, Any]) -> None:
-    if not isinstance(payload, dict):
-        raise ContractValidationError("extractor output must be a dict")
-
-    required_fields = (
-        "marina_uid",
-        "outcome_state",
-        "reason_tag",
-        "diesel_price",
-        "gasoline_price",
-        "fuel_dock",
-        "last_updated",
-        "source_url",
-        "source_text",
-        "provenance",
-        "fetched_at_utc",
-    )
-
-    for field in required_fields:
-        if field not in payload:
-            raise ContractValidationError(f"Missing required output field: {field}")
-
-    marina_uid = payload.get("marina_uid")
-    if not isinstance(marina_uid, str) or not marina_uid.strip():
-        raise ContractValidationError("marina_uid must be a non-empty string")
-
-    outcome_state = payload.get("outcome_state")
-    if outcome_state not in _OUTCOME_STATES:
-        raise ContractValidationError("outcome_state is invalid")
-
-    reason_tag = payload.get("reason_tag")
-    if not isinstance(reason_tag, str) or not reason_tag.strip():
-        raise ContractValidationError("reason_tag must be a non-empty string")
-
-    for price_field in ("diesel_price", "gasoline_price"):
-        value = payload.get(price_field)
-        if value is not None and not isinstance(value, (float, int)):
-            raise ContractValidationError(f"{price_field} must be numeric or null")
-
-    fuel_dock = payload.get("fuel_dock")
-    if fuel_dock is not None and not isinstance(fuel_dock, bool):
-        raise ContractValidationError("fuel_dock must be boolean or null")
-
-    last_updated = payload.get("last_updated")
-    if last_updated is not None and not isinstance(last_updated, str):
-        raise ContractValidationError("last_updated must be a string or null")
-
-    source_url = payload.get("source_url")
-    if source_url is not None and not isinstance(source_url, str):
-        raise ContractValidationError("source_url must be a string or null")
-
-    source_text = payload.get("source_text")
-    if source_text is not None and not isinstance(source_text, str):
-        raise ContractValidationError("source_text must be a string or null")
-
-    provenance = payload.get("provenance")
-    if not isinstance(provenance, dict):
-        raise ContractValidationError("provenance must be an object")
-
-    fetched_at_utc = payload.get("fetched_at_utc")
-    if not isinstance(fetched_at_utc, str) or not fetched_at_utc.strip():
-        raise ContractValidationError("fetched_at_utc must be a non-empty string")
-
-    blocked_reason = payload.get("blocked_reason")
-    if blocked_reason is not None and blocked_reason not in _BLOCKED_REASONS:
-        raise ContractValidationError("blocked_reason is invalid")
-
-    if outcome_state == "has_public_price":
-        if payload.get("diesel_price") is None and payload.get("gasoline_price") is None:
-            raise ContractValidationError("has_public_price requires at least one non-null price")
-
-    if outcome_state == "fuel_available_price_hidden":
-        if payload.get("fuel_dock") is not True:
-            raise ContractValidationError("fuel_available_price_hidden requires fuel_dock=true")
-
-    if outcome_state == "fetch_blocked":
-        if blocked_reason is None:
-            raise ContractValidationError("fetch_blocked requires blocked_reason")
+    message = check_extractor_output(payload)
+    if message is not None:
+        raise ContractValidationError(message)
+
+
+def check_seed_payloads(seeds: Iterable[Any]) -> list[str | None]:
+    """Validate many seeds; one entry per seed, None when valid, else the error message."""
+    check = check_seed_payload
+    return [check(seed) for seed in seeds]
+
+
+def check_extractor_outputs(payloads: Iterable[Any]) -> list[str | None]:
+    """Validate many extractor outputs; one entry per payload, None when valid."""
+    check = check_extractor_output
+    return [check(payload) for payload in payloads]
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+
+class DockwaCacheError(Exception):
+    pass
+
+
+SnapshotFetcher = Callable[[str, int], Any]
+
+_client_lock = threading.Lock()
+_client: Any = None
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _entry_path(cache_dir: Path, dockwa_url: str) -> Path:
+    key = hashlib.sha256(dockwa_url.encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _read_entry(path: Path, dockwa_url: str) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or entry.get("dockwa_url") != dockwa_url:
+        return None
+    if not isinstance(entry.get("snapshot"), dict):
+        return None
+    return entry
+
+
+def _write_entry(path: Path, entry: dict[str, Any]) -> None:
+    # Write-then-rename so concurrent readers never see a torn file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, sort_keys=True)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def _http_client() -> Any:
+    """Process-wide httpx client so a long-running worker keeps Dockwa connections warm."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            import httpx
+
+            _client = httpx.Client(follow_redirects=True)
+        return _client
+
+
+def close_http_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _validators(entry: dict[str, Any] | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if entry is not None:
+        etag = entry.get("etag")
+        last_modified = entry.get("last_modified")
+        if isinstance(etag, str) and etag:
+            headers["If-None-Match"] = etag
+        if isinstance(last_modified, str) and last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _conditional_head(dockwa_url: str, timeout_seconds: int, entry: dict[str, Any] | None) -> Any:
+    # HEAD so validation never downloads the page; the body only ever comes through
+    # fetch_snapshot, which owns the Dockwa parser.
+    return _http_client().head(dockwa_url, headers=_validators(entry), timeout=timeout_seconds)
+
+
+def _unchanged(entry: dict[str, Any] | None, etag: str | None, last_modified: str | None) -> bool:
+    """A 200 whose validators match the entry's, from a server that ignores conditionals."""
+    if entry is None or (not etag and not last_modified):
+        return False
+    return entry.get("etag") == etag and entry.get("last_modified") == last_modified
+
+
+def fetch_dockwa_snapshot_cached(
+    dockwa_url: str,
+    timeout_seconds: int,
+    cache_dir: str | Path,
+    fetch_snapshot: SnapshotFetcher,
+) -> Any:
+    """Return a Dockwa fuel snapshot, downloading the page only when it has changed.
+
+    The page is first checked with a HEAD carrying If-None-Match / If-Modified-Since from
+    the cached entry. On 304, or on a 200 with the cached ETag and Last-Modified, the
+    cached snapshot is returned without fetching or parsing. Otherwise (a cold entry, or
+    a changed page) fetch_snapshot, the fuel_extractor fetch+parse, runs once and its
+    snapshot is cached under the HEAD's validators.
+
+    Errors are not retried or swallowed here: a missing httpx raises ImportError, any
+    other HEAD status raises DockwaCacheError, and a fetch_snapshot failure (including a
+    page that no longer parses) propagates and leaves the cached entry as it was.
+    """
+    if not isinstance(dockwa_url, str) or not dockwa_url.strip():
+        raise DockwaCacheError("dockwa_url must be a non-empty string")
+    if fetch_snapshot is None:
+        raise DockwaCacheError("fetch_snapshot is required")
+
+    dockwa_url = dockwa_url.strip()
+    path = _entry_path(Path(cache_dir), dockwa_url)
+    entry = _read_entry(path, dockwa_url)
+
+    response = _conditional_head(dockwa_url, timeout_seconds, entry)
+    status_code = response.status_code
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if (status_code == 304 and entry is not None) or (status_code == 200 and _unchanged(entry, etag, last_modified)):
+        entry["validated_at_utc"] = _utc_now_iso()
+        _write_entry(path, entry)
+        return entry["snapshot"]
+
+    if status_code != 200:
+        raise DockwaCacheError(f"Dockwa returned HTTP {status_code} for {dockwa_url}")
+
+    snapshot = fetch_snapshot(dockwa_url, timeout_seconds)
+    if isinstance(snapshot, dict):
+        now_iso = _utc_now_iso()
+        _write_entry(
+            path,
+            {
+                "dockwa_url": dockwa_url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "snapshot": snapshot,
+                "stored_at_utc": now_iso,
+                "validated_at_utc": now_iso,
+            },
+        )
+    return snapshot
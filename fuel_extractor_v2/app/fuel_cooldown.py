@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from .schema_upgrade import add_missing_columns
+
+
+class FuelCooldownError(Exception):
+    pass
+
+
+# Anti-clog policy (NEW_PIPELINE_PLAN §3): a fuel dock that hides its price for
+# hidden_streak_threshold consecutive attempts is marked not_published_online and left
+# alone for cooldown_days. seed_publish_runner skips marinas still cooling down.
+_COOLDOWN_COLUMNS = (
+    ("fuel_hidden_streak", "INTEGER NOT NULL DEFAULT 0 CHECK (fuel_hidden_streak >= 0)"),
+    ("fuel_cooldown_until_utc", "TEXT"),
+)
+
+_HIDDEN_OUTCOME = "fuel_available_price_hidden"
+# fetch_blocked says nothing about the price, so it neither extends nor breaks a streak.
+_STREAK_NEUTRAL_OUTCOMES = {"fetch_blocked"}
+
+
+@dataclass(frozen=True)
+class FuelCooldownConfig:
+    hidden_streak_threshold: int = 3
+    cooldown_days: float = 21.0
+
+
+def _utc_iso(moment: datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _parse_utc(value: str) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise FuelCooldownError(f"invalid UTC timestamp: {value}") from exc
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def ensure_fuel_cooldown_schema(connection: sqlite3.Connection) -> list[str]:
+    if connection is None:
+        raise FuelCooldownError("connection is required")
+    added = add_missing_columns(connection, "marinas", _COOLDOWN_COLUMNS)
+    # "cooldown IS NULL OR cooldown <= now" cannot seek an index, so the old
+    # (fuel_candidate, fuel_cooldown_until_utc) index only ever served fuel_candidate = 1,
+    # which idx_marinas_fuel_candidate already does. Drop it where earlier runs built it.
+    connection.execute("DROP INDEX IF EXISTS idx_marinas_fuel_cooldown")
+    return added
+
+
+def record_fuel_outcome(
+    connection: sqlite3.Connection,
+    marina_uid: str,
+    outcome_state: str,
+    observed_at_utc: str,
+    config: FuelCooldownConfig,
+) -> str | None:
+    """Update the marina's price-hidden streak and return the cooldown end if one applies.
+
+    A hidden price extends the streak; once it reaches the threshold the marina cools
+    down until observed_at_utc + cooldown_days (again on every further hidden result).
+    Any other real outcome resets the streak and lifts the cooldown. Does not commit.
+    """
+    if connection is None:
+        raise FuelCooldownError("connection is required")
+    if not isinstance(marina_uid, str) or not marina_uid.strip():
+        raise FuelCooldownError("marina_uid must be a non-empty string")
+    if not isinstance(observed_at_utc, str) or not observed_at_utc.strip():
+        raise FuelCooldownError("observed_at_utc must be a non-empty string")
+    if not isinstance(config, FuelCooldownConfig):
+        raise FuelCooldownError("config must be a FuelCooldownConfig")
+
+    if outcome_state in _STREAK_NEUTRAL_OUTCOMES:
+        return None
+
+    if outcome_state != _HIDDEN_OUTCOME:
+        connection.execute(
+            """
+            UPDATE marinas
+            SET fuel_hidden_streak = 0,
+                fuel_cooldown_until_utc = NULL
+            WHERE marina_uid = ?
+              AND (fuel_hidden_streak != 0 OR fuel_cooldown_until_utc IS NOT NULL)
+            """,
+            (marina_uid,),
+        )
+        return None
+
+    row = connection.execute(
+        "SELECT fuel_hidden_streak FROM marinas WHERE marina_uid = ?",
+        (marina_uid,),
+    ).fetchone()
+    if row is None:
+        return None
+
+    streak = int(row[0] or 0) + 1
+    cooldown_until_utc = None
+    if streak >= config.hidden_streak_threshold:
+        cooldown_until_utc = _utc_iso(_parse_utc(observed_at_utc) + timedelta(days=config.cooldown_days))
+
+    connection.execute(
+        """
+        UPDATE marinas
+        SET fuel_hidden_streak = ?,
+            fuel_cooldown_until_utc = ?
+        WHERE marina_uid = ?
+        """,
+        (streak, cooldown_until_utc, marina_uid),
+    )
+    return cooldown_until_utc
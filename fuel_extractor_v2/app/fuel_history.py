@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Iterator
+
+from .schema_upgrade import add_missing_columns
+
+
+class FuelHistoryError(Exception):
+    pass
+
+
+# A fuel_logs row is a run of identical observations: fetched_at_utc is the first
+# sighting, last_confirmed_at_utc (NULL for single observations) the latest one.
+_COALESCING_COLUMNS = (
+    ("last_confirmed_at_utc", "TEXT"),
+    ("observation_count", "INTEGER NOT NULL DEFAULT 1 CHECK (observation_count >= 1)"),
+)
+
+
+def ensure_fuel_log_coalescing_schema(connection: sqlite3.Connection) -> list[str]:
+    if connection is None:
+        raise FuelHistoryError("connection is required")
+    return add_missing_columns(connection, "fuel_logs", _COALESCING_COLUMNS)
+
+
+def confirm_fuel_log_observation(
+    connection: sqlite3.Connection,
+    fuel_log_id: int,
+    confirmed_at_utc: str,
+) -> None:
+    """Extend an existing run by one observation instead of inserting a duplicate row.
+
+    The change_log capture trigger marks the row sync_dirty (ensure_change_log_schema).
+    """
+    if connection is None:
+        raise FuelHistoryError("connection is required")
+    if not isinstance(fuel_log_id, int):
+        raise FuelHistoryError("fuel_log_id must be an int")
+    if not isinstance(confirmed_at_utc, str) or not confirmed_at_utc.strip():
+        raise FuelHistoryError("confirmed_at_utc must be a non-empty string")
+
+    cursor = connection.execute(
+        """
+        UPDATE fuel_logs
+        SET last_confirmed_at_utc = ?,
+            observation_count = observation_count + 1
+        WHERE fuel_log_id = ?
+        """,
+        (confirmed_at_utc, fuel_log_id),
+    )
+    if cursor.rowcount != 1:
+        raise FuelHistoryError(f"Expected to update 1 row for fuel_log_id={fuel_log_id}, updated {cursor.rowcount}")
+
+
+def read_fuel_log_runs(
+    connection: sqlite3.Connection,
+    marina_uid: str,
+    limit: int = 100,
+) -> list[dict[str, Any]]:
+    """Return a marina's fuel_logs newest first, one dict per run of identical observations."""
+    if connection is None:
+        raise FuelHistoryError("connection is required")
+    if not isinstance(marina_uid, str) or not marina_uid.strip():
+        raise FuelHistoryError("marina_uid must be a non-empty string")
+    if not isinstance(limit, int) or limit < 1:
+        raise FuelHistoryError("limit must be an int >= 1")
+
+    connection.row_factory = sqlite3.Row
+    rows = connection.execute(
+        """
+        SELECT
+            fuel_log_id,
+            marina_uid,
+            outcome_state,
+            reason_tag,
+            blocked_reason,
+            diesel_price,
+            gasoline_price,
+            fuel_dock,
+            source_url,
+            price_source,
+            extraction_hash,
+            fetched_at_utc AS first_observed_at_utc,
+            COALESCE(last_confirmed_at_utc, fetched_at_utc) AS last_observed_at_utc,
+            observation_count
+        FROM fuel_logs
+        WHERE marina_uid = ?
+        ORDER BY fetched_at_utc DESC
+        LIMIT ?
+        """,
+        (marina_uid.strip(), limit),
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def expand_fuel_log_runs(runs: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Expand runs back into one dict per observation.
+
+    Only the first and last observation of a run carry a timestamp; the ones in between
+    were coalesced and report observed_at_utc=None.
+    """
+    for run in runs:
+        observation_count = run.get("observation_count") or 1
+        for observation_index in range(observation_count):
+            observed_at_utc = None
+            if observation_index == 0:
+                observed_at_utc = run.get("first_observed_at_utc")
+            elif observation_index == observation_count - 1:
+                observed_at_utc = run.get("last_observed_at_utc")
+
+            observation = dict(run)
+            observation["observation_index"] = observation_index
+            observation["observed_at_utc"] = observed_at_utc
+            yield observation
@@ -3,29 +3,64 @@ from __future__ import annotations
 import hashlib
 import json
 import sqlite3
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-try:
-    from fuel_extractor.app.main import extract_fuel
-    from fuel_extractor.app.markdown_convert import fetch_dockwa_fuel_snapshot
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from .change_log import ensure_change_log_schema
+from .contracts import ContractValidationError, validate_extractor_output, validate_seed_payload
+from .dockwa_cache import DockwaCacheError, fetch_dockwa_snapshot_cached
+from .fuel_cooldown import FuelCooldownConfig, ensure_fuel_cooldown_schema, record_fuel_outcome
+from .fuel_history import confirm_fuel_log_observation, ensure_fuel_log_coalescing_schema
+from .host_budget import (
+    FetchBudget,
+    HostBudgetConfig,
+    ensure_host_budget_schema,
+    read_fetch_budget,
+    record_fetch_sample,
+)
+from .host_throttle import (
+    HostThrottleConfig,
+    ThrottleDecision,
+    classify_fetch_exception,
+    ensure_host_throttle_schema,
+    host_for_url,
+    record_host_outcome,
+    reserve_host_slot,
+)
+from .latest_state import ensure_latest_state_schema
+from .seed_consumer import (
+    SeedConsumerError,
+    SeedRetryConfig,
+    claim_pending_seeds,
+    ensure_seed_lease_schema,
+    ensure_seed_retry_schema,
+    mark_seed_status,
+    new_lease_owner,
+    reap_expired_leases,
+    record_seed_failure,
+    release_seed_claims,
+    renew_seed_leases,
+    seed_lease_held,
+)
+from .stage_timing import NULL_SEED_TIMER, NullSeedTimer, SeedTimer, StageTimings
+from .sync_event_writer import SyncEventBuffer, write_sync_event
+from .unit_of_work import UnitOfWork
+
+if TYPE_CHECKING:
     from fuel_extractor.app.schemas import ExtractRequest, ExtractResponse
-except ImportError:
-    extract_fuel = None
-    fetch_dockwa_fuel_snapshot = None
-    ExtractRequest = None
-    ExtractResponse = None
-
-from .contracts import validate_extractor_output, validate_seed_payload
-from .seed_consumer import mark_seed_status, read_pending_seeds
-from .sync_event_writer import write_sync_event
 
 
 class FuelWorkerError(Exception):
     pass
 
 
+# Receives one dict per finished seed; see process_pending_seeds.
+SeedOutcomeCallback = Callable[[dict[str, Any]], None]
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
@@ -54,7 +89,30 @@ def _choose_source_url(seed: dict[str, Any]) -> str:
     raise FuelWorkerError("seed requires at least one source URL: dockwa_url, marinas_url, or website_url")
 
 
-def _to_extract_request(seed: dict[str, Any]) -> ExtractRequest:
+# fuel_extractor is imported on first use: fuel_extractor.app.main pulls in Playwright,
+# PyMuPDF and markdownify, which a Dockwa-only or fully cached run never needs.
+def _extract_fuel(request: ExtractRequest) -> ExtractResponse:
+    from fuel_extractor.app.main import extract_fuel
+
+    return extract_fuel(request)
+
+
+def _fetch_dockwa_fuel_snapshot(dockwa_url: str, timeout_seconds: int) -> Any:
+    from fuel_extractor.app.markdown_convert import fetch_dockwa_fuel_snapshot
+
+    return fetch_dockwa_fuel_snapshot(dockwa_url, timeout_seconds)
+
+
+def _to_extract_request(
+    seed: dict[str, Any],
+    budget: FetchBudget | None = None,
+    source_url: str | None = None,
+) -> ExtractRequest:
+    from fuel_extractor.app.schemas import ExtractRequest
+
+    if budget is None:
+        budget = FetchBudget(timeout_seconds=45, max_pages=8)
+
     seed_id = seed.get("seed_id")
     marina_uid = _as_non_empty_string(seed.get("marina_uid"), "marina_uid")
     name = _as_non_empty_string(seed.get("name"), "name")
@@ -69,7 +127,8 @@ def _to_extract_request(seed: dict[str, Any]) -> ExtractRequest:
     if not isinstance(lon, (int, float)):
         raise FuelWorkerError("lon must be numeric")
 
-    source_url = _choose_source_url(seed)
+    if source_url is None:
+        source_url = _choose_source_url(seed)
 
     request_payload = {
         "job_id": f"seed-{seed_id}-{marina_uid}",
@@ -80,21 +139,34 @@ def _to_extract_request(seed: dict[str, Any]) -> ExtractRequest:
         "lat": float(lat),
         "lon": float(lon),
         "max_discovery_depth": 2,
-        "max_pages": 8,
+        "max_pages": budget.max_pages,
         "prefer_pdfs": True,
-        "timeout_seconds": 45,
+        "timeout_seconds": budget.timeout_seconds,
         "skip_if_verified_within_hours": 24,
     }
     return ExtractRequest(**request_payload)
 
 
-def _try_dockwa_extraction(seed: dict[str, Any], timeout_seconds: int) -> dict[str, Any] | None:
+def _try_dockwa_extraction(
+    seed: dict[str, Any],
+    timeout_seconds: int,
+    cache_dir: str | None = None,
+) -> dict[str, Any] | None:
     dockwa_url = seed.get("dockwa_url")
     if not isinstance(dockwa_url, str) or not dockwa_url.strip():
         return None
 
     try:
-        snapshot = fetch_dockwa_fuel_snapshot(dockwa_url.strip(), timeout_seconds)
+        if cache_dir is not None:
+            snapshot = fetch_dockwa_snapshot_cached(
+                dockwa_url.strip(), timeout_seconds, cache_dir, _fetch_dockwa_fuel_snapshot
+            )
+        else:
+            snapshot = _fetch_dockwa_fuel_snapshot(dockwa_url.strip(), timeout_seconds)
+    except (ImportError, DockwaCacheError):
+        # A missing dependency or a Dockwa error status fails the seed, not silently
+        # falls through to the website crawl.
+        raise
     except Exception:
         return None
 
@@ -234,6 +306,13 @@ def _price_source(outcome_state: str, source_url: str | None) -> str:
     return "none"
 
 
+def _logged_price_source(output_payload: dict[str, Any]) -> str:
+    """The price_source a fuel_logs row for output_payload carries, override included."""
+    return output_payload.get("price_source") or _price_source(
+        output_payload["outcome_state"], output_payload.get("source_url")
+    )
+
+
 def _normalize_confidence(value: Any) -> float:
     if not isinstance(value, (int, float)):
         return 0.0
@@ -323,7 +402,13 @@ def _build_output_payload(seed: dict[str, Any], response: ExtractResponse) -> di
     return output_payload
 
 
-def _write_fuel_log(connection: sqlite3.Connection, output_payload: dict[str, Any], response: ExtractResponse | None) -> int:
+def _write_fuel_log(
+    connection: sqlite3.Connection,
+    output_payload: dict[str, Any],
+    response: ExtractResponse | None,
+    *,
+    commit: bool = True,
+) -> int:
     if connection is None:
         raise FuelWorkerError("connection is required")
 
@@ -378,14 +463,15 @@ def _write_fuel_log(connection: sqlite3.Connection, output_payload: dict[str, An
             output_payload.get("source_url"),
             output_payload.get("source_text"),
             json.dumps(output_payload.get("provenance"), sort_keys=True),
-            _price_source(output_payload["outcome_state"], output_payload.get("source_url")),
+            _logged_price_source(output_payload),
             confidence,
             extraction_hash,
             1,  # sync_dirty = 1 to trigger VPS sync
             created_at_utc,
         ),
     )
-    connection.commit()
+    if commit:
+        connection.commit()
 
     fuel_log_id = cursor.lastrowid
     if not isinstance(fuel_log_id, int):
@@ -396,7 +482,11 @@ def _write_fuel_log(connection: sqlite3.Connection, output_payload: dict[str, An
 def _get_previous_fuel_log(
     connection: sqlite3.Connection, marina_uid: str
 ) -> dict[str, Any] | None:
-    """Get the most recent fuel log for a marina to detect price changes."""
+    """Get the most recent fuel log for a marina to detect price changes.
+
+    Reads marina_fuel_latest (one primary-key lookup) rather than sorting fuel_logs;
+    process_pending_seeds ensures the table and its triggers exist.
+    """
     if connection is None:
         return None
 
@@ -404,11 +494,9 @@ def _get_previous_fuel_log(
     cursor = connection.cursor()
     cursor.execute(
         """
-        SELECT fuel_log_id, diesel_price, gasoline_price, outcome_state
-        FROM fuel_logs
+        SELECT fuel_log_id, diesel_price, gasoline_price, outcome_state, price_source, extraction_hash
+        FROM marina_fuel_latest
         WHERE marina_uid = ?
-        ORDER BY fetched_at_utc DESC
-        LIMIT 1
         """,
         (marina_uid,),
     )
@@ -418,23 +506,44 @@ def _get_previous_fuel_log(
     return dict(row)
 
 
+def _emit_sync_event(
+    connection: sqlite3.Connection,
+    sync_events: SyncEventBuffer | None,
+    commit: bool,
+    **event: Any,
+) -> None:
+    if sync_events is not None:
+        sync_events.add(**event)
+    else:
+        write_sync_event(connection, commit=commit, **event)
+
+
 def _write_fuel_price_event(
     connection: sqlite3.Connection,
     marina_uid: str,
     source_marinas_id: str,
     output_payload: dict[str, Any],
     fuel_log_id: int,
+    previous: dict[str, Any] | None,
+    *,
+    commit: bool = True,
+    sync_events: SyncEventBuffer | None = None,
 ) -> None:
-    """Write sync event if fuel prices changed from previous log."""
+    """Write sync event if fuel prices changed from previous log.
+
+    previous must be read before the new fuel_log row is inserted. With sync_events the
+    event is buffered for the next flush instead of inserted (and commit is ignored).
+    """
     try:
-        previous = _get_previous_fuel_log(connection, marina_uid)
         current_diesel = output_payload.get("diesel_price")
         current_gas = output_payload.get("gasoline_price")
 
         # Always write event for first-time price discovery
         if previous is None and (current_diesel is not None or current_gas is not None):
-            write_sync_event(
+            _emit_sync_event(
                 connection,
+                sync_events,
+                commit,
                 marina_uid=marina_uid,
                 entity_type="fuel_log",
                 entity_ref=str(fuel_log_id),
@@ -463,8 +572,10 @@ def _write_fuel_price_event(
             )
 
             if diesel_changed or gas_changed:
-                write_sync_event(
+                _emit_sync_event(
                     connection,
+                    sync_events,
+                    commit,
                     marina_uid=marina_uid,
                     entity_type="fuel_log",
                     entity_ref=str(fuel_log_id),
@@ -492,11 +603,16 @@ def _write_fetch_blocked_event(
     marina_uid: str,
     source_marinas_id: str,
     error_message: str,
+    *,
+    commit: bool = True,
+    sync_events: SyncEventBuffer | None = None,
 ) -> None:
     """Write sync event when extraction fails."""
     try:
-        write_sync_event(
+        _emit_sync_event(
             connection,
+            sync_events,
+            commit,
             marina_uid=marina_uid,
             entity_type="marina",
             entity_ref=source_marinas_id or marina_uid,
@@ -510,71 +626,946 @@ def _write_fetch_blocked_event(
         pass
 
 
-def process_pending_seeds(connection: sqlite3.Connection, batch_size: int) -> dict[str, Any]:
+@dataclass(frozen=True)
+class FuelWorkerOptions:
+    """Tuning knobs for a worker run.
+
+    By default seeds are claimed, fetched and committed one at a time on one thread, with
+    no Dockwa cache, coalescing, timings or hedging. The per-host throttle, the anti-clog
+    cooldown, per-host fetch budgets and retry with backoff are on by default; pass None
+    to turn any of them off.
+
+    group_commit_size > 1 commits that many finished seeds per transaction.
+    dockwa_cache_dir enables the conditional-GET Dockwa snapshot cache.
+    coalesce_observations collapses unchanged outcomes into the latest fuel_log row.
+    lease_seconds bounds how long a crashed worker can hold claimed seeds.
+    throttle=None disables the per-host rate limiter and error-class backoff.
+    cooldown=None disables the anti-clog cooldown for marinas that keep hiding prices.
+    stage_timings adds per-stage p50/p95/max to the result; timing_trace_path also
+    appends one JSONL line per seed with its stage breakdown (and implies stage_timings).
+    budget=None keeps extract_fuel at a fixed 45 s / 8 pages instead of per-host budgets.
+    hedge_delay_seconds starts extract_fuel alongside a Dockwa fetch that has not answered
+    within that many seconds, for seeds with both sources; None keeps Dockwa strictly first.
+    retry=None marks a failed seed 'failed' at once instead of retrying it with backoff.
+    """
+
+    max_workers: int = 1
+    group_commit_size: int = 1
+    dockwa_cache_dir: str | None = None
+    coalesce_observations: bool = False
+    lease_seconds: int = 30 * 60
+    throttle: HostThrottleConfig | None = field(default_factory=HostThrottleConfig)
+    cooldown: FuelCooldownConfig | None = field(default_factory=FuelCooldownConfig)
+    stage_timings: bool = False
+    timing_trace_path: str | None = None
+    budget: HostBudgetConfig | None = field(default_factory=HostBudgetConfig)
+    hedge_delay_seconds: float | None = None
+    retry: SeedRetryConfig | None = field(default_factory=SeedRetryConfig)
+
+
+@dataclass
+class _PreparedSeed:
+    """A claimed seed that passed validation and throttling, ready to fetch."""
+
+    seed: dict[str, Any]
+    host: str | None
+    decision: ThrottleDecision
+    budget: FetchBudget | None = None
+    timer: SeedTimer | NullSeedTimer = NULL_SEED_TIMER
+    # Set only when the seed may be hedged: the non-Dockwa start URL and its own host slot.
+    hedge_url: str | None = None
+    hedge_host: str | None = None
+    hedge_decision: ThrottleDecision | None = None
+    hedge_budget: FetchBudget | None = None
+
+
+@dataclass
+class _SeedFetchResult:
+    seed: dict[str, Any]
+    host: str | None = None
+    output_payload: dict[str, Any] | None = None
+    response: ExtractResponse | None = None
+    error: Exception | None = None
+    timer: SeedTimer | NullSeedTimer = NULL_SEED_TIMER
+    circuit_open: bool = False
+    budget: FetchBudget | None = None
+    extract_seconds: float | None = None
+    hedge_winner: str | None = None
+    start_url: str | None = None
+
+
+def _validate_options(options: FuelWorkerOptions) -> None:
+    if not isinstance(options, FuelWorkerOptions):
+        raise FuelWorkerError("options must be a FuelWorkerOptions")
+    if not isinstance(options.max_workers, int) or isinstance(options.max_workers, bool):
+        raise FuelWorkerError("max_workers must be an int")
+    if options.max_workers < 1:
+        raise FuelWorkerError("max_workers must be >= 1")
+    if not isinstance(options.group_commit_size, int) or isinstance(options.group_commit_size, bool):
+        raise FuelWorkerError("group_commit_size must be an int")
+    if options.group_commit_size < 1:
+        raise FuelWorkerError("group_commit_size must be >= 1")
+    if options.throttle is not None and not isinstance(options.throttle, HostThrottleConfig):
+        raise FuelWorkerError("throttle must be a HostThrottleConfig or None")
+    if options.cooldown is not None:
+        if not isinstance(options.cooldown, FuelCooldownConfig):
+            raise FuelWorkerError("cooldown must be a FuelCooldownConfig or None")
+        if not isinstance(options.cooldown.hidden_streak_threshold, int) or options.cooldown.hidden_streak_threshold < 1:
+            raise FuelWorkerError("cooldown.hidden_streak_threshold must be an int >= 1")
+        if not isinstance(options.cooldown.cooldown_days, (int, float)) or options.cooldown.cooldown_days <= 0:
+            raise FuelWorkerError("cooldown.cooldown_days must be > 0")
+    if not isinstance(options.coalesce_observations, bool):
+        raise FuelWorkerError("coalesce_observations must be a bool")
+    if not isinstance(options.lease_seconds, int) or options.lease_seconds < 1:
+        raise FuelWorkerError("lease_seconds must be an int >= 1")
+    if options.dockwa_cache_dir is not None:
+        if not isinstance(options.dockwa_cache_dir, str) or not options.dockwa_cache_dir.strip():
+            raise FuelWorkerError("dockwa_cache_dir must be a non-empty string or None")
+    if not isinstance(options.stage_timings, bool):
+        raise FuelWorkerError("stage_timings must be a bool")
+    if options.timing_trace_path is not None:
+        if not isinstance(options.timing_trace_path, str) or not options.timing_trace_path.strip():
+            raise FuelWorkerError("timing_trace_path must be a non-empty string or None")
+    if options.budget is not None and not isinstance(options.budget, HostBudgetConfig):
+        raise FuelWorkerError("budget must be a HostBudgetConfig or None")
+    if options.hedge_delay_seconds is not None:
+        if not isinstance(options.hedge_delay_seconds, (int, float)) or isinstance(options.hedge_delay_seconds, bool):
+            raise FuelWorkerError("hedge_delay_seconds must be a number or None")
+        if options.hedge_delay_seconds < 0:
+            raise FuelWorkerError("hedge_delay_seconds must be >= 0")
+    if options.retry is not None and not isinstance(options.retry, SeedRetryConfig):
+        raise FuelWorkerError("retry must be a SeedRetryConfig or None")
+
+
+def _build_circuit_open_output(seed: dict[str, Any], blocked_reason: str) -> dict[str, Any]:
+    marina_uid = _as_non_empty_string(seed.get("marina_uid"), "marina_uid")
+    fetched_at_utc = _utc_now_iso()
+
+    output_payload: dict[str, Any] = {
+        "marina_uid": marina_uid,
+        "outcome_state": "fetch_blocked",
+        "reason_tag": "host_circuit_open",
+        "diesel_price": None,
+        "gasoline_price": None,
+        "fuel_dock": None,
+        "last_updated": None,
+        "source_url": _choose_source_url(seed),
+        "source_text": None,
+        "provenance": {"blocked_reason": {"source": "host_circuit_breaker", "seen_at": fetched_at_utc}},
+        "fetched_at_utc": fetched_at_utc,
+        "blocked_reason": blocked_reason,
+    }
+
+    validate_extractor_output(output_payload)
+    return output_payload
+
+
+def _hedge_source_url(seed: dict[str, Any]) -> str | None:
+    """Start URL for a hedged extract_fuel: the website, else a marinas.com detail page.
+
+    Dockwa is never a hedge source (it is what is being hedged), and neither is a
+    marinas.com /map/ URL, which _choose_source_url does not crawl either.
+    """
+    website_url = seed.get("website_url")
+    if isinstance(website_url, str) and website_url.strip():
+        return website_url.strip()
+
+    marinas_url = seed.get("marinas_url")
+    if isinstance(marinas_url, str) and marinas_url.strip():
+        normalized_marinas_url = marinas_url.strip()
+        if not normalized_marinas_url.lower().startswith("https://marinas.com/map/"):
+            return normalized_marinas_url
+    return None
+
+
+def _has_hedge_sources(seed: dict[str, Any]) -> bool:
+    dockwa_url = seed.get("dockwa_url")
+    if not isinstance(dockwa_url, str) or not dockwa_url.strip():
+        return False
+    return _hedge_source_url(seed) is not None
+
+
+def _timed_call(function: Any, *args: Any) -> tuple[Any, Exception | None, float]:
+    started = time.perf_counter()
+    try:
+        return function(*args), None, time.perf_counter() - started
+    except Exception as exc:
+        return None, exc, time.perf_counter() - started
+
+
+def _charge_stage(timer: SeedTimer | NullSeedTimer, name: str, seconds: float) -> None:
+    if isinstance(timer, SeedTimer):
+        timer.add(name, seconds)
+
+
+def _fetch_hedged(prepared: _PreparedSeed, options: FuelWorkerOptions) -> _SeedFetchResult | None:
+    """Race Dockwa against extract_fuel once Dockwa has been silent for the hedge delay.
+
+    Returns None when Dockwa answered within the delay without a price, so the caller
+    continues with the ordinary sequential extract_fuel. Otherwise a Dockwa price always
+    wins; an extract_fuel result wins early only with a public price, and is the fallback
+    once Dockwa has come back empty. The losing call is cancelled if it has not started;
+    a call already in flight cannot be interrupted, so it finishes on its own thread
+    within its timeout and its result is discarded.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    seed = prepared.seed
+    timer = prepared.timer
+    # The hedge goes to another host, so it also honours that host's throttle deadline.
+    hedge_at = time.monotonic() + options.hedge_delay_seconds
+    if prepared.hedge_decision is not None:
+        hedge_at = max(hedge_at, prepared.hedge_decision.not_before)
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fuel-hedge")
+    try:
+        dockwa_future = executor.submit(_timed_call, _try_dockwa_extraction, seed, 45, options.dockwa_cache_dir)
+        wait([dockwa_future], timeout=max(0.0, hedge_at - time.monotonic()))
+        if dockwa_future.done():
+            dockwa_result, _, dockwa_seconds = dockwa_future.result()
+            _charge_stage(timer, "dockwa_fetch", dockwa_seconds)
+            if dockwa_result is None:
+                return None
+            with timer.stage("build_payload"):
+                output_payload = _build_output_from_dockwa(seed, dockwa_result)
+            return _SeedFetchResult(seed=seed, host=prepared.host, output_payload=output_payload, timer=timer)
+
+        request = _to_extract_request(seed, prepared.hedge_budget, prepared.hedge_url)
+        website_future = executor.submit(_timed_call, _extract_fuel, request)
+        dockwa_finished = False
+        website_result: _SeedFetchResult | None = None
+        while True:
+            # Dockwa is checked first so it wins whenever both have answered.
+            if not dockwa_finished and dockwa_future.done():
+                dockwa_finished = True
+                dockwa_result, _, dockwa_seconds = dockwa_future.result()
+                _charge_stage(timer, "dockwa_fetch", dockwa_seconds)
+                if dockwa_result is not None:
+                    website_future.cancel()
+                    with timer.stage("build_payload"):
+                        output_payload = _build_output_from_dockwa(seed, dockwa_result)
+                    return _SeedFetchResult(
+                        seed=seed,
+                        host=prepared.host,
+                        output_payload=output_payload,
+                        timer=timer,
+                        hedge_winner="dockwa",
+                    )
+
+            if website_result is None and website_future.done():
+                response, error, extract_seconds = website_future.result()
+                _charge_stage(timer, "extract_fuel", extract_seconds)
+                website_result = _SeedFetchResult(
+                    seed=seed,
+                    host=prepared.hedge_host,
+                    response=response,
+                    error=error,
+                    timer=timer,
+                    budget=prepared.hedge_budget,
+                    extract_seconds=extract_seconds,
+                    hedge_winner="website",
+                    start_url=prepared.hedge_url,
+                )
+                if error is None:
+                    try:
+                        with timer.stage("build_payload"):
+                            website_result.output_payload = _build_output_payload(seed, response)
+                    except Exception as exc:
+                        website_result.error = exc
+
+            if website_result is not None:
+                payload = website_result.output_payload
+                has_price = payload is not None and payload.get("outcome_state") == "has_public_price"
+                if dockwa_finished or has_price:
+                    dockwa_future.cancel()
+                    return website_result
+
+            wait(
+                [future for future in (dockwa_future, website_future) if not future.done()],
+                return_when=FIRST_COMPLETED,
+            )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _fetch_seed_outcome(prepared: _PreparedSeed, options: FuelWorkerOptions) -> _SeedFetchResult:
+    """Run the network-bound part of a seed (Dockwa, then website) without touching SQLite.
+
+    With options.hedge_delay_seconds the two sources may overlap; see _fetch_hedged.
+
+    Safe to call from a worker thread; any failure is captured on the result so the
+    caller can record it on the connection-owning thread. A seed whose host circuit is
+    open never touches the network and is reported with the cached blocked_reason.
+    """
+    seed = prepared.seed
+    host = prepared.host
+    decision = prepared.decision
+    timer = prepared.timer
+    if decision.fail_fast_reason is not None:
+        try:
+            with timer.stage("build_payload"):
+                output_payload = _build_circuit_open_output(seed, decision.fail_fast_reason)
+        except Exception as exc:
+            return _SeedFetchResult(seed=seed, host=host, error=exc, timer=timer, circuit_open=True)
+        return _SeedFetchResult(
+            seed=seed,
+            host=host,
+            output_payload=output_payload,
+            timer=timer,
+            circuit_open=True,
+        )
+
+    # The deadline was fixed when the slot was reserved; time spent queued for a pool
+    # thread already counts toward it.
+    wait_seconds = decision.not_before - time.monotonic()
+    if wait_seconds > 0:
+        time.sleep(wait_seconds)
+
+    extract_started: float | None = None
+    extract_seconds: float | None = None
+    try:
+        if options.hedge_delay_seconds is not None and prepared.hedge_url is not None:
+            hedged_result = _fetch_hedged(prepared, options)
+            if hedged_result is not None:
+                return hedged_result
+        else:
+            with timer.stage("dockwa_fetch"):
+                dockwa_result = _try_dockwa_extraction(seed, 45, options.dockwa_cache_dir)
+            if dockwa_result is not None:
+                with timer.stage("build_payload"):
+                    output_payload = _build_output_from_dockwa(seed, dockwa_result)
+                return _SeedFetchResult(seed=seed, host=host, output_payload=output_payload, timer=timer)
+
+        with timer.stage("extract_fuel"):
+            request = _to_extract_request(seed, prepared.budget)
+            extract_started = time.perf_counter()
+            response = _extract_fuel(request)
+            extract_seconds = time.perf_counter() - extract_started
+        with timer.stage("build_payload"):
+            output_payload = _build_output_payload(seed, response)
+        return _SeedFetchResult(
+            seed=seed,
+            host=host,
+            output_payload=output_payload,
+            response=response,
+            timer=timer,
+            budget=prepared.budget,
+            extract_seconds=extract_seconds,
+        )
+    except Exception as exc:
+        if extract_seconds is None and extract_started is not None:
+            extract_seconds = time.perf_counter() - extract_started
+        return _SeedFetchResult(
+            seed=seed,
+            host=host,
+            error=exc,
+            timer=timer,
+            budget=prepared.budget,
+            extract_seconds=extract_seconds,
+        )
+
+
+def _pages_to_first_hit(
+    seed: dict[str, Any],
+    output_payload: dict[str, Any],
+    budget: FetchBudget | None,
+    start_url: str | None = None,
+) -> int | None:
+    """Pages extract_fuel needed before finding fuel evidence, or None when it found none.
+
+    start_url is where the crawl began, _choose_source_url(seed) unless it was a hedge.
+
+    extract_fuel does not report its crawl path, so a hit on the start URL counts as one
+    page and a hit anywhere else as the whole page budget used. Budgets therefore only
+    shrink for hosts that answer on their landing page.
+    """
+    if output_payload.get("outcome_state") not in ("has_public_price", "fuel_available_price_hidden"):
+        return None
+    if start_url is None:
+        start_url = _choose_source_url(seed)
+    hit_url = output_payload.get("source_url")
+    if isinstance(hit_url, str) and hit_url.strip().rstrip("/") == start_url.rstrip("/"):
+        return 1
+    if budget is None:
+        return None
+    return budget.max_pages
+
+
+def _seed_error_class(exc: Exception, transport_reason: str | None, raised_by_fetch: bool) -> str:
+    """Error class recorded on the seed; SeedRetryConfig keys its backoff on it."""
+    if transport_reason is not None:
+        return transport_reason
+    if isinstance(exc, ContractValidationError):
+        return "contract_violation"
+    if isinstance(exc, sqlite3.Error):
+        return "database_error"
+    if raised_by_fetch:
+        return "fetch_error"
+    return "worker_error"
+
+
+def _seed_host(seed: dict[str, Any]) -> str | None:
+    # Both the Dockwa snapshot and extract_fuel start from _choose_source_url's host.
+    try:
+        return host_for_url(_choose_source_url(seed))
+    except FuelWorkerError:
+        return None
+
+
+def _reserve_seed(
+    connection: sqlite3.Connection,
+    seed: dict[str, Any],
+    throttle: HostThrottleConfig | None,
+) -> tuple[str | None, ThrottleDecision]:
+    host = _seed_host(seed)
+    if throttle is None or host is None:
+        return host, ThrottleDecision(allowed=True)
+    return host, reserve_host_slot(connection, host, throttle)
+
+
+def _finalize_seed_success(
+    connection: sqlite3.Connection,
+    seed_id: int,
+    marina_uid: str,
+    source_marinas_id: str,
+    output_payload: dict[str, Any],
+    response: ExtractResponse | None,
+    lease_owner: str,
+    coalesce_observations: bool = False,
+    cooldown: FuelCooldownConfig | None = None,
+    timer: SeedTimer | NullSeedTimer = NULL_SEED_TIMER,
+    sync_events: SyncEventBuffer | None = None,
+) -> int:
+    """Write fuel_log, 'done' status and price-change event without committing.
+
+    With coalesce_observations, an outcome whose extraction_hash and price_source match
+    the marina's latest fuel_log extends that row's run instead of inserting a copy. With
+    cooldown, the marina's price-hidden streak is updated and the outcome that starts a
+    cooldown is logged as price_source=not_published_online; since that changes the
+    price_source, it always gets a row of its own. The event goes last so that, when
+    it is buffered in sync_events, nothing after it can still roll the seed back.
+    """
+    if cooldown is not None:
+        cooldown_until_utc = record_fuel_outcome(
+            connection,
+            marina_uid,
+            output_payload["outcome_state"],
+            output_payload["fetched_at_utc"],
+            cooldown,
+        )
+        if cooldown_until_utc is not None:
+            output_payload = {**output_payload, "price_source": "not_published_online"}
+
+    previous = _get_previous_fuel_log(connection, marina_uid)
+
+    if (
+        coalesce_observations
+        and previous is not None
+        and previous.get("extraction_hash") == _extraction_hash(output_payload)
+        and previous.get("price_source") == _logged_price_source(output_payload)
+    ):
+        fuel_log_id = previous["fuel_log_id"]
+        confirm_fuel_log_observation(connection, fuel_log_id, output_payload["fetched_at_utc"])
+        mark_seed_status(connection, seed_id, "done", commit=False, lease_owner=lease_owner)
+        return fuel_log_id
+
+    fuel_log_id = _write_fuel_log(connection, output_payload, response, commit=False)
+    mark_seed_status(connection, seed_id, "done", commit=False, lease_owner=lease_owner)
+    with timer.stage("sync_event"):
+        _write_fuel_price_event(
+            connection,
+            marina_uid,
+            source_marinas_id,
+            output_payload,
+            fuel_log_id,
+            previous,
+            commit=False,
+            sync_events=sync_events,
+        )
+    return fuel_log_id
+
+
+def _iter_fetch_results(
+    claimed: list[_PreparedSeed],
+    options: FuelWorkerOptions,
+    on_idle: Callable[[], None] | None = None,
+    idle_seconds: float | None = None,
+) -> Iterator[_SeedFetchResult]:
+    """Yield fetch results in completion order; on_idle runs every idle_seconds without one."""
+    if options.max_workers == 1 or len(claimed) <= 1:
+        for prepared in claimed:
+            yield _fetch_seed_outcome(prepared, options)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pool_size = min(options.max_workers, len(claimed))
+    # Seeds go to the pool in throttle-deadline order (stable, so claim priority breaks
+    # ties): a thread never sits out a host's wait while a seed that may go now queues.
+    dispatch_order = sorted(claimed, key=lambda prepared: prepared.decision.not_before)
+    with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="fuel-seed") as executor:
+        pending = {
+            executor.submit(_fetch_seed_outcome, prepared, options)
+            for prepared in dispatch_order
+        }
+        while pending:
+            done, pending = wait(pending, timeout=idle_seconds, return_when=FIRST_COMPLETED)
+            if not done and on_idle is not None:
+                on_idle()
+            for future in done:
+                yield future.result()
+
+
+def process_pending_seeds(
+    connection: sqlite3.Connection,
+    batch_size: int,
+    options: FuelWorkerOptions | None = None,
+    on_seed_outcome: SeedOutcomeCallback | None = None,
+) -> dict[str, Any]:
+    """Process up to batch_size pending seeds.
+
+    With options.max_workers > 1 the Dockwa and extract_fuel calls for different seeds
+    overlap on a bounded thread pool, while every SQLite write stays on this thread and
+    this connection. Results are persisted in completion order.
+
+    Each finished seed's fuel_log row, price-change sync event and final queue status
+    are committed atomically; group_commit_size batches several seeds per commit. Fetched
+    seeds wait in memory until their group is full, and only then is the write
+    transaction opened (BEGIN IMMEDIATE), so no lock is held across a fetch.
+
+    Seeds are claimed atomically under a lease, so several workers can drain the same
+    queue; expired leases from crashed workers are returned to 'pending' first. Leases
+    still held are renewed every third of options.lease_seconds while fetches are in
+    flight. A seed whose lease was lost anyway (reaped and taken by another worker) is
+    skipped without writing its outcome and listed in lost_lease_seed_ids. If the run
+    aborts, seeds not yet written are released back to 'pending'. Claimed
+    seeds that fail the seed contract are marked 'failed'. With options.retry, other
+    failed seeds go back to 'pending' with a backoff (listed in retry_scheduled_seed_ids)
+    until they run out of attempts.
+
+    Seeds whose host is cooling down after a blocked fetch, or whose host token bucket is
+    too far in debt, are returned to 'pending' and reported as deferred rather than failed;
+    they are not claimed again until the cooldown ends or the bucket has recovered.
+
+    With options.stage_timings the result gains "stage_timings": per-stage p50/p95/max
+    measured with a monotonic clock. When it is off every stage is a shared no-op.
+
+    on_seed_outcome is called once per seed with its seed_id, marina_uid, status
+    ('done', 'failed', 'deferred' or 'lease_lost'), outcome_state, reason_tag, fuel_log_id, error,
+    elapsed_ms and stages_ms. It is called only once the seed's writes are committed, so
+    with group_commit_size > 1 outcomes arrive in groups.
+    """
     if connection is None:
         raise FuelWorkerError("connection is required")
     if not isinstance(batch_size, int):
         raise FuelWorkerError("batch_size must be an int")
     if batch_size < 1:
         raise FuelWorkerError("batch_size must be >= 1")
+    if options is None:
+        options = FuelWorkerOptions()
+    _validate_options(options)
+
+    throttle = options.throttle
+    if throttle is not None:
+        ensure_host_throttle_schema(connection)
+    if options.coalesce_observations:
+        ensure_fuel_log_coalescing_schema(connection)
+    if options.cooldown is not None:
+        ensure_fuel_cooldown_schema(connection)
+    if options.budget is not None:
+        ensure_host_budget_schema(connection)
+    ensure_latest_state_schema(connection)
+    ensure_change_log_schema(connection)
+    ensure_seed_lease_schema(connection)
+    ensure_seed_retry_schema(connection)
+    reap_expired_leases(connection, orphan_grace_seconds=options.lease_seconds)
+
+    lease_owner = new_lease_owner()
+
+    timings: StageTimings | None = None
+    if options.stage_timings or options.timing_trace_path is not None:
+        timings = StageTimings(options.timing_trace_path)
+    pending_outcomes: list[dict[str, Any]] = []
+
+    def _new_timer() -> SeedTimer | NullSeedTimer:
+        if timings is None and on_seed_outcome is None:
+            return NULL_SEED_TIMER
+        return SeedTimer()
+
+    def _record_timing(
+        timer: SeedTimer | NullSeedTimer,
+        seed: dict[str, Any],
+        outcome: str,
+        fuel_log_id: int | None = None,
+        output_payload: dict[str, Any] | None = None,
+        error: Exception | None = None,
+        error_class: str | None = None,
+        retry_scheduled: bool = False,
+    ) -> None:
+        if not isinstance(timer, SeedTimer):
+            return
+        if timings is not None:
+            timings.record(timer, seed, outcome)
+        if on_seed_outcome is not None:
+            pending_outcomes.append(
+                {
+                    "event": "seed",
+                    "seed_id": seed.get("seed_id"),
+                    "marina_uid": seed.get("marina_uid"),
+                    "status": "retry_scheduled" if retry_scheduled else ("done" if outcome == "success" else outcome),
+                    "outcome_state": output_payload.get("outcome_state") if output_payload else None,
+                    "reason_tag": output_payload.get("reason_tag") if output_payload else None,
+                    "fuel_log_id": fuel_log_id,
+                    "error": str(error) if error is not None else None,
+                    "error_class": error_class,
+                    "elapsed_ms": round((time.perf_counter() - timer.started_at) * 1000.0, 3),
+                    "stages_ms": {
+                        stage_name: round(seconds * 1000.0, 3) for stage_name, seconds in timer.durations.items()
+                    },
+                }
+            )
 
-    pending_seeds = read_pending_seeds(connection, batch_size)
+    def _emit_committed_outcomes() -> None:
+        if on_seed_outcome is None or connection.in_transaction:
+            return
+        while pending_outcomes:
+            on_seed_outcome(pending_outcomes.pop(0))
 
+    claimed_count = 0
     processed_count = 0
     success_count = 0
     failed_count = 0
     fuel_log_ids: list[int] = []
     failed_seed_ids: list[int] = []
+    deferred_seed_ids: list[int] = []
+    deferred_retry_at: dict[int, str | None] = {}
+    retry_seed_ids: list[int] = []
+    lost_lease_seed_ids: list[int] = []
+    hedge_wins = {"dockwa": 0, "website": 0}
+
+    # Seeds this run holds a lease on and has not written an outcome for yet.
+    leased_seed_ids: set[int] = set()
+    lease_renew_seconds = options.lease_seconds / 3.0
+    leases_renewed_at = time.monotonic()
+
+    def _renew_leases_if_due() -> None:
+        nonlocal leases_renewed_at
+        if time.monotonic() - leases_renewed_at < lease_renew_seconds:
+            return
+        renew_seed_leases(connection, sorted(leased_seed_ids), lease_owner, options.lease_seconds)
+        leases_renewed_at = time.monotonic()
+
+    def _prepare_claimed(
+        seed: dict[str, Any], timer: SeedTimer | NullSeedTimer
+    ) -> _PreparedSeed | None:
+        """Validate, throttle and budget a claimed seed; None means it will not be fetched now."""
+        nonlocal processed_count, failed_count
+        seed_id = seed["seed_id"]
+        with timer.stage("claim"):
+            try:
+                validate_seed_payload(seed)
+            except ContractValidationError as exc:
+                processed_count += 1
+                failed_count += 1
+                failed_seed_ids.append(seed_id)
+                leased_seed_ids.discard(seed_id)
+                if options.retry is not None:
+                    record_seed_failure(
+                        connection, seed_id, "contract_violation", options.retry, lease_owner=lease_owner
+                    )
+                else:
+                    mark_seed_status(connection, seed_id, "failed", lease_owner=lease_owner)
+                contract_error = exc
+                decision = None
+            else:
+                host, decision = _reserve_seed(connection, seed, throttle)
+                budget = None
+                if options.budget is not None and decision.allowed and decision.fail_fast_reason is None:
+                    budget = read_fetch_budget(connection, host, options.budget)
+
+        if decision is None:
+            _record_timing(timer, seed, "failed", error=contract_error, error_class="contract_violation")
+            _emit_committed_outcomes()
+            return None
+        if not decision.allowed:
+            # Keep the lease until the run ends so the seed is not claimed again, then
+            # release it with a next attempt time past the host's cooldown or bucket debt.
+            deferred_seed_ids.append(seed_id)
+            deferred_retry_at[seed_id] = decision.retry_at_utc
+            _record_timing(timer, seed, "deferred")
+            return None
+        prepared = _PreparedSeed(seed=seed, host=host, decision=decision, budget=budget, timer=timer)
+        hedging = options.hedge_delay_seconds is not None and decision.fail_fast_reason is None
+        if hedging and _has_hedge_sources(seed):
+            _prepare_hedge(prepared)
+        return prepared
+
+    def _prepare_hedge(prepared: _PreparedSeed) -> None:
+        """Reserve the hedge host's own slot and budget; no hedge if that host must wait."""
+        hedge_url = _hedge_source_url(prepared.seed)
+        hedge_host = host_for_url(hedge_url)
+        hedge_decision = ThrottleDecision(allowed=True)
+        if throttle is not None and hedge_host is not None:
+            # Reserved up front because only this thread writes SQLite; a hedge that
+            # never fires costs its host one token.
+            hedge_decision = reserve_host_slot(connection, hedge_host, throttle)
+            if not hedge_decision.allowed or hedge_decision.fail_fast_reason is not None:
+                return
+        prepared.hedge_url = hedge_url
+        prepared.hedge_host = hedge_host
+        prepared.hedge_decision = hedge_decision
+        if options.budget is not None and hedge_host is not None:
+            prepared.hedge_budget = read_fetch_budget(connection, hedge_host, options.budget)
+
+    if options.max_workers == 1 and options.group_commit_size == 1:
+        # Claim one seed at a time so a seed is only 'processing' while it is being worked.
+        def _claimed_results() -> Iterator[_SeedFetchResult]:
+            nonlocal claimed_count
+            while claimed_count < batch_size:
+                _renew_leases_if_due()
+                timer = _new_timer()
+                with timer.stage("claim"):
+                    claimed_seeds = claim_pending_seeds(connection, 1, lease_owner, options.lease_seconds)
+                if not claimed_seeds:
+                    return
+                seed = claimed_seeds[0]
+                claimed_count += 1
+                leased_seed_ids.add(seed["seed_id"])
+                prepared = _prepare_claimed(seed, timer)
+                # Throttle and budget reads write; commit them so no lock is held during the fetch.
+                connection.commit()
+                if prepared is None:
+                    continue
+                yield _fetch_seed_outcome(prepared, options)
+
+        fetch_results = _claimed_results()
+    else:
+        # One atomic claim takes the whole batch before any network work starts.
+        claim_started = time.perf_counter()
+        claimed_seeds = claim_pending_seeds(connection, batch_size, lease_owner, options.lease_seconds)
+        claimed_count = len(claimed_seeds)
+        leased_seed_ids.update(seed["seed_id"] for seed in claimed_seeds)
+        claim_share_seconds = (time.perf_counter() - claim_started) / max(claimed_count, 1)
+
+        claimed: list[_PreparedSeed] = []
+        for seed in claimed_seeds:
+            timer = _new_timer()
+            if isinstance(timer, SeedTimer):
+                timer.add("claim", claim_share_seconds)
+            prepared = _prepare_claimed(seed, timer)
+            if prepared is None:
+                continue
+            claimed.append(prepared)
+        connection.commit()
+        fetch_results = _iter_fetch_results(
+            claimed, options, on_idle=_renew_leases_if_due, idle_seconds=lease_renew_seconds
+        )
 
-    for seed in pending_seeds:
-        validate_seed_payload(seed)
+    # Price-change and fetch-blocked events are buffered per seed and inserted with one
+    # executemany right before each group commit.
+    sync_events = SyncEventBuffer(connection, flush_size=options.group_commit_size)
 
-        seed_id = seed.get("seed_id")
-        if not isinstance(seed_id, int):
-            raise FuelWorkerError("seed_id must be present and int")
+    def _flush_sync_events() -> None:
+        try:
+            sync_events.flush()
+        except Exception:
+            # As with direct writes, a failed sync event never fails the seeds it belongs to.
+            pass
 
-        mark_seed_status(connection, seed_id, "processing")
-        processed_count += 1
+    unit_of_work = UnitOfWork(connection, group_size=options.group_commit_size, before_commit=_flush_sync_events)
+
+    def _write_result(fetch_result: _SeedFetchResult) -> None:
+        """Write one fetched seed's outcome as a unit of the open group transaction."""
+        nonlocal processed_count, success_count, failed_count
+        seed = fetch_result.seed
+        seed_id = seed["seed_id"]
+        timer = fetch_result.timer
 
         marina_uid = _as_non_empty_string(seed.get("marina_uid"), "marina_uid")
         source_marinas_id = seed.get("source_marinas_id") or ""
 
         try:
-            dockwa_result = _try_dockwa_extraction(seed, 45)
-            if dockwa_result is not None:
-                output_payload = _build_output_from_dockwa(seed, dockwa_result)
-                fuel_log_id = _write_fuel_log(connection, output_payload, None)
-                _write_fuel_price_event(connection, marina_uid, source_marinas_id, output_payload, fuel_log_id)
-                mark_seed_status(connection, seed_id, "done")
-                success_count += 1
-                fuel_log_ids.append(fuel_log_id)
-                continue
-
-            request = _to_extract_request(seed)
-            response = extract_fuel(request)
-            output_payload = _build_output_payload(seed, response)
-            fuel_log_id = _write_fuel_log(connection, output_payload, response)
-            _write_fuel_price_event(connection, marina_uid, source_marinas_id, output_payload, fuel_log_id)
-            mark_seed_status(connection, seed_id, "done")
+            with timer.stage("db_write"), unit_of_work.unit():
+                if fetch_result.error is not None:
+                    raise fetch_result.error
+
+                output_payload = fetch_result.output_payload
+                if output_payload is None:
+                    raise FuelWorkerError("fetch produced no output payload")
+
+                # Fail-fast results replay the cached reason; counting them would keep
+                # pushing the cooldown out without the host ever being tried.
+                if throttle is not None and fetch_result.host is not None and not fetch_result.circuit_open:
+                    record_host_outcome(
+                        connection,
+                        fetch_result.host,
+                        output_payload.get("blocked_reason"),
+                        throttle,
+                    )
+                if (
+                    options.budget is not None
+                    and fetch_result.host is not None
+                    and fetch_result.extract_seconds is not None
+                ):
+                    record_fetch_sample(
+                        connection,
+                        fetch_result.host,
+                        fetch_result.extract_seconds,
+                        _pages_to_first_hit(
+                            seed, output_payload, fetch_result.budget, fetch_result.start_url
+                        ),
+                        options.budget,
+                    )
+
+                fuel_log_id = _finalize_seed_success(
+                    connection,
+                    seed_id,
+                    marina_uid,
+                    source_marinas_id,
+                    output_payload,
+                    fetch_result.response,
+                    lease_owner,
+                    options.coalesce_observations,
+                    options.cooldown,
+                    timer,
+                    sync_events,
+                )
+            processed_count += 1
             success_count += 1
+            leased_seed_ids.discard(seed_id)
             fuel_log_ids.append(fuel_log_id)
+            _record_timing(timer, seed, "success", fuel_log_id, output_payload)
         except Exception as exc:
-            mark_seed_status(connection, seed_id, "failed")
+            if not seed_lease_held(connection, seed_id, lease_owner):
+                # Another worker owns the seed now (its lease was reaped); whatever this
+                # run saw is dropped rather than written over the new owner's attempt.
+                leased_seed_ids.discard(seed_id)
+                lost_lease_seed_ids.append(seed_id)
+                _record_timing(timer, seed, "lease_lost", error=exc)
+                _emit_committed_outcomes()
+                return
+            try:
+                with timer.stage("db_write"), unit_of_work.unit():
+                    # DNS/TLS/timeout errors raised before any response still feed the breaker.
+                    transport_reason = classify_fetch_exception(exc) if fetch_result.error is exc else None
+                    if throttle is not None and fetch_result.host is not None and transport_reason is not None:
+                        record_host_outcome(connection, fetch_result.host, transport_reason, throttle)
+                    # A timed-out fetch is a (censored) latency sample: it lets slow hosts earn more time.
+                    if (
+                        options.budget is not None
+                        and fetch_result.host is not None
+                        and fetch_result.extract_seconds is not None
+                        and transport_reason == "timeout"
+                    ):
+                        record_fetch_sample(
+                            connection, fetch_result.host, fetch_result.extract_seconds, None, options.budget
+                        )
+                    error_class = _seed_error_class(exc, transport_reason, fetch_result.error is exc)
+                    queue_status = "failed"
+                    if options.retry is not None:
+                        queue_status = record_seed_failure(
+                            connection,
+                            seed_id,
+                            error_class,
+                            options.retry,
+                            commit=False,
+                            lease_owner=lease_owner,
+                        )
+                    else:
+                        mark_seed_status(connection, seed_id, "failed", commit=False, lease_owner=lease_owner)
+                    with timer.stage("sync_event"):
+                        _write_fetch_blocked_event(
+                            connection, marina_uid, source_marinas_id, str(exc), sync_events=sync_events
+                        )
+            except SeedConsumerError:
+                if seed_lease_held(connection, seed_id, lease_owner):
+                    raise
+                # The lease went between the check above and the write.
+                leased_seed_ids.discard(seed_id)
+                lost_lease_seed_ids.append(seed_id)
+                _record_timing(timer, seed, "lease_lost", error=exc)
+                _emit_committed_outcomes()
+                return
+            processed_count += 1
             failed_count += 1
+            leased_seed_ids.discard(seed_id)
             failed_seed_ids.append(seed_id)
-            _write_fetch_blocked_event(connection, marina_uid, source_marinas_id, str(exc))
+            if queue_status == "pending":
+                retry_seed_ids.append(seed_id)
+            _record_timing(
+                timer,
+                seed,
+                "failed",
+                error=exc,
+                error_class=error_class,
+                retry_scheduled=queue_status == "pending",
+            )
+        _emit_committed_outcomes()
+
+    def _write_group(group: list[_SeedFetchResult]) -> None:
+        # The write lock is taken only once the whole group has been fetched, so no
+        # transaction stays open while later fetches wait on the network.
+        connection.execute("BEGIN IMMEDIATE")
+        for fetch_result in group:
+            _write_result(fetch_result)
+        unit_of_work.flush()
+        group.clear()
+        _emit_committed_outcomes()
+
+    finished: list[_SeedFetchResult] = []
+    try:
+        with unit_of_work:
+            for fetch_result in fetch_results:
+                _renew_leases_if_due()
+                if fetch_result.hedge_winner is not None:
+                    hedge_wins[fetch_result.hedge_winner] += 1
+                finished.append(fetch_result)
+                if len(finished) >= options.group_commit_size:
+                    _write_group(finished)
+            if finished:
+                _write_group(finished)
+    finally:
+        # Deferred seeds, plus on an aborted run every seed not written yet, go back to
+        # 'pending' instead of waiting out their lease.
+        if connection.in_transaction:
+            connection.rollback()
+        release_seed_claims(
+            connection,
+            sorted(leased_seed_ids),
+            lease_owner,
+            commit=False,
+            next_attempt_at_utc=deferred_retry_at,
+        )
+        # Throttle state is written without its own commit; make sure the tail of the run lands.
+        connection.commit()
+    _emit_committed_outcomes()
 
-    return {
-        "pending_count": len(pending_seeds),
+    result: dict[str, Any] = {
+        "pending_count": claimed_count,
         "processed_count": processed_count,
         "success_count": success_count,
         "failed_count": failed_count,
+        "deferred_count": len(deferred_seed_ids),
         "fuel_log_ids": fuel_log_ids,
         "failed_seed_ids": failed_seed_ids,
+        "deferred_seed_ids": deferred_seed_ids,
+        "retry_scheduled_seed_ids": retry_seed_ids,
+        "lost_lease_seed_ids": lost_lease_seed_ids,
     }
-
-
-def process_pending_seeds_in_db(db_path: str, batch_size: int) -> dict[str, Any]:
+    if options.hedge_delay_seconds is not None:
+        result["hedged_count"] = hedge_wins["dockwa"] + hedge_wins["website"]
+        result["hedge_website_win_count"] = hedge_wins["website"]
+    if timings is not None:
+        timings.close()
+        result["stage_timings"] = timings.summary()
+    return result
+
+
+def process_pending_seeds_in_db(
+    db_path: str,
+    batch_size: int,
+    options: FuelWorkerOptions | None = None,
+    on_seed_outcome: SeedOutcomeCallback | None = None,
+) -> dict[str, Any]:
     if not isinstance(db_path, str) or not db_path.strip():
         raise FuelWorkerError("db_path must be a non-empty string")
     if not isinstance(batch_size, int):
@@ -588,6 +1579,6 @@ def process_pending_seeds_in_db(db_path: str, batch_size: int) -> dict[str, Any]
 
     connection = sqlite3.connect(str(db_path_obj))
     try:
-        return process_pending_seeds(connection, batch_size)
+        return process_pending_seeds(connection, batch_size, options, on_seed_outcome)
     finally:
         connection.close()
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+
+class HostBudgetError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class HostBudgetConfig:
+    """Per-host extract_fuel budgets learned from the last `window` fetches of that host.
+
+    timeout = p95 latency * timeout_safety_factor, clamped to the floor/ceiling.
+    max_pages = p95 pages-to-first-hit, clamped likewise. Hosts with fewer than
+    min_samples observations keep the defaults.
+    """
+
+    default_timeout_seconds: int = 45
+    default_max_pages: int = 8
+    timeout_floor_seconds: int = 15
+    timeout_ceiling_seconds: int = 120
+    timeout_safety_factor: float = 1.5
+    max_pages_floor: int = 3
+    max_pages_ceiling: int = 16
+    min_samples: int = 3
+    window: int = 20
+
+
+@dataclass(frozen=True)
+class FetchBudget:
+    timeout_seconds: int
+    max_pages: int
+    learned: bool = False
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _validate_config(config: HostBudgetConfig) -> None:
+    if not isinstance(config, HostBudgetConfig):
+        raise HostBudgetError("config must be a HostBudgetConfig")
+    if not 0 < config.timeout_floor_seconds <= config.default_timeout_seconds <= config.timeout_ceiling_seconds:
+        raise HostBudgetError("timeout bounds must satisfy 0 < floor <= default <= ceiling")
+    if not 0 < config.max_pages_floor <= config.default_max_pages <= config.max_pages_ceiling:
+        raise HostBudgetError("max_pages bounds must satisfy 0 < floor <= default <= ceiling")
+    if config.timeout_safety_factor < 1.0:
+        raise HostBudgetError("timeout_safety_factor must be >= 1.0")
+    if not isinstance(config.min_samples, int) or config.min_samples < 1:
+        raise HostBudgetError("min_samples must be an int >= 1")
+    if not isinstance(config.window, int) or config.window < config.min_samples:
+        raise HostBudgetError("window must be an int >= min_samples")
+
+
+def ensure_host_budget_schema(connection: sqlite3.Connection) -> None:
+    if connection is None:
+        raise HostBudgetError("connection is required")
+
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS host_fetch_profile (
+            host TEXT PRIMARY KEY,
+            latency_samples_json TEXT NOT NULL,
+            pages_samples_json TEXT NOT NULL,
+            updated_at_utc TEXT NOT NULL,
+            CHECK (json_valid(latency_samples_json)),
+            CHECK (json_valid(pages_samples_json))
+        )
+        """
+    )
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+def _clamp(value: float, floor: int, ceiling: int) -> int:
+    return int(min(ceiling, max(floor, math.ceil(value))))
+
+
+def _read_samples(connection: sqlite3.Connection, host: str) -> tuple[list[float], list[int]]:
+    row = connection.execute(
+        "SELECT latency_samples_json, pages_samples_json FROM host_fetch_profile WHERE host = ?",
+        (host,),
+    ).fetchone()
+    if row is None:
+        return [], []
+    try:
+        latencies = [float(value) for value in json.loads(row[0])]
+        pages = [int(value) for value in json.loads(row[1])]
+    except (TypeError, ValueError) as exc:
+        raise HostBudgetError(f"corrupt host_fetch_profile row for {host}") from exc
+    return latencies, pages
+
+
+def read_fetch_budget(
+    connection: sqlite3.Connection,
+    host: str | None,
+    config: HostBudgetConfig,
+) -> FetchBudget:
+    """Return the timeout and page budget to use for the next extract_fuel call on host."""
+    if connection is None:
+        raise HostBudgetError("connection is required")
+    _validate_config(config)
+
+    default = FetchBudget(timeout_seconds=config.default_timeout_seconds, max_pages=config.default_max_pages)
+    if host is None:
+        return default
+
+    latencies, pages = _read_samples(connection, host)
+    learned = False
+    timeout_seconds = config.default_timeout_seconds
+    max_pages = config.default_max_pages
+    if len(latencies) >= config.min_samples:
+        timeout_seconds = _clamp(
+            _p95(latencies) * config.timeout_safety_factor,
+            config.timeout_floor_seconds,
+            config.timeout_ceiling_seconds,
+        )
+        learned = True
+    if len(pages) >= config.min_samples:
+        max_pages = _clamp(_p95([float(value) for value in pages]), config.max_pages_floor, config.max_pages_ceiling)
+        learned = True
+    return FetchBudget(timeout_seconds=timeout_seconds, max_pages=max_pages, learned=learned)
+
+
+def record_fetch_sample(
+    connection: sqlite3.Connection,
+    host: str,
+    latency_seconds: float,
+    pages_to_first_hit: int | None,
+    config: HostBudgetConfig,
+) -> None:
+    """Append one extract_fuel observation to the host's rolling window. Does not commit.
+
+    pages_to_first_hit is None when the fetch found nothing; only the latency is kept then.
+    """
+    if connection is None:
+        raise HostBudgetError("connection is required")
+    if not isinstance(host, str) or not host.strip():
+        raise HostBudgetError("host must be a non-empty string")
+    if not isinstance(latency_seconds, (int, float)) or latency_seconds < 0:
+        raise HostBudgetError("latency_seconds must be a number >= 0")
+    if pages_to_first_hit is not None and (not isinstance(pages_to_first_hit, int) or pages_to_first_hit < 1):
+        raise HostBudgetError("pages_to_first_hit must be an int >= 1 or None")
+    _validate_config(config)
+
+    latencies, pages = _read_samples(connection, host)
+    latencies = (latencies + [round(float(latency_seconds), 3)])[-config.window :]
+    if pages_to_first_hit is not None:
+        pages = (pages + [pages_to_first_hit])[-config.window :]
+
+    connection.execute(
+        """
+        INSERT INTO host_fetch_profile (host, latency_samples_json, pages_samples_json, updated_at_utc)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(host) DO UPDATE SET
+            latency_samples_json = excluded.latency_samples_json,
+            pages_samples_json = excluded.pages_samples_json,
+            updated_at_utc = excluded.updated_at_utc
+        """,
+        (host, json.dumps(latencies), json.dumps(pages), _utc_now_iso()),
+    )
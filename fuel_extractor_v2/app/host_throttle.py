@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import urlparse
+
+from .schema_upgrade import add_missing_columns
+
+
+class HostThrottleError(Exception):
+    pass
+
+
+# Base cooldown per blocked_reason; doubled for every consecutive failure on the same host.
+_BACKOFF_BASE_SECONDS = {
+    "rate_limited_429": 15 * 60,
+    "timeout": 10 * 60,
+    "dns_failure": 60 * 60,
+    "cloudflare_challenge": 6 * 60 * 60,
+    "access_denied_403": 6 * 60 * 60,
+    "ssl_failure": 6 * 60 * 60,
+    "access_denied_401": 12 * 60 * 60,
+}
+
+# Circuit breaker on top of the backoff: after circuit_failure_threshold consecutive
+# failures the host's circuit opens and its seeds fail fast with the cached
+# blocked_reason instead of being deferred. Once the cooldown ends the circuit goes
+# half-open and exactly one seed is let through as a probe; its outcome closes the
+# circuit or re-opens it with the next backoff step.
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+_CIRCUIT_COLUMNS = (
+    (
+        "circuit_state",
+        "TEXT NOT NULL DEFAULT 'closed' CHECK (circuit_state IN ('closed', 'open', 'half_open'))",
+    ),
+    ("probe_expires_at_utc", "TEXT"),
+)
+
+# Exception text fragments for failures raised before any HTTP response exists.
+_DNS_ERROR_MARKERS = (
+    "name or service not known",
+    "nodename nor servname",
+    "getaddrinfo",
+    "temporary failure in name resolution",
+    "no address associated with hostname",
+)
+_SSL_ERROR_MARKERS = ("certificate_verify_failed", "ssl:", "sslerror", "certificate verify failed")
+_TIMEOUT_ERROR_MARKERS = ("timed out", "timeout")
+
+
+@dataclass(frozen=True)
+class HostThrottleConfig:
+    """Per-host token bucket plus error-class backoff.
+
+    rate_per_second/burst shape the bucket; a request that would have to wait longer
+    than max_wait_seconds for a token is deferred instead of queued.
+    circuit_failure_threshold consecutive failures open the host's circuit; a half-open
+    probe that has not reported back within probe_timeout_seconds may be retried.
+    """
+
+    rate_per_second: float = 1.0
+    burst: float = 5.0
+    max_wait_seconds: float = 60.0
+    max_backoff_seconds: float = 7 * 24 * 60 * 60
+    circuit_failure_threshold: int = 3
+    probe_timeout_seconds: float = 5 * 60
+
+
+@dataclass(frozen=True)
+class ThrottleDecision:
+    """allowed=False defers the seed until retry_at_utc, when the host's cooldown ends or
+    its bucket is back within max_wait_seconds. fail_fast_reason (with allowed=True)
+    means the circuit is open: skip the network and record that blocked_reason straight
+    away. probe marks the single request a half-open circuit lets through.
+
+    not_before is the time.monotonic() deadline the request must wait for. delay_seconds
+    is the same wait relative to the reservation; a caller that runs the request later
+    (e.g. queued on a thread pool) should sleep until not_before, not for delay_seconds.
+    """
+
+    allowed: bool
+    delay_seconds: float = 0.0
+    deferred_reason: str | None = None
+    fail_fast_reason: str | None = None
+    probe: bool = False
+    not_before: float = 0.0
+    retry_at_utc: str | None = None
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _epoch_to_iso(epoch_seconds: float) -> str:
+    return (
+        datetime.fromtimestamp(epoch_seconds, tz=timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+
+
+def _iso_to_epoch(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _validate_config(config: HostThrottleConfig) -> None:
+    if not isinstance(config, HostThrottleConfig):
+        raise HostThrottleError("config must be a HostThrottleConfig")
+    if config.rate_per_second <= 0:
+        raise HostThrottleError("rate_per_second must be > 0")
+    if config.burst < 1:
+        raise HostThrottleError("burst must be >= 1")
+    if config.max_wait_seconds < 0:
+        raise HostThrottleError("max_wait_seconds must be >= 0")
+    if not isinstance(config.circuit_failure_threshold, int) or config.circuit_failure_threshold < 1:
+        raise HostThrottleError("circuit_failure_threshold must be an int >= 1")
+    if config.probe_timeout_seconds <= 0:
+        raise HostThrottleError("probe_timeout_seconds must be > 0")
+
+
+def host_for_url(url: Any) -> str | None:
+    if not isinstance(url, str) or not url.strip():
+        return None
+    hostname = urlparse(url.strip()).hostname
+    if not hostname:
+        return None
+    hostname = hostname.lower()
+    if hostname.startswith("www."):
+        hostname = hostname[4:]
+    return hostname
+
+
+def ensure_host_throttle_schema(connection: sqlite3.Connection) -> None:
+    if connection is None:
+        raise HostThrottleError("connection is required")
+
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS host_throttle_state (
+            host TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            tokens_refilled_at_epoch REAL NOT NULL,
+            consecutive_failures INTEGER NOT NULL DEFAULT 0 CHECK (consecutive_failures >= 0),
+            last_blocked_reason TEXT,
+            cooldown_until_utc TEXT,
+            circuit_state TEXT NOT NULL DEFAULT 'closed' CHECK (circuit_state IN ('closed', 'open', 'half_open')),
+            probe_expires_at_utc TEXT,
+            updated_at_utc TEXT NOT NULL
+        )
+        """
+    )
+    add_missing_columns(connection, "host_throttle_state", _CIRCUIT_COLUMNS)
+
+
+def classify_fetch_exception(exc: BaseException) -> str | None:
+    """Map a transport exception (DNS, TLS, timeout) to a blocked_reason, or None.
+
+    Walks the __cause__/__context__ chain, since HTTP clients usually wrap the
+    socket-level error.
+    """
+    import socket
+    import ssl
+
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, socket.gaierror):
+            return "dns_failure"
+        if isinstance(current, ssl.SSLError):
+            return "ssl_failure"
+        if isinstance(current, (TimeoutError, socket.timeout)):
+            return "timeout"
+
+        message = f"{type(current).__name__}: {current}".lower()
+        if any(marker in message for marker in _DNS_ERROR_MARKERS):
+            return "dns_failure"
+        if any(marker in message for marker in _SSL_ERROR_MARKERS):
+            return "ssl_failure"
+        if any(marker in message for marker in _TIMEOUT_ERROR_MARKERS):
+            return "timeout"
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def _read_state(connection: sqlite3.Connection, host: str) -> tuple[Any, ...] | None:
+    return connection.execute(
+        """
+        SELECT
+            tokens,
+            tokens_refilled_at_epoch,
+            consecutive_failures,
+            last_blocked_reason,
+            cooldown_until_utc,
+            circuit_state,
+            probe_expires_at_utc
+        FROM host_throttle_state
+        WHERE host = ?
+        """,
+        (host,),
+    ).fetchone()
+
+
+def reserve_host_slot(
+    connection: sqlite3.Connection,
+    host: str,
+    config: HostThrottleConfig,
+    now: float | None = None,
+) -> ThrottleDecision:
+    """Take one token for host, or explain why the caller should defer.
+
+    The bucket may go into debt: a request that arrives early is told when it may hit
+    the host (not_before), and a deferred one when to try again (retry_at_utc). An open
+    circuit (or a half-open one whose probe is still out) answers with fail_fast_reason;
+    an open circuit whose cooldown has passed turns half-open and hands this caller the
+    probe. Writes are left for the caller to commit.
+    """
+    if connection is None:
+        raise HostThrottleError("connection is required")
+    if not isinstance(host, str) or not host.strip():
+        raise HostThrottleError("host must be a non-empty string")
+    _validate_config(config)
+
+    if now is None:
+        now = time.time()
+
+    row = _read_state(connection, host)
+    probe = False
+    if row is None:
+        tokens = config.burst
+        refilled_at = now
+    else:
+        (
+            tokens,
+            refilled_at,
+            _,
+            last_blocked_reason,
+            cooldown_until_utc,
+            circuit_state,
+            probe_expires_at_utc,
+        ) = row
+        cooling_down = isinstance(cooldown_until_utc, str) and _iso_to_epoch(cooldown_until_utc) > now
+        if circuit_state in (CIRCUIT_OPEN, CIRCUIT_HALF_OPEN):
+            probe_in_flight = (
+                circuit_state == CIRCUIT_HALF_OPEN
+                and isinstance(probe_expires_at_utc, str)
+                and _iso_to_epoch(probe_expires_at_utc) > now
+            )
+            if probe_in_flight or (circuit_state == CIRCUIT_OPEN and cooling_down):
+                return ThrottleDecision(allowed=True, fail_fast_reason=last_blocked_reason or "timeout")
+            probe = True
+        elif cooling_down:
+            return ThrottleDecision(
+                allowed=False,
+                deferred_reason=last_blocked_reason or "cooldown",
+                retry_at_utc=cooldown_until_utc,
+            )
+
+    elapsed = max(0.0, now - float(refilled_at))
+    tokens = min(config.burst, float(tokens) + elapsed * config.rate_per_second)
+
+    tokens -= 1.0
+    delay_seconds = 0.0
+    if tokens < 0:
+        delay_seconds = -tokens / config.rate_per_second
+        if delay_seconds > config.max_wait_seconds:
+            # Rounded up to the next second so a retry never arrives before the bucket allows it.
+            retry_at = math.ceil(now + delay_seconds - config.max_wait_seconds)
+            return ThrottleDecision(
+                allowed=False,
+                deferred_reason="host_rate_limit",
+                retry_at_utc=_epoch_to_iso(retry_at),
+            )
+
+    connection.execute(
+        """
+        INSERT INTO host_throttle_state (host, tokens, tokens_refilled_at_epoch, updated_at_utc)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(host) DO UPDATE SET
+            tokens = excluded.tokens,
+            tokens_refilled_at_epoch = excluded.tokens_refilled_at_epoch,
+            updated_at_utc = excluded.updated_at_utc
+        """,
+        (host, tokens, now, _utc_now_iso()),
+    )
+    if probe:
+        connection.execute(
+            """
+            UPDATE host_throttle_state
+            SET circuit_state = ?,
+                probe_expires_at_utc = ?
+            WHERE host = ?
+            """,
+            (CIRCUIT_HALF_OPEN, _epoch_to_iso(now + config.probe_timeout_seconds), host),
+        )
+    return ThrottleDecision(
+        allowed=True,
+        delay_seconds=delay_seconds,
+        probe=probe,
+        not_before=time.monotonic() + delay_seconds,
+    )
+
+
+def record_host_outcome(
+    connection: sqlite3.Connection,
+    host: str,
+    blocked_reason: str | None,
+    config: HostThrottleConfig,
+    now: float | None = None,
+) -> str | None:
+    """Feed a fetch outcome back into the host's backoff state.
+
+    A None blocked_reason clears the failure streak and closes the circuit. A known
+    blocked_reason starts or extends a cooldown of base * 2^(streak-1), capped at
+    max_backoff_seconds, and opens the circuit once the streak reaches
+    circuit_failure_threshold (a failed half-open probe re-opens it). Returns the
+    cooldown_until_utc that now applies, if any.
+    """
+    if connection is None:
+        raise HostThrottleError("connection is required")
+    if not isinstance(host, str) or not host.strip():
+        raise HostThrottleError("host must be a non-empty string")
+    _validate_config(config)
+
+    if now is None:
+        now = time.time()
+
+    if blocked_reason is None:
+        connection.execute(
+            """
+            UPDATE host_throttle_state
+            SET consecutive_failures = 0,
+                last_blocked_reason = NULL,
+                cooldown_until_utc = NULL,
+                circuit_state = 'closed',
+                probe_expires_at_utc = NULL,
+                updated_at_utc = ?
+            WHERE host = ?
+            """,
+            (_utc_now_iso(), host),
+        )
+        return None
+
+    base_seconds = _BACKOFF_BASE_SECONDS.get(blocked_reason)
+    if base_seconds is None:
+        raise HostThrottleError(f"Unknown blocked_reason: {blocked_reason}")
+
+    row = _read_state(connection, host)
+    consecutive_failures = 1
+    if row is not None and isinstance(row[2], int):
+        consecutive_failures = row[2] + 1
+
+    backoff_seconds = min(config.max_backoff_seconds, base_seconds * (2 ** (consecutive_failures - 1)))
+    cooldown_until_utc = _epoch_to_iso(now + backoff_seconds)
+    circuit_state = CIRCUIT_OPEN if consecutive_failures >= config.circuit_failure_threshold else CIRCUIT_CLOSED
+
+    connection.execute(
+        """
+        INSERT INTO host_throttle_state (
+            host,
+            tokens,
+            tokens_refilled_at_epoch,
+            consecutive_failures,
+            last_blocked_reason,
+            cooldown_until_utc,
+            circuit_state,
+            probe_expires_at_utc,
+            updated_at_utc
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?)
+        ON CONFLICT(host) DO UPDATE SET
+            consecutive_failures = excluded.consecutive_failures,
+            last_blocked_reason = excluded.last_blocked_reason,
+            cooldown_until_utc = excluded.cooldown_until_utc,
+            circuit_state = excluded.circuit_state,
+            probe_expires_at_utc = NULL,
+            updated_at_utc = excluded.updated_at_utc
+        """,
+        (
+            host,
+            config.burst,
+            now,
+            consecutive_failures,
+            blocked_reason,
+            cooldown_until_utc,
+            circuit_state,
+            _utc_now_iso(),
+        ),
+    )
+    return cooldown_until_utc
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+from .fuel_history import ensure_fuel_log_coalescing_schema
+
+
+class LatestStateError(Exception):
+    pass
+
+
+# marina_fuel_latest / marina_pricing_latest hold one row per marina: the newest log row
+# (by fetched_at_utc, then id). Triggers on the log tables keep them current inside the
+# writer's own transaction, so every writer (fuel worker, pricing CLI, Node) stays
+# consistent without calling into this module, and "latest price" is a primary-key read.
+_FUEL_LATEST_COLUMNS = (
+    "fuel_log_id",
+    "marina_uid",
+    "fetched_at_utc",
+    "last_confirmed_at_utc",
+    "observation_count",
+    "outcome_state",
+    "reason_tag",
+    "blocked_reason",
+    "diesel_price",
+    "gasoline_price",
+    "fuel_dock",
+    "last_updated",
+    "source_url",
+    "price_source",
+    "confidence",
+    "extraction_hash",
+)
+
+_PRICING_LATEST_COLUMNS = (
+    "pricing_log_id",
+    "marina_uid",
+    "fetched_at_utc",
+    "monthly_base",
+    "is_per_ft",
+    "catamaran_multiplier",
+    "liveaboard_fee",
+    "min_air_draft_ft",
+    "air_draft_source",
+    "min_depth_ft",
+    "depth_source",
+    "lift_max_beam_ft",
+    "lift_max_tons",
+    "diy_allowed",
+    "electricity_metered",
+    "water_metered",
+    "liveaboard_permitted",
+    "source_quotes",
+    "extraction_hash",
+)
+
+_LATEST_TABLES = {
+    "fuel": ("marina_fuel_latest", "fuel_logs", "fuel_log_id", _FUEL_LATEST_COLUMNS),
+    "pricing": ("marina_pricing_latest", "pricing_logs", "pricing_log_id", _PRICING_LATEST_COLUMNS),
+}
+
+_CREATE_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS marina_fuel_latest (
+    marina_uid TEXT PRIMARY KEY,
+    fuel_log_id INTEGER NOT NULL,
+    fetched_at_utc TEXT NOT NULL,
+    last_confirmed_at_utc TEXT,
+    observation_count INTEGER NOT NULL DEFAULT 1,
+    outcome_state TEXT NOT NULL,
+    reason_tag TEXT NOT NULL,
+    blocked_reason TEXT,
+    diesel_price REAL,
+    gasoline_price REAL,
+    fuel_dock INTEGER,
+    last_updated TEXT,
+    source_url TEXT,
+    price_source TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    extraction_hash TEXT
+);
+
+CREATE TABLE IF NOT EXISTS marina_pricing_latest (
+    marina_uid TEXT PRIMARY KEY,
+    pricing_log_id INTEGER NOT NULL,
+    fetched_at_utc TEXT NOT NULL,
+    monthly_base REAL,
+    is_per_ft INTEGER,
+    catamaran_multiplier REAL,
+    liveaboard_fee REAL,
+    min_air_draft_ft REAL,
+    air_draft_source TEXT,
+    min_depth_ft REAL,
+    depth_source TEXT,
+    lift_max_beam_ft REAL,
+    lift_max_tons REAL,
+    diy_allowed INTEGER,
+    electricity_metered INTEGER,
+    water_metered INTEGER,
+    liveaboard_permitted INTEGER,
+    source_quotes TEXT,
+    extraction_hash TEXT
+);
+"""
+
+
+def _select_latest_sql(log_table: str, id_column: str, columns: tuple[str, ...], marina_ref: str) -> str:
+    return (
+        f"SELECT {', '.join(columns)}\n"
+        f"    FROM {log_table}\n"
+        f"    WHERE marina_uid = {marina_ref}\n"
+        f"    ORDER BY fetched_at_utc DESC, {id_column} DESC\n"
+        f"    LIMIT 1"
+    )
+
+
+def _trigger_sql(kind: str) -> str:
+    latest_table, log_table, id_column, columns = _LATEST_TABLES[kind]
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"NEW.{column}" for column in columns)
+    recompute = (
+        f"DELETE FROM {latest_table} WHERE marina_uid = {{ref}};\n"
+        f"    INSERT INTO {latest_table} ({column_list})\n"
+        f"    {_select_latest_sql(log_table, id_column, columns, '{ref}')};"
+    )
+    # Inserts only take over when they are at least as new as the stored row, so a
+    # back-filled historical log never displaces the current one. Updates and deletes
+    # recompute the marina from the (marina_uid, fetched_at_utc) index.
+    return f"""
+CREATE TRIGGER IF NOT EXISTS trg_{log_table}_latest_insert
+AFTER INSERT ON {log_table}
+WHEN NOT EXISTS (
+    SELECT 1 FROM {latest_table} latest
+    WHERE latest.marina_uid = NEW.marina_uid
+      AND (
+          latest.fetched_at_utc > NEW.fetched_at_utc
+          OR (latest.fetched_at_utc = NEW.fetched_at_utc AND latest.{id_column} > NEW.{id_column})
+      )
+)
+BEGIN
+    INSERT OR REPLACE INTO {latest_table} ({column_list}) VALUES ({new_values});
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_{log_table}_latest_update
+AFTER UPDATE OF {", ".join(column for column in columns if column != id_column)} ON {log_table}
+BEGIN
+    {recompute.format(ref="OLD.marina_uid")}
+    {recompute.format(ref="NEW.marina_uid")}
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_{log_table}_latest_delete
+AFTER DELETE ON {log_table}
+WHEN EXISTS (SELECT 1 FROM {latest_table} WHERE {id_column} = OLD.{id_column})
+BEGIN
+    {recompute.format(ref="OLD.marina_uid")}
+END;
+"""
+
+
+def _table_exists(connection: sqlite3.Connection, table_name: str) -> bool:
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (table_name,),
+    ).fetchone()
+    return row is not None
+
+
+def ensure_latest_state_schema(connection: sqlite3.Connection) -> list[str]:
+    """Create the latest-state tables and their maintenance triggers if absent.
+
+    A table created here on a database that already has history is filled by
+    rebuild_latest_state straight away. Returns the names of the tables that were
+    created. Leaves committing to the caller.
+    """
+    if connection is None:
+        raise LatestStateError("connection is required")
+
+    present_kinds = [kind for kind, spec in _LATEST_TABLES.items() if _table_exists(connection, spec[1])]
+    if "fuel" in present_kinds:
+        ensure_fuel_log_coalescing_schema(connection)
+
+    created: list[str] = []
+    for kind in present_kinds:
+        latest_table = _LATEST_TABLES[kind][0]
+        if not _table_exists(connection, latest_table):
+            created.append(latest_table)
+
+    statements = [_CREATE_TABLES_SQL] + [_trigger_sql(kind) for kind in present_kinds]
+    for script in statements:
+        for statement in _split_statements(script):
+            connection.execute(statement)
+
+    for kind in present_kinds:
+        if _LATEST_TABLES[kind][0] in created:
+            _rebuild_kind(connection, kind)
+    return created
+
+
+def _split_statements(script: str) -> list[str]:
+    # sqlite3.complete_statement keeps trigger bodies (which contain ';') in one piece.
+    statements: list[str] = []
+    pending = ""
+    for line in script.splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            if pending.strip():
+                statements.append(pending.strip())
+            pending = ""
+    if pending.strip():
+        raise LatestStateError(f"incomplete schema statement: {pending.strip()[:80]}")
+    return statements
+
+
+def _rebuild_kind(connection: sqlite3.Connection, kind: str) -> int:
+    latest_table, log_table, id_column, columns = _LATEST_TABLES[kind]
+    column_list = ", ".join(columns)
+    connection.execute(f"DELETE FROM {latest_table}")
+    # The correlated subquery walks the (marina_uid, fetched_at_utc) index to pick each marina's
+    # newest row; the id tie-break matches the triggers.
+    cursor = connection.execute(
+        f"""
+        INSERT INTO {latest_table} ({column_list})
+        SELECT {column_list}
+        FROM {log_table} log
+        WHERE log.{id_column} = (
+            SELECT newer.{id_column}
+            FROM {log_table} newer
+            WHERE newer.marina_uid = log.marina_uid
+            ORDER BY newer.fetched_at_utc DESC, newer.{id_column} DESC
+            LIMIT 1
+        )
+        """
+    )
+    return cursor.rowcount
+
+
+def rebuild_latest_state(connection: sqlite3.Connection) -> dict[str, int]:
+    """Recompute both latest-state tables from the full logs and commit.
+
+    Only needed for databases that were written while the triggers were missing (e.g. by
+    a copy restored from an older backup); returns rows written per latest table.
+    """
+    if connection is None:
+        raise LatestStateError("connection is required")
+
+    ensure_latest_state_schema(connection)
+    counts: dict[str, int] = {}
+    try:
+        for kind, spec in _LATEST_TABLES.items():
+            if _table_exists(connection, spec[1]):
+                counts[spec[0]] = _rebuild_kind(connection, kind)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    return counts
+
+
+def _read_latest(connection: sqlite3.Connection, kind: str, marina_uid: str) -> dict[str, Any] | None:
+    if connection is None:
+        raise LatestStateError("connection is required")
+    if not isinstance(marina_uid, str) or not marina_uid.strip():
+        raise LatestStateError("marina_uid must be a non-empty string")
+
+    latest_table, _, _, columns = _LATEST_TABLES[kind]
+    connection.row_factory = sqlite3.Row
+    row = connection.execute(
+        f"SELECT {', '.join(columns)} FROM {latest_table} WHERE marina_uid = ?",
+        (marina_uid.strip(),),
+    ).fetchone()
+    if row is None:
+        return None
+    return dict(row)
+
+
+def read_latest_fuel(connection: sqlite3.Connection, marina_uid: str) -> dict[str, Any] | None:
+    """Return the marina's current fuel_logs row (as stored in marina_fuel_latest)."""
+    return _read_latest(connection, "fuel", marina_uid)
+
+
+def read_latest_pricing(connection: sqlite3.Connection, marina_uid: str) -> dict[str, Any] | None:
+    """Return the marina's current pricing_logs row (as stored in marina_pricing_latest)."""
+    return _read_latest(connection, "pricing", marina_uid)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+class PricingCacheError(Exception):
+    pass
+
+
+_ENTRY_SUFFIX = ".json"
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def prompt_digest(prompt: str) -> str:
+    """Version of a system prompt: any edit to the text is a new version."""
+    if not isinstance(prompt, str):
+        raise PricingCacheError("prompt must be a string")
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def pricing_cache_key(prompt: str, model: str, request_params: dict[str, Any], markdown: str) -> str:
+    """Content address of one extraction: prompt version, model, call parameters and markdown."""
+    if not isinstance(model, str) or not model.strip():
+        raise PricingCacheError("model must be a non-empty string")
+    if not isinstance(markdown, str):
+        raise PricingCacheError("markdown must be a string")
+    digest = hashlib.sha256()
+    for part in (
+        prompt_digest(prompt),
+        model,
+        json.dumps(request_params, sort_keys=True, separators=(",", ":")),
+        hashlib.sha256(markdown.encode("utf-8")).hexdigest(),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+# Entries live in one subdirectory per prompt version, so evicting a stale prompt is a
+# directory listing rather than a read of every entry.
+_VERSION_DIR_CHARS = 16
+
+
+def _version_dir_name(prompt_version: str) -> str:
+    if not isinstance(prompt_version, str) or not prompt_version.strip().isalnum():
+        raise PricingCacheError("prompt_version must be a non-empty alphanumeric digest")
+    return prompt_version.strip()[:_VERSION_DIR_CHARS]
+
+
+def _entry_path(cache_dir: Path, key: str, prompt_version: str) -> Path:
+    return cache_dir / _version_dir_name(prompt_version) / f"{key}{_ENTRY_SUFFIX}"
+
+
+def _is_entry(name: str) -> bool:
+    return name.endswith(_ENTRY_SUFFIX) and not name.startswith(".tmp-")
+
+
+def read_cached_pricing(cache_dir: str | Path, key: str, *, prompt_version: str) -> dict[str, Any] | None:
+    """Return the normalized result stored under key for prompt_version, or None.
+
+    A hit refreshes the entry's mtime, so age and size eviction drop the least recently
+    used entries first. Unreadable or foreign files count as a miss.
+    """
+    path = _entry_path(Path(cache_dir), key, prompt_version)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key or not isinstance(entry.get("result"), dict):
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry["result"]
+
+
+def write_cached_pricing(
+    cache_dir: str | Path,
+    key: str,
+    result: dict[str, Any],
+    *,
+    prompt_version: str,
+    model: str,
+) -> None:
+    """Store a normalized result. Cache write failures are ignored; the result is still valid."""
+    path = _entry_path(Path(cache_dir), key, prompt_version)
+    entry = {
+        "key": key,
+        "prompt_version": prompt_version,
+        "model": model,
+        "stored_at_utc": _utc_now_iso(),
+        "result": result,
+    }
+    # Write-then-rename so concurrent readers never see a torn file.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp-", suffix=_ENTRY_SUFFIX)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, sort_keys=True)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def _remove_version_dir(directory: Path) -> int:
+    """Delete a prompt version's entries (and the directory once empty); returns entries removed."""
+    removed = 0
+    with os.scandir(directory) as scan:
+        for item in scan:
+            if not item.is_file():
+                continue
+            try:
+                os.unlink(item.path)
+            except OSError:
+                continue
+            if _is_entry(item.name):
+                removed += 1
+    try:
+        directory.rmdir()
+    except OSError:
+        pass
+    return removed
+
+
+def prune_pricing_cache(
+    cache_dir: str | Path,
+    *,
+    max_age_days: float | None = 90.0,
+    max_total_bytes: int | None = 64 * 1024 * 1024,
+    current_prompt_version: str | None = None,
+) -> dict[str, int]:
+    """Evict entries by prompt version, then age, then total size (least recently used first).
+
+    With current_prompt_version set, every other prompt version's subdirectory is deleted
+    (as are entries from the older flat layout): they can never be hit again once
+    PRICING_SYSTEM_PROMPT has changed. Age is time since the entry was last written or
+    hit. Each entry is counted under the first reason that removes it. Returns counts of
+    removed entries per reason.
+    """
+    if max_age_days is not None and (
+        not isinstance(max_age_days, (int, float)) or isinstance(max_age_days, bool) or max_age_days <= 0
+    ):
+        raise PricingCacheError("max_age_days must be > 0 or None")
+    if max_total_bytes is not None and (not isinstance(max_total_bytes, int) or max_total_bytes < 0):
+        raise PricingCacheError("max_total_bytes must be an int >= 0 or None")
+    current_dir_name = None
+    if current_prompt_version is not None:
+        current_dir_name = _version_dir_name(current_prompt_version)
+
+    removed = {"stale_prompt": 0, "expired": 0, "over_size": 0}
+    directory = Path(cache_dir)
+    if not directory.is_dir():
+        return {**removed, "kept": 0, "kept_bytes": 0}
+
+    candidates: list[os.DirEntry] = []
+    version_dirs: list[Path] = []
+    with os.scandir(directory) as scan:
+        for item in scan:
+            if item.is_dir():
+                if current_dir_name is not None and item.name != current_dir_name:
+                    removed["stale_prompt"] += _remove_version_dir(Path(item.path))
+                else:
+                    version_dirs.append(Path(item.path))
+            elif item.is_file() and _is_entry(item.name):
+                # Written before entries were grouped by prompt version; unreachable now.
+                if current_dir_name is not None:
+                    try:
+                        os.unlink(item.path)
+                        removed["stale_prompt"] += 1
+                    except OSError:
+                        pass
+                else:
+                    candidates.append(item)
+    for version_dir in version_dirs:
+        with os.scandir(version_dir) as scan:
+            candidates.extend(item for item in scan if item.is_file() and _is_entry(item.name))
+
+    oldest_allowed = time.time() - max_age_days * 86400.0 if max_age_days is not None else None
+    live: list[tuple[float, int, Path]] = []
+    for item in candidates:
+        try:
+            stat = item.stat()
+        except OSError:
+            continue
+        if oldest_allowed is not None and stat.st_mtime < oldest_allowed:
+            try:
+                os.unlink(item.path)
+                removed["expired"] += 1
+            except OSError:
+                pass
+            continue
+        live.append((stat.st_mtime, stat.st_size, Path(item.path)))
+
+    total_bytes = sum(size for _, size, _ in live)
+    live.sort(key=lambda item: item[0])
+    kept = len(live)
+    for _, size, path in live:
+        if max_total_bytes is None or total_bytes <= max_total_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total_bytes -= size
+        kept -= 1
+        removed["over_size"] += 1
+    return {**removed, "kept": kept, "kept_bytes": total_bytes}
+
+
+def clear_pricing_cache(cache_dir: str | Path) -> int:
+    """Delete every cached extraction; returns the number of entries removed."""
+    directory = Path(cache_dir)
+    if not directory.is_dir():
+        return 0
+    removed = 0
+    for path in directory.glob(f"*{_ENTRY_SUFFIX}"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    for version_dir in directory.iterdir():
+        if version_dir.is_dir():
+            removed += _remove_version_dir(version_dir)
+    return removed
@@ -6,11 +6,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-try:
-    from fuel_extractor.app.markdown_convert import fetch_full_site_markdown, prune_marina_markdown
-except ImportError:
-    fetch_full_site_markdown = None
-    prune_marina_markdown = None
+from .pricing_cache import pricing_cache_key, prompt_digest, read_cached_pricing, write_cached_pricing
 
 
 class PricingWorkerError(Exception):
@@ -112,6 +108,13 @@ EXAMPLE OUTPUT:
 """
 
 
+PRICING_MODEL = "accounts/fireworks/models/deepseek-v4-pro"
+
+# Everything besides the prompt, model and markdown that shapes the answer; part of the
+# extraction cache key.
+_PRICING_REQUEST_PARAMS = {"temperature": 0.1, "max_tokens": 4096}
+
+
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
@@ -137,26 +140,41 @@ def extract_pricing_with_deepseek(
     timeout_seconds: int = 45,
     max_pages: int = 20,
     html_content: str = None,
+    cache_dir: str | None = None,
 ) -> dict[str, Any]:
     """
     Extract pricing data from marina website using DeepSeek v4 via Fireworks.
     If html_content is provided, use it directly instead of fetching from URL.
-    """
-    api_key = os.getenv("FIREWORKS_API_KEY")
-    if not api_key:
-        raise PricingWorkerError("FIREWORKS_API_KEY environment variable not set")
 
+    With cache_dir, results are cached by (prompt version, model, request parameters,
+    pruned markdown): an unchanged site is answered from the cache without calling
+    Fireworks. The result's llm_cache_hit says which path was taken.
+    """
     # 1. Get content (either from HTML or fetch from URL)
     if html_content:
         full_markdown = html_content
-    elif fetch_full_site_markdown is not None:
+    else:
+        try:
+            from fuel_extractor.app.markdown_convert import fetch_full_site_markdown, prune_marina_markdown
+        except ImportError:
+            raise PricingWorkerError("html_content not provided and fuel_extractor module not available")
         full_markdown = fetch_full_site_markdown(base_url, timeout_seconds, max_pages)
         # 2. Prune markdown to reduce token count while preserving data-dense content
         full_markdown = prune_marina_markdown(full_markdown)
-    else:
-        raise PricingWorkerError("html_content not provided and fuel_extractor module not available")
 
-    # 2. Call Fireworks DeepSeek v4
+    cache_key = None
+    prompt_version = prompt_digest(PRICING_SYSTEM_PROMPT)
+    if cache_dir is not None:
+        cache_key = pricing_cache_key(PRICING_SYSTEM_PROMPT, PRICING_MODEL, _PRICING_REQUEST_PARAMS, full_markdown)
+        cached = read_cached_pricing(cache_dir, cache_key, prompt_version=prompt_version)
+        if cached is not None:
+            return {**cached, "fetched_at_utc": _utc_now_iso(), "llm_cache_hit": True}
+
+    api_key = os.getenv("FIREWORKS_API_KEY")
+    if not api_key:
+        raise PricingWorkerError("FIREWORKS_API_KEY environment variable not set")
+
+    # 3. Call Fireworks DeepSeek v4
     try:
         from fireworks.client import Fireworks
     except ImportError:
@@ -168,28 +186,36 @@ def extract_pricing_with_deepseek(
 
     try:
         response = client.chat.completions.create(
-            model="accounts/fireworks/models/deepseek-v4-pro",
+            model=PRICING_MODEL,
             messages=[
                 {"role": "system", "content": PRICING_SYSTEM_PROMPT},
                 {"role": "user", "content": full_markdown},
             ],
-            temperature=0.1,  # Low temp for consistent extraction
-            max_tokens=4096,
+            **_PRICING_REQUEST_PARAMS,  # Low temperature for consistent extraction
         )
     except Exception as exc:
         raise PricingWorkerError(f"Fireworks API call failed: {exc}") from exc
 
-    # 3. Parse JSON response
+    # 4. Parse JSON response
     try:
         content = response.choices[0].message.content
         result = json.loads(content)
     except (json.JSONDecodeError, AttributeError, IndexError) as exc:
         raise PricingWorkerError(f"Failed to parse Fireworks response as JSON: {exc}") from exc
 
-    # 4. Normalize to database schema
+    # 5. Normalize to database schema
     normalized = _normalize_pricing_result(result)
     normalized["extraction_hash"] = _extraction_hash(normalized)
+    if cache_key is not None:
+        write_cached_pricing(
+            cache_dir,
+            cache_key,
+            normalized,
+            prompt_version=prompt_version,
+            model=PRICING_MODEL,
+        )
     normalized["fetched_at_utc"] = _utc_now_iso()
+    normalized["llm_cache_hit"] = False
 
     return normalized
 
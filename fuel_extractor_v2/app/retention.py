@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from .change_log import prune_change_log
+
+
+class RetentionError(Exception):
+    pass
+
+
+_ARCHIVE_SCHEMA = "archive"
+
+
+@dataclass(frozen=True)
+class RetentionConfig:
+    """What is archived, how far back, and how much work each write transaction does.
+
+    A horizon of None keeps that table as it is. Rows are copied into `<table>_archive`
+    in the same database, or into `<table>` of archive_db_path when one is given, and then
+    deleted, chunk_size rows per transaction so the writer lock is only held briefly.
+    """
+
+    queue_horizon_days: int | None = 30
+    sync_event_horizon_days: int | None = 90
+    fuel_log_horizon_days: int | None = 365
+    chunk_size: int = 500
+    archive_db_path: str | None = None
+    vacuum_pages_per_step: int = 256
+    analysis_limit: int = 1000
+
+
+# (table, primary key, config attribute, predicate). Only terminal rows qualify: finished
+# or dead-lettered seeds, events the Master API has acknowledged, and fuel_logs rows that
+# MasterSyncService.js has pushed (sync_dirty = 0) and that are no longer a marina's
+# newest observation (marina_fuel_latest keeps pointing at it).
+_RETENTION_TABLES = (
+    (
+        "fuel_seed_queue",
+        "seed_id",
+        "queue_horizon_days",
+        "t.queue_status IN ('done', 'failed') AND t.seeded_at_utc < :cutoff",
+    ),
+    (
+        "sync_events",
+        "sync_event_id",
+        "sync_event_horizon_days",
+        "t.master_acknowledged = 1 AND t.occurred_at_utc < :cutoff",
+    ),
+    (
+        "fuel_logs",
+        "fuel_log_id",
+        "fuel_log_horizon_days",
+        """COALESCE(t.last_confirmed_at_utc, t.fetched_at_utc) < :cutoff
+        AND t.sync_dirty = 0
+        AND EXISTS (
+            SELECT 1 FROM main.fuel_logs AS newer
+            WHERE newer.marina_uid = t.marina_uid
+              AND (newer.fetched_at_utc, newer.fuel_log_id) > (t.fetched_at_utc, t.fuel_log_id)
+        )""",
+    ),
+)
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _cutoff_iso(now_utc: datetime, horizon_days: int) -> str:
+    cutoff = now_utc - timedelta(days=horizon_days)
+    return cutoff.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _validate_config(config: RetentionConfig) -> None:
+    if not isinstance(config, RetentionConfig):
+        raise RetentionError("config must be a RetentionConfig")
+    for _, _, attribute, _ in _RETENTION_TABLES:
+        value = getattr(config, attribute)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+            raise RetentionError(f"{attribute} must be an int >= 1 or None")
+    if not isinstance(config.chunk_size, int) or not 1 <= config.chunk_size <= 5000:
+        raise RetentionError("chunk_size must be an int between 1 and 5000")
+    if config.archive_db_path is not None and (
+        not isinstance(config.archive_db_path, str) or not config.archive_db_path.strip()
+    ):
+        raise RetentionError("archive_db_path must be a non-empty string or None")
+    if not isinstance(config.vacuum_pages_per_step, int) or config.vacuum_pages_per_step < 1:
+        raise RetentionError("vacuum_pages_per_step must be an int >= 1")
+    if not isinstance(config.analysis_limit, int) or config.analysis_limit < 0:
+        raise RetentionError("analysis_limit must be an int >= 0")
+
+
+def _table_exists(connection: sqlite3.Connection, schema: str, table: str) -> bool:
+    row = connection.execute(
+        f"SELECT 1 FROM {schema}.sqlite_master WHERE type = 'table' AND name = ?",
+        (table,),
+    ).fetchone()
+    return row is not None
+
+
+def _table_columns(connection: sqlite3.Connection, schema: str, table: str) -> list[tuple[str, str]]:
+    return [(row[1], row[2]) for row in connection.execute(f'PRAGMA {schema}.table_info("{table}")').fetchall()]
+
+
+def _ensure_archive_table(
+    connection: sqlite3.Connection,
+    schema: str,
+    archive_table: str,
+    source_table: str,
+    primary_key: str,
+) -> list[str]:
+    """Create or widen the archive table to hold every current source column.
+
+    Archive tables carry the source columns without their CHECK and foreign-key
+    constraints, plus archived_at_utc. Columns added to the source by later schema
+    upgrades are added here too, so older archived rows read them as NULL.
+    """
+    source_columns = _table_columns(connection, "main", source_table)
+    if not _table_exists(connection, schema, archive_table):
+        column_sql = ",\n    ".join(
+            f'"{name}" {declared_type or ""}'.rstrip() + (" PRIMARY KEY" if name == primary_key else "")
+            for name, declared_type in source_columns
+        )
+        connection.execute(
+            f'CREATE TABLE {schema}."{archive_table}" (\n    {column_sql},\n    archived_at_utc TEXT NOT NULL\n)'
+        )
+    else:
+        archived = {name for name, _ in _table_columns(connection, schema, archive_table)}
+        for name, declared_type in source_columns:
+            if name not in archived:
+                connection.execute(f'ALTER TABLE {schema}."{archive_table}" ADD COLUMN "{name}" {declared_type}')
+    connection.commit()
+    return [name for name, _ in source_columns]
+
+
+def _archive_table(
+    connection: sqlite3.Connection,
+    *,
+    schema: str,
+    archive_table: str,
+    source_table: str,
+    primary_key: str,
+    predicate: str,
+    cutoff: str,
+    chunk_size: int,
+) -> dict[str, Any]:
+    columns = _ensure_archive_table(connection, schema, archive_table, source_table, primary_key)
+    column_sql = ", ".join(f'"{name}"' for name in columns)
+    archived_rows = 0
+    chunks = 0
+    longest_chunk_ms = 0.0
+    while True:
+        started = time.monotonic()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row_ids = [
+                row[0]
+                for row in connection.execute(
+                    f"""
+                    SELECT t.{primary_key}
+                    FROM main.{source_table} AS t
+                    WHERE {predicate}
+                    ORDER BY t.{primary_key}
+                    LIMIT :chunk_size
+                    """,
+                    {"cutoff": cutoff, "chunk_size": chunk_size},
+                ).fetchall()
+            ]
+            if not row_ids:
+                connection.commit()
+                break
+            placeholders = ", ".join("?" for _ in row_ids)
+            # OR REPLACE: with WAL, the archive database can commit without main, so a
+            # chunk interrupted in between is copied again on the next run.
+            connection.execute(
+                f"""
+                INSERT OR REPLACE INTO {schema}."{archive_table}" ({column_sql}, archived_at_utc)
+                SELECT {column_sql}, ? FROM main.{source_table}
+                WHERE {primary_key} IN ({placeholders})
+                """,
+                (_utc_now_iso(), *row_ids),
+            )
+            cursor = connection.execute(
+                f"DELETE FROM main.{source_table} WHERE {primary_key} IN ({placeholders})",
+                row_ids,
+            )
+            if cursor.rowcount != len(row_ids):
+                raise RetentionError(
+                    f"{source_table}: expected to delete {len(row_ids)} rows, deleted {cursor.rowcount}"
+                )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        archived_rows += len(row_ids)
+        chunks += 1
+        longest_chunk_ms = max(longest_chunk_ms, (time.monotonic() - started) * 1000.0)
+    return {
+        "cutoff_utc": cutoff,
+        "archive_table": f"{schema}.{archive_table}",
+        "archived_rows": archived_rows,
+        "chunks": chunks,
+        "longest_chunk_ms": round(longest_chunk_ms, 3),
+    }
+
+
+def _pragma_int(connection: sqlite3.Connection, name: str) -> int:
+    return int(connection.execute(f"PRAGMA main.{name}").fetchone()[0])
+
+
+def _reclaim_free_pages(connection: sqlite3.Connection, pages_per_step: int) -> str:
+    """Return freed pages to the filesystem without one long exclusive lock.
+
+    Incremental vacuum needs auto_vacuum = INCREMENTAL, which only a full VACUUM can
+    switch on for an existing database (enable_incremental_vacuum does that once).
+    """
+    auto_vacuum = _pragma_int(connection, "auto_vacuum")
+    if auto_vacuum != 2:
+        return "skipped_auto_vacuum_not_incremental"
+    while _pragma_int(connection, "freelist_count") > 0:
+        freelist_before = _pragma_int(connection, "freelist_count")
+        connection.execute(f"PRAGMA main.incremental_vacuum({pages_per_step})").fetchall()
+        if _pragma_int(connection, "freelist_count") >= freelist_before:
+            break
+    return "incremental"
+
+
+def enable_incremental_vacuum(connection: sqlite3.Connection) -> None:
+    """Switch an existing database to auto_vacuum = INCREMENTAL with one full VACUUM.
+
+    The VACUUM rewrites the whole file under an exclusive lock and needs as much free
+    disk again, so run it once, with the workers stopped.
+    """
+    if connection is None:
+        raise RetentionError("connection is required")
+    if connection.in_transaction:
+        connection.commit()
+    connection.execute("PRAGMA main.auto_vacuum = INCREMENTAL")
+    connection.execute("VACUUM main")
+
+
+def run_retention(
+    connection: sqlite3.Connection,
+    config: RetentionConfig | None = None,
+    *,
+    now_utc: datetime | None = None,
+) -> dict[str, Any]:
+    """Archive old terminal rows, hand freed pages back, and refresh planner statistics.
+
+    Each table is drained in chunk_size-row transactions (BEGIN IMMEDIATE, copy, delete,
+    commit), so a concurrent worker waits at most one chunk for the write lock. Change-log
+    rows every consumer has read are deleted too. Freed pages are returned with
+    incremental vacuum and the touched tables are re-ANALYZEd with analysis_limit. The
+    report includes per-table row counts and bytes reclaimed.
+    """
+    if connection is None:
+        raise RetentionError("connection is required")
+    if config is None:
+        config = RetentionConfig()
+    _validate_config(config)
+    if now_utc is None:
+        now_utc = datetime.now(timezone.utc)
+    if connection.in_transaction:
+        connection.commit()
+
+    schema = "main"
+    if config.archive_db_path is not None:
+        archive_path = Path(config.archive_db_path.strip())
+        main_file = connection.execute("PRAGMA database_list").fetchone()[2]
+        if main_file and archive_path.resolve() == Path(main_file).resolve():
+            raise RetentionError("archive_db_path must not be the database being archived")
+        connection.execute(f"ATTACH DATABASE ? AS {_ARCHIVE_SCHEMA}", (str(archive_path),))
+        schema = _ARCHIVE_SCHEMA
+
+    page_size = _pragma_int(connection, "page_size")
+    page_count_before = _pragma_int(connection, "page_count")
+    freelist_before = _pragma_int(connection, "freelist_count")
+
+    tables: dict[str, Any] = {}
+    try:
+        for source_table, primary_key, attribute, predicate in _RETENTION_TABLES:
+            horizon_days = getattr(config, attribute)
+            if horizon_days is None or not _table_exists(connection, "main", source_table):
+                continue
+            archive_table = source_table if schema == _ARCHIVE_SCHEMA else f"{source_table}_archive"
+            tables[source_table] = _archive_table(
+                connection,
+                schema=schema,
+                archive_table=archive_table,
+                source_table=source_table,
+                primary_key=primary_key,
+                predicate=predicate,
+                cutoff=_cutoff_iso(now_utc, horizon_days),
+                chunk_size=config.chunk_size,
+            )
+    finally:
+        if schema == _ARCHIVE_SCHEMA:
+            connection.execute(f"DETACH DATABASE {_ARCHIVE_SCHEMA}")
+
+    change_log_pruned = prune_change_log(connection, config.chunk_size)
+    freelist_after_archive = _pragma_int(connection, "freelist_count")
+    vacuum_mode = _reclaim_free_pages(connection, config.vacuum_pages_per_step)
+
+    connection.execute(f"PRAGMA analysis_limit = {config.analysis_limit}")
+    for source_table, summary in tables.items():
+        if summary["archived_rows"]:
+            connection.execute(f"ANALYZE main.{source_table}")
+    connection.commit()
+
+    page_count_after = _pragma_int(connection, "page_count")
+    return {
+        "tables": tables,
+        "archived_rows": sum(summary["archived_rows"] for summary in tables.values()),
+        "change_log_pruned": change_log_pruned,
+        "vacuum": vacuum_mode,
+        "page_size": page_size,
+        "freelist_pages_before": freelist_before,
+        "freelist_pages_after_archive": freelist_after_archive,
+        "freelist_pages_after": _pragma_int(connection, "freelist_count"),
+        "db_bytes_before": page_count_before * page_size,
+        "db_bytes_after": page_count_after * page_size,
+        "bytes_reclaimed": max(page_count_before - page_count_after, 0) * page_size,
+    }
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import sqlite3
+
+
+class SchemaUpgradeError(Exception):
+    pass
+
+
+def table_columns(connection: sqlite3.Connection, table_name: str) -> set[str]:
+    if connection is None:
+        raise SchemaUpgradeError("connection is required")
+    if not isinstance(table_name, str) or not table_name.isidentifier():
+        raise SchemaUpgradeError("table_name must be a plain identifier")
+
+    rows = connection.execute(f"PRAGMA table_info({table_name})").fetchall()
+    columns: set[str] = set()
+    for row in rows:
+        if len(row) < 2:
+            continue
+        column_name = row[1]
+        if isinstance(column_name, str) and column_name.strip():
+            columns.add(column_name.strip())
+    return columns
+
+
+def add_missing_columns(
+    connection: sqlite3.Connection,
+    table_name: str,
+    column_definitions: tuple[tuple[str, str], ...],
+) -> list[str]:
+    """Bring an older database up to PHASE_1_SCHEMA.sql by adding absent columns.
+
+    column_definitions are (column_name, column_ddl) pairs; the DDL must be valid for
+    ALTER TABLE ... ADD COLUMN (constant default when NOT NULL). Returns the names of
+    the columns that were added. Leaves committing to the caller.
+    """
+    columns = table_columns(connection, table_name)
+    if not columns:
+        raise SchemaUpgradeError(f"table does not exist: {table_name}")
+
+    added: list[str] = []
+    for column_name, column_ddl in column_definitions:
+        if column_name in columns:
+            continue
+        connection.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_ddl}")
+        added.append(column_name)
+    return added
@@ -1,26 +1,19 @@
 from __future__ import annotations
 
+import os
 import sqlite3
-from typing import Any
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator
+
+from .schema_upgrade import add_missing_columns
 
 
 class SeedConsumerError(Exception):
     pass
 
 
-def read_pending_seeds(connection: sqlite3.Connection, batch_size: int) -> list[dict[str, Any]]:
-    if connection is None:
-        raise SeedConsumerError("connection is required")
-    if not isinstance(batch_size, int):
-        raise SeedConsumerError("batch_size must be an int")
-    if batch_size < 1:
-        raise SeedConsumerError("batch_size must be >= 1")
-
-    connection.row_factory = sqlite3.Row
-    cursor = connection.cursor()
-    cursor.execute(
-        """
-        SELECT
+_SEED_COLUMNS = """
             seed_id,
             marina_uid,
             name,
@@ -37,9 +30,131 @@ def read_pending_seeds(connection: sqlite3.Connection, batch_size: int) -> list[
             last_fuel_checked_at_utc,
             priority_hint,
             queue_status
+"""
+
+# Claim order: explicit priority_hint, then Dockwa seeds (one cheap JSON fetch) ahead of
+# website crawls, then the marina that has gone longest without a fuel check (never
+# checked first), then FIFO.
+_PRIORITY_ORDER = """
+            CASE priority_hint WHEN 'high' THEN 0 WHEN 'low' THEN 2 ELSE 1 END,
+            CASE WHEN dockwa_url IS NOT NULL AND TRIM(dockwa_url) != '' THEN 0 ELSE 1 END,
+            COALESCE(last_fuel_checked_at_utc, ''),
+            seeded_at_utc,
+            seed_id
+"""
+
+_PRIORITY_RANK = {"high": 0, "normal": 1, "low": 2}
+
+_QUEUE_STATUSES = ("pending", "processing", "done", "failed")
+
+_LEASE_COLUMNS = (
+    ("lease_owner", "TEXT"),
+    ("lease_expires_at_utc", "TEXT"),
+)
+
+_RETRY_COLUMNS = (
+    ("attempt_count", "INTEGER NOT NULL DEFAULT 0 CHECK (attempt_count >= 0)"),
+    ("next_attempt_at_utc", "TEXT"),
+    ("last_error_class", "TEXT"),
+)
+
+# Backoff base per error class (see fuel_worker._seed_error_class); doubled per attempt.
+_DEFAULT_RETRY_BASE_DELAYS = (
+    ("timeout", 10 * 60),
+    ("fetch_error", 15 * 60),
+    ("database_error", 5 * 60),
+    ("dns_failure", 6 * 60 * 60),
+    ("ssl_failure", 6 * 60 * 60),
+)
+
+
+@dataclass(frozen=True)
+class SeedRetryConfig:
+    """Retry schedule for seeds whose attempt failed.
+
+    A failed attempt puts the seed back to 'pending' with next_attempt_at_utc set to
+    base * 2 ** (attempt_count - 1), capped at max_delay_seconds, where base comes from
+    base_delay_seconds for the error class (default_base_delay_seconds otherwise). After
+    max_attempts failed attempts, or on a non-retryable class, the seed is dead-lettered
+    as 'failed' and stays there until requeue_dead_lettered_seeds puts it back.
+    """
+
+    max_attempts: int = 5
+    base_delay_seconds: tuple[tuple[str, int], ...] = _DEFAULT_RETRY_BASE_DELAYS
+    default_base_delay_seconds: int = 15 * 60
+    max_delay_seconds: int = 24 * 60 * 60
+    non_retryable_classes: frozenset[str] = frozenset({"contract_violation"})
+
+
+# UPDATE ... RETURNING arrived in SQLite 3.35; older Pi images fall back to an
+# IMMEDIATE transaction around SELECT + UPDATE, which is just as atomic.
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _utc_iso(moment: datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _utc_now_iso() -> str:
+    return _utc_iso(datetime.now(timezone.utc))
+
+
+def seed_priority_key(seed: dict[str, Any]) -> tuple[int, int, str, str, int]:
+    """Python mirror of _PRIORITY_ORDER for seeds already read into memory."""
+    dockwa_url = seed.get("dockwa_url")
+    has_dockwa = isinstance(dockwa_url, str) and bool(dockwa_url.strip())
+    return (
+        _PRIORITY_RANK.get(seed.get("priority_hint"), 1),
+        0 if has_dockwa else 1,
+        seed.get("last_fuel_checked_at_utc") or "",
+        seed.get("seeded_at_utc") or "",
+        seed.get("seed_id") or 0,
+    )
+
+
+def new_lease_owner() -> str:
+    import socket
+
+    return f"{socket.gethostname()}:{os.getpid()}:{os.urandom(4).hex()}"
+
+
+def ensure_seed_lease_schema(connection: sqlite3.Connection) -> list[str]:
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    return add_missing_columns(connection, "fuel_seed_queue", _LEASE_COLUMNS)
+
+
+def ensure_seed_retry_schema(connection: sqlite3.Connection) -> list[str]:
+    """Add the retry columns and the due-retry partial index; claim_pending_seeds needs them."""
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    added = add_missing_columns(connection, "fuel_seed_queue", _RETRY_COLUMNS)
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_fuel_seed_queue_retry_due
+            ON fuel_seed_queue(next_attempt_at_utc)
+            WHERE queue_status = 'pending' AND next_attempt_at_utc IS NOT NULL
+        """
+    )
+    return added
+
+
+def read_pending_seeds(connection: sqlite3.Connection, batch_size: int) -> list[dict[str, Any]]:
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(batch_size, int):
+        raise SeedConsumerError("batch_size must be an int")
+    if batch_size < 1:
+        raise SeedConsumerError("batch_size must be >= 1")
+
+    connection.row_factory = sqlite3.Row
+    cursor = connection.cursor()
+    cursor.execute(
+        f"""
+        SELECT {_SEED_COLUMNS}
         FROM fuel_seed_queue
         WHERE queue_status = 'pending'
-        ORDER BY seeded_at_utc
+        ORDER BY {_PRIORITY_ORDER}
         LIMIT ?
         """,
         (batch_size,),
@@ -52,22 +167,551 @@ def read_pending_seeds(connection: sqlite3.Connection, batch_size: int) -> list[
     return result
 
 
-def mark_seed_status(connection: sqlite3.Connection, seed_id: int, queue_status: str) -> None:
+def iter_pending_seeds(
+    connection: sqlite3.Connection,
+    page_size: int = 500,
+    queue_status: str = "pending",
+) -> Iterator[dict[str, Any]]:
+    """Yield every seed with queue_status in (seeded_at_utc, seed_id) order, page by page.
+
+    Each page is a fresh keyset query that resumes after the last row seen, walking
+    idx_fuel_seed_queue_status (seed_id is its implicit rowid suffix). Memory stays at one
+    page however large the queue is, and no read cursor is held open between pages.
+
+    Because the key (seeded_at_utc, seed_id) is never updated, no seed is yielded twice.
+    The walk is not a snapshot, though: each page sees the queue as it is when that page
+    is read. A seed whose status changes mid-walk is yielded only if it matches
+    queue_status when its page is read, and a seed inserted mid-walk is yielded only if its
+    key sorts after the cursor. Unlike read_pending_seeds this is FIFO order, not claim
+    priority.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(page_size, int) or isinstance(page_size, bool) or page_size < 1:
+        raise SeedConsumerError("page_size must be an int >= 1")
+    if queue_status not in _QUEUE_STATUSES:
+        raise SeedConsumerError("queue_status must be one of pending|processing|done|failed")
+
+    connection.row_factory = sqlite3.Row
+    first_page_sql = f"""
+        SELECT {_SEED_COLUMNS}
+        FROM fuel_seed_queue
+        WHERE queue_status = ?
+        ORDER BY seeded_at_utc, seed_id
+        LIMIT ?
+    """
+    next_page_sql = f"""
+        SELECT {_SEED_COLUMNS}
+        FROM fuel_seed_queue
+        WHERE queue_status = ?
+          AND (seeded_at_utc, seed_id) > (?, ?)
+        ORDER BY seeded_at_utc, seed_id
+        LIMIT ?
+    """
+
+    rows = connection.execute(first_page_sql, (queue_status, page_size)).fetchall()
+    while rows:
+        for row in rows:
+            yield dict(row)
+        if len(rows) < page_size:
+            return
+        last = rows[-1]
+        rows = connection.execute(
+            next_page_sql,
+            (queue_status, last["seeded_at_utc"], last["seed_id"], page_size),
+        ).fetchall()
+
+
+def claim_pending_seeds(
+    connection: sqlite3.Connection,
+    batch_size: int,
+    lease_owner: str,
+    lease_seconds: int,
+) -> list[dict[str, Any]]:
+    """Atomically move up to batch_size pending seeds to 'processing' under a lease.
+
+    Concurrent workers never receive the same seed: the pick and the status flip happen
+    in one write-locked statement. Seeds waiting out a retry backoff are skipped until
+    their next_attempt_at_utc; due retries then rank like any other pending seed.
+    Returns the claimed seeds highest priority first (see _PRIORITY_ORDER) and commits.
+    Requires ensure_seed_retry_schema.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(batch_size, int):
+        raise SeedConsumerError("batch_size must be an int")
+    if batch_size < 1:
+        raise SeedConsumerError("batch_size must be >= 1")
+    if not isinstance(lease_owner, str) or not lease_owner.strip():
+        raise SeedConsumerError("lease_owner must be a non-empty string")
+    if not isinstance(lease_seconds, int) or lease_seconds < 1:
+        raise SeedConsumerError("lease_seconds must be an int >= 1")
+
+    now = datetime.now(timezone.utc)
+    now_utc = _utc_iso(now)
+    lease_expires_at_utc = _utc_iso(now + timedelta(seconds=lease_seconds))
+    candidate_sql = f"""
+        SELECT seed_id
+        FROM fuel_seed_queue
+        WHERE queue_status = 'pending'
+          AND (next_attempt_at_utc IS NULL OR next_attempt_at_utc <= ?)
+        ORDER BY {_PRIORITY_ORDER}
+        LIMIT ?
+    """
+
+    connection.row_factory = sqlite3.Row
+    if connection.in_transaction:
+        connection.commit()
+
+    if _SUPPORTS_RETURNING:
+        rows = connection.execute(
+            f"""
+            UPDATE fuel_seed_queue
+            SET queue_status = 'processing',
+                lease_owner = ?,
+                lease_expires_at_utc = ?
+            WHERE seed_id IN ({candidate_sql})
+            RETURNING {_SEED_COLUMNS}
+            """,
+            (lease_owner, lease_expires_at_utc, now_utc, batch_size),
+        ).fetchall()
+    else:
+        connection.execute("BEGIN IMMEDIATE")
+        seed_ids = [row[0] for row in connection.execute(candidate_sql, (now_utc, batch_size)).fetchall()]
+        rows = []
+        if seed_ids:
+            placeholders = ", ".join("?" for _ in seed_ids)
+            connection.execute(
+                f"""
+                UPDATE fuel_seed_queue
+                SET queue_status = 'processing',
+                    lease_owner = ?,
+                    lease_expires_at_utc = ?
+                WHERE seed_id IN ({placeholders})
+                """,
+                (lease_owner, lease_expires_at_utc, *seed_ids),
+            )
+            rows = connection.execute(
+                f"SELECT {_SEED_COLUMNS} FROM fuel_seed_queue WHERE seed_id IN ({placeholders})",
+                seed_ids,
+            ).fetchall()
+    connection.commit()
+
+    claimed = [dict(row) for row in rows]
+    claimed.sort(key=seed_priority_key)
+    return claimed
+
+
+def release_seed_claims(
+    connection: sqlite3.Connection,
+    seed_ids: list[int],
+    lease_owner: str,
+    *,
+    commit: bool = True,
+    next_attempt_at_utc: dict[int, str | None] | None = None,
+) -> int:
+    """Hand still-leased seeds back to 'pending' without counting them as attempted.
+
+    next_attempt_at_utc maps seed_ids to the earliest time they may be claimed again
+    (e.g. when their host's cooldown ends); without it, or for a None entry, the seed's
+    next_attempt_at_utc is left as it was and it can be claimed straight away.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(lease_owner, str) or not lease_owner.strip():
+        raise SeedConsumerError("lease_owner must be a non-empty string")
+    if not seed_ids:
+        return 0
+    if next_attempt_at_utc is None:
+        next_attempt_at_utc = {}
+
+    cursor = connection.executemany(
+        """
+        UPDATE fuel_seed_queue
+        SET queue_status = 'pending',
+            lease_owner = NULL,
+            lease_expires_at_utc = NULL,
+            next_attempt_at_utc = COALESCE(?, next_attempt_at_utc)
+        WHERE seed_id = ?
+          AND queue_status = 'processing'
+          AND lease_owner = ?
+        """,
+        [(next_attempt_at_utc.get(seed_id), seed_id, lease_owner) for seed_id in seed_ids],
+    )
+    if commit:
+        connection.commit()
+    return cursor.rowcount
+
+
+def renew_seed_leases(
+    connection: sqlite3.Connection,
+    seed_ids: list[int],
+    lease_owner: str,
+    lease_seconds: int,
+    *,
+    commit: bool = True,
+) -> int:
+    """Push the lease of seeds lease_owner still holds lease_seconds past now.
+
+    Seeds whose lease was already reaped or claimed by another worker are left alone;
+    returns the number of leases renewed.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(lease_owner, str) or not lease_owner.strip():
+        raise SeedConsumerError("lease_owner must be a non-empty string")
+    if not isinstance(lease_seconds, int) or lease_seconds < 1:
+        raise SeedConsumerError("lease_seconds must be an int >= 1")
+    if not seed_ids:
+        return 0
+
+    lease_expires_at_utc = _utc_iso(datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+    cursor = connection.executemany(
+        """
+        UPDATE fuel_seed_queue
+        SET lease_expires_at_utc = ?
+        WHERE seed_id = ?
+          AND queue_status = 'processing'
+          AND lease_owner = ?
+        """,
+        [(lease_expires_at_utc, seed_id, lease_owner) for seed_id in seed_ids],
+    )
+    if commit:
+        connection.commit()
+    return cursor.rowcount
+
+
+def seed_lease_held(connection: sqlite3.Connection, seed_id: int, lease_owner: str) -> bool:
+    """Whether lease_owner still holds seed_id's lease, i.e. may write its outcome."""
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    row = connection.execute(
+        """
+        SELECT 1
+        FROM fuel_seed_queue
+        WHERE seed_id = ?
+          AND queue_status = 'processing'
+          AND lease_owner = ?
+        """,
+        (seed_id, lease_owner),
+    ).fetchone()
+    return row is not None
+
+
+def reap_expired_leases(
+    connection: sqlite3.Connection,
+    now_utc: str | None = None,
+    *,
+    orphan_grace_seconds: int = 30 * 60,
+) -> int:
+    """Return 'processing' seeds whose lease has expired (crashed worker) to 'pending'.
+
+    'processing' rows without a lease_expires_at_utc (set by a status update that did not
+    go through a claim) have no expiry to reap on. Each call stamps them with one
+    orphan_grace_seconds from now, so they are reaped once they have sat unowned that long.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(orphan_grace_seconds, int) or orphan_grace_seconds < 1:
+        raise SeedConsumerError("orphan_grace_seconds must be an int >= 1")
+    if now_utc is None:
+        now_utc = _utc_now_iso()
+    try:
+        now = datetime.fromisoformat(now_utc.replace("Z", "+00:00"))
+    except (AttributeError, ValueError) as exc:
+        raise SeedConsumerError("now_utc must be an ISO-8601 UTC timestamp") from exc
+
+    cursor = connection.execute(
+        """
+        UPDATE fuel_seed_queue
+        SET queue_status = 'pending',
+            lease_owner = NULL,
+            lease_expires_at_utc = NULL
+        WHERE queue_status = 'processing'
+          AND lease_expires_at_utc IS NOT NULL
+          AND lease_expires_at_utc < ?
+        """,
+        (now_utc,),
+    )
+    reaped_count = cursor.rowcount
+    connection.execute(
+        """
+        UPDATE fuel_seed_queue
+        SET lease_expires_at_utc = ?
+        WHERE queue_status = 'processing'
+          AND lease_expires_at_utc IS NULL
+        """,
+        (_utc_iso(now + timedelta(seconds=orphan_grace_seconds)),),
+    )
+    connection.commit()
+    return reaped_count
+
+
+def mark_seed_status(
+    connection: sqlite3.Connection,
+    seed_id: int,
+    queue_status: str,
+    *,
+    commit: bool = True,
+    lease_owner: str | None = None,
+) -> None:
+    """Set a seed's queue_status.
+
+    With lease_owner, the update only applies while that owner still holds the lease,
+    and the lease is cleared once the seed leaves 'processing'.
+    """
     if connection is None:
         raise SeedConsumerError("connection is required")
     if not isinstance(seed_id, int):
         raise SeedConsumerError("seed_id must be an int")
-    if queue_status not in ("pending", "processing", "done", "failed"):
+    if queue_status not in _QUEUE_STATUSES:
         raise SeedConsumerError("queue_status must be one of pending|processing|done|failed")
 
     cursor = connection.cursor()
-    cursor.execute(
-        "UPDATE fuel_seed_queue SET queue_status = ? WHERE seed_id = ?",
-        (queue_status, seed_id),
-    )
+    if lease_owner is None:
+        cursor.execute(
+            "UPDATE fuel_seed_queue SET queue_status = ? WHERE seed_id = ?",
+            (queue_status, seed_id),
+        )
+    else:
+        cursor.execute(
+            """
+            UPDATE fuel_seed_queue
+            SET queue_status = ?,
+                lease_owner = CASE WHEN ? = 'processing' THEN lease_owner END,
+                lease_expires_at_utc = CASE WHEN ? = 'processing' THEN lease_expires_at_utc END
+            WHERE seed_id = ?
+              AND lease_owner = ?
+            """,
+            (queue_status, queue_status, queue_status, seed_id, lease_owner),
+        )
 
     if cursor.rowcount != 1:
-        connection.rollback()
+        if commit:
+            connection.rollback()
         raise SeedConsumerError(f"Expected to update 1 row for seed_id={seed_id}, updated {cursor.rowcount}")
 
-    connection.commit()
+    if commit:
+        connection.commit()
+
+
+def mark_seed_statuses(
+    connection: sqlite3.Connection,
+    statuses: Iterable[tuple[int, str]],
+    *,
+    commit: bool = True,
+    lease_owner: str | None = None,
+) -> int:
+    """Bulk form of mark_seed_status: apply (seed_id, queue_status) pairs in one transaction.
+
+    All pairs go through a single executemany and, with commit, a single commit. Every
+    pair must update exactly one row (with lease_owner: one row still held by that
+    owner); otherwise nothing is applied and SeedConsumerError is raised. Returns the
+    number of rows updated.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if lease_owner is not None and (not isinstance(lease_owner, str) or not lease_owner.strip()):
+        raise SeedConsumerError("lease_owner must be a non-empty string or None")
+
+    pairs = list(statuses)
+    for pair in pairs:
+        if not isinstance(pair, tuple) or len(pair) != 2:
+            raise SeedConsumerError("statuses must be (seed_id, queue_status) pairs")
+        seed_id, queue_status = pair
+        if not isinstance(seed_id, int):
+            raise SeedConsumerError("seed_id must be an int")
+        if queue_status not in _QUEUE_STATUSES:
+            raise SeedConsumerError("queue_status must be one of pending|processing|done|failed")
+    if len({seed_id for seed_id, _ in pairs}) != len(pairs):
+        raise SeedConsumerError("statuses must not repeat a seed_id")
+    if not pairs:
+        return 0
+
+    if not connection.in_transaction:
+        connection.execute("BEGIN")
+    # A savepoint lets a short count undo just these updates when the caller owns the transaction.
+    connection.execute("SAVEPOINT mark_seed_statuses")
+    try:
+        if lease_owner is None:
+            cursor = connection.executemany(
+                "UPDATE fuel_seed_queue SET queue_status = ? WHERE seed_id = ?",
+                [(queue_status, seed_id) for seed_id, queue_status in pairs],
+            )
+        else:
+            cursor = connection.executemany(
+                """
+                UPDATE fuel_seed_queue
+                SET queue_status = ?,
+                    lease_owner = CASE WHEN ? = 'processing' THEN lease_owner END,
+                    lease_expires_at_utc = CASE WHEN ? = 'processing' THEN lease_expires_at_utc END
+                WHERE seed_id = ?
+                  AND lease_owner = ?
+                """,
+                [
+                    (queue_status, queue_status, queue_status, seed_id, lease_owner)
+                    for seed_id, queue_status in pairs
+                ],
+            )
+        if cursor.rowcount != len(pairs):
+            raise SeedConsumerError(f"Expected to update {len(pairs)} rows, updated {cursor.rowcount}")
+    except BaseException:
+        connection.execute("ROLLBACK TO mark_seed_statuses")
+        connection.execute("RELEASE mark_seed_statuses")
+        if commit:
+            connection.rollback()
+        raise
+
+    connection.execute("RELEASE mark_seed_statuses")
+    if commit:
+        connection.commit()
+    return len(pairs)
+
+
+def _retry_delay_seconds(config: SeedRetryConfig, error_class: str, attempt_count: int) -> int:
+    base = dict(config.base_delay_seconds).get(error_class, config.default_base_delay_seconds)
+    # Cap the exponent too so a large attempt_count cannot overflow before the min().
+    return int(min(config.max_delay_seconds, base * 2 ** min(attempt_count - 1, 32)))
+
+
+def _validate_retry_config(config: SeedRetryConfig) -> None:
+    if not isinstance(config, SeedRetryConfig):
+        raise SeedConsumerError("config must be a SeedRetryConfig")
+    if not isinstance(config.max_attempts, int) or config.max_attempts < 1:
+        raise SeedConsumerError("max_attempts must be an int >= 1")
+    if not isinstance(config.default_base_delay_seconds, int) or config.default_base_delay_seconds < 1:
+        raise SeedConsumerError("default_base_delay_seconds must be an int >= 1")
+    if not isinstance(config.max_delay_seconds, int) or config.max_delay_seconds < 1:
+        raise SeedConsumerError("max_delay_seconds must be an int >= 1")
+    for entry in config.base_delay_seconds:
+        if (
+            not isinstance(entry, tuple)
+            or len(entry) != 2
+            or not isinstance(entry[0], str)
+            or not isinstance(entry[1], int)
+            or entry[1] < 1
+        ):
+            raise SeedConsumerError("base_delay_seconds must be (error_class, seconds >= 1) pairs")
+
+
+def record_seed_failure(
+    connection: sqlite3.Connection,
+    seed_id: int,
+    error_class: str,
+    config: SeedRetryConfig,
+    *,
+    commit: bool = True,
+    lease_owner: str | None = None,
+    now_utc: str | None = None,
+) -> str:
+    """Count a failed attempt and either schedule a retry or dead-letter the seed.
+
+    Returns the seed's new queue_status: 'pending' with next_attempt_at_utc set when a
+    retry is scheduled, 'failed' once the seed is dead-lettered. With lease_owner the
+    update only applies while that owner still holds the lease, as in mark_seed_status.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if not isinstance(seed_id, int):
+        raise SeedConsumerError("seed_id must be an int")
+    if not isinstance(error_class, str) or not error_class.strip():
+        raise SeedConsumerError("error_class must be a non-empty string")
+    _validate_retry_config(config)
+
+    error_class = error_class.strip()
+    now = datetime.now(timezone.utc)
+    if now_utc is not None:
+        try:
+            now = datetime.fromisoformat(now_utc.replace("Z", "+00:00"))
+        except (AttributeError, ValueError) as exc:
+            raise SeedConsumerError("now_utc must be an ISO-8601 UTC timestamp") from exc
+
+    row = connection.execute(
+        "SELECT attempt_count FROM fuel_seed_queue WHERE seed_id = ?",
+        (seed_id,),
+    ).fetchone()
+    if row is None:
+        raise SeedConsumerError(f"Unknown seed_id={seed_id}")
+    attempt_count = (row[0] or 0) + 1
+
+    if attempt_count >= config.max_attempts or error_class in config.non_retryable_classes:
+        queue_status = "failed"
+        next_attempt_at_utc = None
+    else:
+        queue_status = "pending"
+        next_attempt_at_utc = _utc_iso(
+            now + timedelta(seconds=_retry_delay_seconds(config, error_class, attempt_count))
+        )
+
+    lease_predicate = ""
+    parameters: list[Any] = [queue_status, attempt_count, next_attempt_at_utc, error_class, seed_id]
+    if lease_owner is not None:
+        lease_predicate = "AND lease_owner = ?"
+        parameters.append(lease_owner)
+    cursor = connection.execute(
+        f"""
+        UPDATE fuel_seed_queue
+        SET queue_status = ?,
+            attempt_count = ?,
+            next_attempt_at_utc = ?,
+            last_error_class = ?,
+            lease_owner = NULL,
+            lease_expires_at_utc = NULL
+        WHERE seed_id = ?
+          {lease_predicate}
+        """,
+        parameters,
+    )
+    if cursor.rowcount != 1:
+        if commit:
+            connection.rollback()
+        raise SeedConsumerError(f"Expected to update 1 row for seed_id={seed_id}, updated {cursor.rowcount}")
+
+    if commit:
+        connection.commit()
+    return queue_status
+
+
+def requeue_dead_lettered_seeds(
+    connection: sqlite3.Connection,
+    marina_uids: list[str] | None = None,
+    *,
+    commit: bool = True,
+) -> int:
+    """Put dead-lettered seeds back to 'pending' with a fresh set of attempts.
+
+    Dead-lettered seeds ('failed' with a last_error_class) are never republished by the
+    seed publishers, so this is the only way back into the queue. marina_uids limits the
+    requeue to those marinas; None requeues every dead letter.
+    """
+    if connection is None:
+        raise SeedConsumerError("connection is required")
+    if marina_uids is not None and (
+        not isinstance(marina_uids, list)
+        or not all(isinstance(marina_uid, str) and marina_uid.strip() for marina_uid in marina_uids)
+    ):
+        raise SeedConsumerError("marina_uids must be a list of non-empty strings or None")
+
+    marina_predicate = ""
+    parameters: list[Any] = []
+    if marina_uids is not None:
+        if not marina_uids:
+            return 0
+        marina_predicate = f"AND marina_uid IN ({', '.join('?' for _ in marina_uids)})"
+        parameters = [marina_uid.strip() for marina_uid in marina_uids]
+    cursor = connection.execute(
+        f"""
+        UPDATE fuel_seed_queue
+        SET queue_status = 'pending',
+            attempt_count = 0,
+            next_attempt_at_utc = NULL,
+            last_error_class = NULL
+        WHERE queue_status = 'failed'
+          AND last_error_class IS NOT NULL
+          {marina_predicate}
+        """,
+        parameters,
+    )
+    if commit:
+        connection.commit()
+    return cursor.rowcount
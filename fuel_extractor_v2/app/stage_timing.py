@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Iterator, TextIO
+
+
+class StageTimingError(Exception):
+    pass
+
+
+STAGES = ("claim", "dockwa_fetch", "extract_fuel", "build_payload", "db_write", "sync_event")
+
+_NULL_STAGE = nullcontext()
+
+
+class NullSeedTimer:
+    """Stand-in used when timings are off: every stage is the same shared no-op context."""
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return _NULL_STAGE
+
+
+NULL_SEED_TIMER = NullSeedTimer()
+
+
+class SeedTimer:
+    """Monotonic per-stage durations for one seed.
+
+    Stages may nest (sync_event runs inside db_write); a stage's recorded time excludes
+    the time spent in stages nested inside it. A seed's stages may run on different
+    threads, but never on two threads at once. The seed's total runs from the timer's
+    creation at claim time, so it also includes time spent waiting for a fetch slot.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.durations: dict[str, float] = {}
+        self._child_seconds: list[float] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if name not in STAGES:
+            raise StageTimingError(f"unknown stage: {name}")
+        self._child_seconds.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._child_seconds.pop()
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed - children
+            if self._child_seconds:
+                self._child_seconds[-1] += elapsed
+
+    def add(self, name: str, seconds: float) -> None:
+        """Charge time measured elsewhere (e.g. a seed's share of a batch claim)."""
+        if name not in STAGES:
+            raise StageTimingError(f"unknown stage: {name}")
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    # Nearest-rank percentile; batches are small enough that interpolation adds nothing.
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class StageTimings:
+    """Collects finished SeedTimers for a run and optionally streams them to a JSONL trace."""
+
+    def __init__(self, trace_path: str | None = None) -> None:
+        if trace_path is not None and (not isinstance(trace_path, str) or not trace_path.strip()):
+            raise StageTimingError("trace_path must be a non-empty string or None")
+        self._samples: dict[str, list[float]] = {stage: [] for stage in STAGES}
+        self._seed_totals: list[float] = []
+        self._trace: TextIO | None = None
+        if trace_path is not None:
+            self._trace = open(trace_path.strip(), "a", encoding="utf-8")
+
+    def record(self, timer: SeedTimer, seed: dict[str, Any], outcome: str) -> None:
+        total_seconds = time.perf_counter() - timer.started_at
+        self._seed_totals.append(total_seconds)
+        for stage_name, seconds in timer.durations.items():
+            self._samples[stage_name].append(seconds)
+
+        if self._trace is not None:
+            entry = {
+                "seed_id": seed.get("seed_id"),
+                "marina_uid": seed.get("marina_uid"),
+                "outcome": outcome,
+                "total_ms": round(total_seconds * 1000.0, 3),
+                "stages_ms": {
+                    stage_name: round(timer.durations[stage_name] * 1000.0, 3)
+                    for stage_name in STAGES
+                    if stage_name in timer.durations
+                },
+            }
+            self._trace.write(json.dumps(entry, sort_keys=True) + "\n")
+
+    def close(self) -> None:
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+    def summary(self) -> dict[str, Any]:
+        """Per-stage count, p50/p95/max and total in milliseconds; stages never hit are omitted."""
+        stages: dict[str, dict[str, Any]] = {}
+        for stage_name in STAGES:
+            values = sorted(self._samples[stage_name])
+            if not values:
+                continue
+            stages[stage_name] = {
+                "count": len(values),
+                "p50_ms": round(_percentile(values, 0.50) * 1000.0, 3),
+                "p95_ms": round(_percentile(values, 0.95) * 1000.0, 3),
+                "max_ms": round(values[-1] * 1000.0, 3),
+                "total_ms": round(sum(values) * 1000.0, 3),
+            }
+
+        seed_totals = sorted(self._seed_totals)
+        seed_summary: dict[str, Any] = {"count": len(seed_totals)}
+        if seed_totals:
+            seed_summary.update(
+                {
+                    "p50_ms": round(_percentile(seed_totals, 0.50) * 1000.0, 3),
+                    "p95_ms": round(_percentile(seed_totals, 0.95) * 1000.0, 3),
+                    "max_ms": round(seed_totals[-1] * 1000.0, 3),
+                }
+            )
+        return {"stages": stages, "seed_total": seed_summary}
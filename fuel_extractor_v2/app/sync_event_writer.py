@@ -4,7 +4,7 @@ import hashlib
 import json
 import sqlite3
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable
 
 
 class SyncEventWriterError(Exception):
@@ -21,6 +21,77 @@ def _compute_hash(data: dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+_VALID_EVENT_TYPES = frozenset(
+    {
+        "new_discovery",
+        "rebrand_detected",
+        "marked_unverified",
+        "dockwa_link_added",
+        "fuel_price_changed",
+        "fetch_blocked",
+    }
+)
+
+_INSERT_SQL = """
+    INSERT INTO sync_events (
+        marina_uid,
+        entity_type,
+        entity_ref,
+        event_type,
+        reason_tag,
+        before_hash,
+        after_hash,
+        sync_dirty_before,
+        sync_dirty_after,
+        master_status_code,
+        master_acknowledged,
+        occurred_at_utc,
+        processed_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _event_row(
+    *,
+    marina_uid: str,
+    entity_type: str,
+    entity_ref: str,
+    event_type: str,
+    reason_tag: str,
+    before_data: dict[str, Any] | None,
+    after_data: dict[str, Any] | None,
+    sync_dirty_before: bool,
+    sync_dirty_after: bool,
+    master_status_code: int | None,
+    master_acknowledged: bool,
+) -> tuple[Any, ...]:
+    """Validate one event and return its sync_events parameters (hashes included)."""
+    if event_type not in _VALID_EVENT_TYPES:
+        raise SyncEventWriterError(f"Invalid event_type: {event_type}")
+
+    if entity_type not in ("marina", "fuel_log"):
+        raise SyncEventWriterError(f"Invalid entity_type: {entity_type}")
+
+    before_hash = _compute_hash(before_data) if before_data else None
+    after_hash = _compute_hash(after_data) if after_data else None
+
+    return (
+        marina_uid,
+        entity_type,
+        entity_ref,
+        event_type,
+        reason_tag,
+        before_hash,
+        after_hash,
+        1 if sync_dirty_before else 0,
+        1 if sync_dirty_after else 0,
+        master_status_code,
+        1 if master_acknowledged else 0,
+        _utc_now_iso(),
+        None,
+    )
+
+
 def write_sync_event(
     connection: sqlite3.Connection,
     *,
@@ -35,6 +106,7 @@ def write_sync_event(
     sync_dirty_after: bool = True,
     master_status_code: int | None = None,
     master_acknowledged: bool = False,
+    commit: bool = True,
 ) -> int:
     """Write a sync event to the audit log.
 
@@ -51,6 +123,7 @@ def write_sync_event(
         sync_dirty_after: Sync state after this event
         master_status_code: HTTP response from Master API if acknowledged
         master_acknowledged: Whether Master API confirmed receipt
+        commit: Commit immediately; pass False to join the caller's transaction
 
     Returns:
         sync_event_id of the inserted row
@@ -58,67 +131,120 @@ def write_sync_event(
     if connection is None:
         raise SyncEventWriterError("connection is required")
 
-    valid_event_types = {
-        "new_discovery",
-        "rebrand_detected",
-        "marked_unverified",
-        "dockwa_link_added",
-        "fuel_price_changed",
-        "fetch_blocked",
-    }
-    if event_type not in valid_event_types:
-        raise SyncEventWriterError(f"Invalid event_type: {event_type}")
-
-    if entity_type not in ("marina", "fuel_log"):
-        raise SyncEventWriterError(f"Invalid entity_type: {entity_type}")
-
-    before_hash = _compute_hash(before_data) if before_data else None
-    after_hash = _compute_hash(after_data) if after_data else None
+    row = _event_row(
+        marina_uid=marina_uid,
+        entity_type=entity_type,
+        entity_ref=entity_ref,
+        event_type=event_type,
+        reason_tag=reason_tag,
+        before_data=before_data,
+        after_data=after_data,
+        sync_dirty_before=sync_dirty_before,
+        sync_dirty_after=sync_dirty_after,
+        master_status_code=master_status_code,
+        master_acknowledged=master_acknowledged,
+    )
 
     cursor = connection.cursor()
-    cursor.execute(
-        """
-        INSERT INTO sync_events (
-            marina_uid,
-            entity_type,
-            entity_ref,
-            event_type,
-            reason_tag,
-            before_hash,
-            after_hash,
-            sync_dirty_before,
-            sync_dirty_after,
-            master_status_code,
-            master_acknowledged,
-            occurred_at_utc,
-            processed_at_utc
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            marina_uid,
-            entity_type,
-            entity_ref,
-            event_type,
-            reason_tag,
-            before_hash,
-            after_hash,
-            1 if sync_dirty_before else 0,
-            1 if sync_dirty_after else 0,
-            master_status_code,
-            1 if master_acknowledged else 0,
-            _utc_now_iso(),
-            None,
-        ),
-    )
+    cursor.execute(_INSERT_SQL, row)
 
     sync_event_id = cursor.lastrowid
     if not isinstance(sync_event_id, int):
         raise SyncEventWriterError("Failed to get sync_event_id")
 
-    connection.commit()
+    if commit:
+        connection.commit()
     return sync_event_id
 
 
+class SyncEventBuffer:
+    """Collect sync events and insert them with one executemany in the caller's transaction.
+
+    add() takes write_sync_event's arguments and validates and hashes immediately, so a
+    bad event raises the same SyncEventWriterError at the call site. Rows are inserted
+    once flush_size events are pending, on flush(), or when the buffer is used as a
+    context manager and the block exits cleanly; a block that raises discards what is
+    still pending. Never commits. A flush that fails is rolled back to its own savepoint
+    and its events are dropped before the error propagates.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, flush_size: int = 500) -> None:
+        if connection is None:
+            raise SyncEventWriterError("connection is required")
+        if not isinstance(flush_size, int) or isinstance(flush_size, bool) or flush_size < 1:
+            raise SyncEventWriterError("flush_size must be an int >= 1")
+
+        self.connection = connection
+        self.flush_size = flush_size
+        self.written_count = 0
+        self._rows: list[tuple[Any, ...]] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self) -> SyncEventBuffer:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._rows.clear()
+
+    def add(
+        self,
+        *,
+        marina_uid: str,
+        entity_type: str,
+        entity_ref: str,
+        event_type: str,
+        reason_tag: str,
+        before_data: dict[str, Any] | None = None,
+        after_data: dict[str, Any] | None = None,
+        sync_dirty_before: bool = False,
+        sync_dirty_after: bool = True,
+        master_status_code: int | None = None,
+        master_acknowledged: bool = False,
+    ) -> None:
+        self._rows.append(
+            _event_row(
+                marina_uid=marina_uid,
+                entity_type=entity_type,
+                entity_ref=entity_ref,
+                event_type=event_type,
+                reason_tag=reason_tag,
+                before_data=before_data,
+                after_data=after_data,
+                sync_dirty_before=sync_dirty_before,
+                sync_dirty_after=sync_dirty_after,
+                master_status_code=master_status_code,
+                master_acknowledged=master_acknowledged,
+            )
+        )
+        if len(self._rows) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Insert every pending event; returns how many were written."""
+        if not self._rows:
+            return 0
+
+        rows, self._rows = self._rows, []
+        connection = self.connection
+        if not connection.in_transaction:
+            connection.execute("BEGIN")
+        connection.execute("SAVEPOINT sync_event_buffer")
+        try:
+            connection.executemany(_INSERT_SQL, rows)
+        except BaseException:
+            connection.execute("ROLLBACK TO sync_event_buffer")
+            connection.execute("RELEASE sync_event_buffer")
+            raise
+        connection.execute("RELEASE sync_event_buffer")
+        self.written_count += len(rows)
+        return len(rows)
+
+
 def mark_sync_event_acknowledged(
     connection: sqlite3.Connection,
     sync_event_id: int,
@@ -145,3 +271,45 @@ def mark_sync_event_acknowledged(
         raise SyncEventWriterError(f"Expected to update 1 row for sync_event_id={sync_event_id}")
 
     connection.commit()
+
+
+def mark_sync_events_acknowledged(
+    connection: sqlite3.Connection,
+    sync_event_ids: Iterable[int],
+    status_code: int,
+    *,
+    commit: bool = True,
+) -> int:
+    """Mark many sync events acknowledged by Master API in one statement batch.
+
+    Events already acknowledged are left as they are, so re-acking a batch the Master API
+    answered twice is harmless. Returns the number of rows newly acknowledged.
+    """
+    if connection is None:
+        raise SyncEventWriterError("connection is required")
+    if not isinstance(status_code, int) or isinstance(status_code, bool):
+        raise SyncEventWriterError("status_code must be an int")
+
+    rows: list[tuple[int, str, int]] = []
+    processed_at = _utc_now_iso()
+    for sync_event_id in sync_event_ids:
+        if not isinstance(sync_event_id, int) or isinstance(sync_event_id, bool):
+            raise SyncEventWriterError("sync_event_ids must be ints")
+        rows.append((status_code, processed_at, sync_event_id))
+    if not rows:
+        return 0
+
+    cursor = connection.executemany(
+        """
+        UPDATE sync_events
+        SET master_acknowledged = 1,
+            master_status_code = ?,
+            processed_at_utc = ?
+        WHERE sync_event_id = ?
+          AND master_acknowledged = 0
+        """,
+        rows,
+    )
+    if commit:
+        connection.commit()
+    return max(cursor.rowcount, 0)
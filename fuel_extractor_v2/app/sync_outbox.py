@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from .sync_event_writer import mark_sync_events_acknowledged
+
+
+class SyncOutboxError(Exception):
+    pass
+
+
+# (url, gzip body, headers, timeout_seconds) -> (HTTP status, decoded JSON body or None)
+BatchSender = Callable[[str, bytes, dict[str, str], float], tuple[int, Any]]
+
+_EVENT_COLUMNS = (
+    "sync_event_id",
+    "marina_uid",
+    "entity_type",
+    "entity_ref",
+    "event_type",
+    "reason_tag",
+    "before_hash",
+    "after_hash",
+    "sync_dirty_before",
+    "sync_dirty_after",
+    "occurred_at_utc",
+)
+
+
+@dataclass(frozen=True)
+class SyncOutboxConfig:
+    """Where and how the shipper sends sync_events.
+
+    Each batch is one gzip-compressed JSON POST to master_url + endpoint_path carrying an
+    Idempotency-Key derived from its event ids, so a batch re-sent after a lost response
+    is recognisable to the Master API. headers are added to every request (auth, boat id).
+    """
+
+    master_url: str
+    endpoint_path: str = "/api/master/sync-events"
+    batch_size: int = 500
+    timeout_seconds: float = 30.0
+    headers: tuple[tuple[str, str], ...] = ()
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _validate_config(config: SyncOutboxConfig) -> None:
+    if not isinstance(config, SyncOutboxConfig):
+        raise SyncOutboxError("config must be a SyncOutboxConfig")
+    if not isinstance(config.master_url, str) or not config.master_url.strip().startswith(("http://", "https://")):
+        raise SyncOutboxError("master_url must be an http(s) URL")
+    if not isinstance(config.endpoint_path, str) or not config.endpoint_path.startswith("/"):
+        raise SyncOutboxError("endpoint_path must start with '/'")
+    if not isinstance(config.batch_size, int) or isinstance(config.batch_size, bool) or config.batch_size < 1:
+        raise SyncOutboxError("batch_size must be an int >= 1")
+    if not isinstance(config.timeout_seconds, (int, float)) or config.timeout_seconds <= 0:
+        raise SyncOutboxError("timeout_seconds must be > 0")
+    for header in config.headers:
+        if not isinstance(header, tuple) or len(header) != 2 or not all(isinstance(part, str) for part in header):
+            raise SyncOutboxError("headers must be (name, value) string pairs")
+
+
+def _post_batch(url: str, body: bytes, headers: dict[str, str], timeout_seconds: float) -> tuple[int, Any]:
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+            status = response.status
+            raw = response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, None
+    try:
+        return status, json.loads(raw.decode("utf-8")) if raw else None
+    except ValueError:
+        return status, None
+
+
+def _read_batch(
+    connection: sqlite3.Connection,
+    after: tuple[str, int] | None,
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    # Keyset walk of idx_sync_events_pending (master_acknowledged, occurred_at_utc); the
+    # rowid tie-break keeps events that share a timestamp in a stable order.
+    columns = ", ".join(_EVENT_COLUMNS)
+    if after is None:
+        rows = connection.execute(
+            f"""
+            SELECT {columns}
+            FROM sync_events
+            WHERE master_acknowledged = 0
+            ORDER BY occurred_at_utc, sync_event_id
+            LIMIT ?
+            """,
+            (batch_size,),
+        ).fetchall()
+    else:
+        rows = connection.execute(
+            f"""
+            SELECT {columns}
+            FROM sync_events
+            WHERE master_acknowledged = 0
+              AND (occurred_at_utc, sync_event_id) > (?, ?)
+            ORDER BY occurred_at_utc, sync_event_id
+            LIMIT ?
+            """,
+            (after[0], after[1], batch_size),
+        ).fetchall()
+    return [dict(zip(_EVENT_COLUMNS, row)) for row in rows]
+
+
+def batch_idempotency_key(events: list[dict[str, Any]]) -> str:
+    """Stable key for a batch: the same events always produce the same key."""
+    event_ids = ",".join(str(event["sync_event_id"]) for event in events)
+    return hashlib.sha256(f"sync_events:{event_ids}".encode("utf-8")).hexdigest()
+
+
+def _accepted_marina_uids(events: list[dict[str, Any]], response_body: Any) -> set[str]:
+    """marina_uids the Master API confirmed with a 200.
+
+    The response may list per-marina outcomes as {"results": {marina_uid: status}}; a
+    marina missing from that map is not confirmed. Without a results map the batch-level
+    200 confirms every marina in it.
+    """
+    batch_marina_uids = {event["marina_uid"] for event in events}
+    results = response_body.get("results") if isinstance(response_body, dict) else None
+    if not isinstance(results, dict):
+        return batch_marina_uids
+    return {marina_uid for marina_uid in batch_marina_uids if results.get(marina_uid) == 200}
+
+
+def _acknowledge_batch(
+    connection: sqlite3.Connection,
+    events: list[dict[str, Any]],
+    accepted_marina_uids: set[str],
+) -> int:
+    """Acknowledge the accepted events in one transaction.
+
+    marinas.sync_dirty is left alone: it belongs to MasterSyncService.js, which still
+    pushes the marina rows themselves and clears the flag once they land.
+    """
+    event_ids = [event["sync_event_id"] for event in events if event["marina_uid"] in accepted_marina_uids]
+    try:
+        acknowledged = mark_sync_events_acknowledged(connection, event_ids, 200, commit=False)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    return acknowledged
+
+
+def ship_sync_events(
+    connection: sqlite3.Connection,
+    config: SyncOutboxConfig,
+    *,
+    max_batches: int | None = None,
+    sender: BatchSender | None = None,
+) -> dict[str, Any]:
+    """Drain unacknowledged sync_events to the Master API, one POST per batch.
+
+    A 200 acknowledges the batch's events (per marina_uid when the response carries a
+    results map) in one transaction.
+    Events the Master API did not confirm stay unacknowledged and are skipped for the
+    rest of this run. Any other status or a transport error stops the run with nothing
+    marked, so the same batch, with the same Idempotency-Key, is sent again next time.
+    """
+    if connection is None:
+        raise SyncOutboxError("connection is required")
+    _validate_config(config)
+    if max_batches is not None and (not isinstance(max_batches, int) or max_batches < 1):
+        raise SyncOutboxError("max_batches must be an int >= 1 or None")
+    if sender is None:
+        sender = _post_batch
+
+    url = config.master_url.strip().rstrip("/") + config.endpoint_path
+    base_headers = {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+        "Accept": "application/json",
+        **dict(config.headers),
+    }
+
+    summary: dict[str, Any] = {
+        "batches_sent": 0,
+        "events_sent": 0,
+        "events_acknowledged": 0,
+        "events_rejected": 0,
+        "bytes_sent": 0,
+        "stopped_reason": "drained",
+        "last_status": None,
+    }
+    after: tuple[str, int] | None = None
+    while max_batches is None or summary["batches_sent"] < max_batches:
+        events = _read_batch(connection, after, config.batch_size)
+        if not events:
+            break
+
+        idempotency_key = batch_idempotency_key(events)
+        payload = {"idempotency_key": idempotency_key, "sent_at_utc": _utc_now_iso(), "events": events}
+        body = gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        headers = {**base_headers, "Idempotency-Key": idempotency_key}
+
+        try:
+            status, response_body = sender(url, body, headers, float(config.timeout_seconds))
+        except Exception as exc:
+            summary["stopped_reason"] = f"transport_error: {type(exc).__name__}: {exc}"[:300]
+            break
+
+        summary["batches_sent"] += 1
+        summary["events_sent"] += len(events)
+        summary["bytes_sent"] += len(body)
+        summary["last_status"] = status
+        if status != 200:
+            summary["stopped_reason"] = f"http_{status}"
+            break
+
+        accepted = _accepted_marina_uids(events, response_body)
+        acknowledged = _acknowledge_batch(connection, events, accepted)
+        summary["events_acknowledged"] += acknowledged
+        summary["events_rejected"] += len(events) - acknowledged
+        after = (events[-1]["occurred_at_utc"], events[-1]["sync_event_id"])
+    else:
+        summary["stopped_reason"] = "max_batches"
+
+    return summary
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+class UnitOfWorkError(Exception):
+    pass
+
+
+class UnitOfWork:
+    """Commit several related writes atomically, optionally grouping units per commit.
+
+    Each ``unit()`` block runs inside a savepoint: if it raises, only that unit's writes
+    are rolled back. Completed units are committed together once ``group_size`` of them
+    have accumulated, on ``flush()``, or when the UnitOfWork is used as a context manager
+    and exits. Writers used inside a unit must be called with ``commit=False``.
+
+    ``before_commit`` runs inside the transaction just before each commit, e.g. to flush
+    rows that units buffered instead of writing directly.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        group_size: int = 1,
+        before_commit: Callable[[], None] | None = None,
+    ) -> None:
+        if connection is None:
+            raise UnitOfWorkError("connection is required")
+        if not isinstance(group_size, int) or isinstance(group_size, bool):
+            raise UnitOfWorkError("group_size must be an int")
+        if group_size < 1:
+            raise UnitOfWorkError("group_size must be >= 1")
+        if before_commit is not None and not callable(before_commit):
+            raise UnitOfWorkError("before_commit must be callable or None")
+
+        self.connection = connection
+        self.group_size = group_size
+        self.before_commit = before_commit
+        self.pending_units = 0
+        self.commit_count = 0
+
+    def __enter__(self) -> UnitOfWork:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Units that finished before a failure are complete and safe to keep.
+        self.flush()
+
+    @contextmanager
+    def unit(self) -> Iterator[sqlite3.Connection]:
+        connection = self.connection
+        if not connection.in_transaction:
+            connection.execute("BEGIN")
+
+        connection.execute("SAVEPOINT unit_of_work")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK TO unit_of_work")
+            connection.execute("RELEASE unit_of_work")
+            raise
+
+        connection.execute("RELEASE unit_of_work")
+        self.pending_units += 1
+        if self.pending_units >= self.group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.before_commit is not None:
+            self.before_commit()
+        if self.connection.in_transaction:
+            self.connection.commit()
+            self.commit_count += 1
+        self.pending_units = 0
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .dockwa_cache import close_http_client
+from .fuel_worker import FuelWorkerOptions, process_pending_seeds
+
+
+class WorkerDaemonError(Exception):
+    pass
+
+
+_COMMANDS = ("wake", "health", "shutdown")
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def default_socket_path(db_path: str) -> str:
+    return str(Path(db_path).resolve().parent / "fuel_worker.sock")
+
+
+def send_daemon_command(socket_path: str, command: str, timeout_seconds: float = 5.0) -> dict[str, Any]:
+    """Send one command to a running daemon and return its JSON reply."""
+    if command not in _COMMANDS:
+        raise WorkerDaemonError(f"command must be one of {'|'.join(_COMMANDS)}")
+    if not isinstance(socket_path, str) or not socket_path.strip():
+        raise WorkerDaemonError("socket_path must be a non-empty string")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout_seconds)
+        client.connect(socket_path)
+        client.sendall(f"{command}\n".encode("utf-8"))
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = client.recv(4096)
+            if not chunk:
+                break
+            reply += chunk
+
+    try:
+        return json.loads(reply.decode("utf-8"))
+    except ValueError as exc:
+        raise WorkerDaemonError(f"Invalid reply from daemon: {reply!r}") from exc
+
+
+def notify_fuel_worker(socket_path: str | None = None) -> bool:
+    """Best-effort wakeup for publishers; returns False when no daemon is listening.
+
+    socket_path defaults to the FUEL_WORKER_SOCKET environment variable.
+    """
+    if socket_path is None:
+        socket_path = os.getenv("FUEL_WORKER_SOCKET")
+    if not socket_path:
+        return False
+    try:
+        send_daemon_command(socket_path, "wake", timeout_seconds=1.0)
+    except (OSError, WorkerDaemonError):
+        return False
+    return True
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: FuelWorkerDaemon = self.server.fuel_worker_daemon  # type: ignore[attr-defined]
+        command = self.rfile.readline(64).decode("utf-8", errors="replace").strip().lower()
+
+        if command == "wake":
+            daemon.wake()
+            reply: dict[str, Any] = {"ok": True, "command": "wake"}
+        elif command == "health":
+            reply = {"ok": True, "command": "health", "health": daemon.health()}
+        elif command == "shutdown":
+            daemon.stop()
+            reply = {"ok": True, "command": "shutdown"}
+        else:
+            reply = {"ok": False, "error": f"unknown command: {command}"}
+
+        self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+
+class _CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class FuelWorkerDaemon:
+    """Resident fuel worker: one warm process and connection draining fuel_seed_queue.
+
+    The main loop drains the queue in batches, then sleeps on an Event until a "wake"
+    arrives on the control socket, a shutdown is requested, or idle_wait_seconds passes
+    (a safety net for deferred seeds and publishers that do not notify). No polling
+    happens while the queue is idle.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int,
+        socket_path: str,
+        options: FuelWorkerOptions | None = None,
+        idle_wait_seconds: float = 300.0,
+    ) -> None:
+        if not isinstance(db_path, str) or not db_path.strip():
+            raise WorkerDaemonError("db_path must be a non-empty string")
+        if not Path(db_path).exists():
+            raise WorkerDaemonError(f"Database file not found: {db_path}")
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise WorkerDaemonError("batch_size must be an int >= 1")
+        if not isinstance(socket_path, str) or not socket_path.strip():
+            raise WorkerDaemonError("socket_path must be a non-empty string")
+        if not isinstance(idle_wait_seconds, (int, float)) or idle_wait_seconds <= 0:
+            raise WorkerDaemonError("idle_wait_seconds must be > 0")
+
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.socket_path = socket_path
+        self.options = options or FuelWorkerOptions()
+        self.idle_wait_seconds = float(idle_wait_seconds)
+
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._status_lock = threading.Lock()
+        self._status: dict[str, Any] = {
+            "pid": os.getpid(),
+            "state": "starting",
+            "started_at_utc": _utc_now_iso(),
+            "last_drain_at_utc": None,
+            "batches": 0,
+            "seeds_processed": 0,
+            "seeds_succeeded": 0,
+            "seeds_failed": 0,
+            "seeds_deferred": 0,
+            "wakeups": 0,
+            "last_error": None,
+        }
+        self._server: _CommandServer | None = None
+
+    def wake(self) -> None:
+        with self._status_lock:
+            self._status["wakeups"] += 1
+        self._wake_event.set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def health(self) -> dict[str, Any]:
+        with self._status_lock:
+            return dict(self._status)
+
+    def _set_status(self, **updates: Any) -> None:
+        with self._status_lock:
+            self._status.update(updates)
+
+    def _start_server(self) -> None:
+        socket_path = Path(self.socket_path)
+        if socket_path.exists():
+            try:
+                send_daemon_command(self.socket_path, "health", timeout_seconds=1.0)
+            except (OSError, WorkerDaemonError):
+                socket_path.unlink()
+            else:
+                raise WorkerDaemonError(f"Another fuel worker daemon is listening on {self.socket_path}")
+
+        server = _CommandServer(self.socket_path, _CommandHandler)
+        server.fuel_worker_daemon = self  # type: ignore[attr-defined]
+        thread = threading.Thread(target=server.serve_forever, name="fuel-worker-control", daemon=True)
+        thread.start()
+        self._server = server
+
+    def _stop_server(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            Path(self.socket_path).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _drain(self, connection: sqlite3.Connection) -> None:
+        self._set_status(state="draining")
+        while not self._stop_event.is_set():
+            try:
+                result = process_pending_seeds(connection, self.batch_size, self.options)
+            except Exception as exc:
+                if connection.in_transaction:
+                    connection.rollback()
+                self._set_status(last_error=f"{type(exc).__name__}: {exc}"[:500])
+                break
+
+            with self._status_lock:
+                self._status["batches"] += 1
+                self._status["seeds_processed"] += result["processed_count"]
+                self._status["seeds_succeeded"] += result["success_count"]
+                self._status["seeds_failed"] += result["failed_count"]
+                self._status["seeds_deferred"] += result["deferred_count"]
+                self._status["last_drain_at_utc"] = _utc_now_iso()
+                if "stage_timings" in result and result["processed_count"] > 0:
+                    self._status["last_stage_timings"] = result["stage_timings"]
+
+            # Nothing claimed, or only deferred seeds: wait for the next wakeup.
+            if result["processed_count"] == 0:
+                break
+
+    def _install_signal_handlers(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for signal_number in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signal_number, lambda _signum, _frame: self.stop())
+
+    def run(self) -> dict[str, Any]:
+        """Serve until stopped; the batch in flight always finishes before exit."""
+        self._install_signal_handlers()
+        self._start_server()
+        connection = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            while not self._stop_event.is_set():
+                self._wake_event.clear()
+                self._drain(connection)
+                if self._stop_event.is_set():
+                    break
+                self._set_status(state="idle")
+                self._wake_event.wait(self.idle_wait_seconds)
+        finally:
+            self._set_status(state="stopping")
+            connection.close()
+            self._stop_server()
+            close_http_client()
+            self._set_status(state="stopped")
+        return self.health()
@@ -0,0 +1,485 @@
+"""Microbenchmark for the compiled contract validators in app/contracts.py.
+
+Generates a deterministic mix of valid and broken seed payloads and extractor outputs.
+It times four ways of validating every row:
+- ``reference``: the hand-written validators the compiled ones replaced, kept below
+- ``compiled``: validate_seed_payload / validate_extractor_output, one call per row
+- ``compiled_batch``: check_seed_payloads / check_extractor_outputs over the whole list
+- ``pydantic``: strict pydantic v2 models of the same contracts, when pydantic is installed
+
+Before timing, every row's error message from the reference and compiled validators is
+compared. Any difference is reported, and the script exits 1.
+
+Usage:
+    python fuel_extractor_v2/benchmarks/contract_validation.py --rows 20000
+    python fuel_extractor_v2/benchmarks/contract_validation.py --invalid-share 0.5 --output run.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+repo_root_str = str(REPO_ROOT)
+if repo_root_str not in sys.path:
+    sys.path.insert(0, repo_root_str)
+
+from fuel_extractor_v2.app.contracts import (
+    _BLOCKED_REASONS,
+    _OUTCOME_STATES,
+    ContractValidationError,
+    check_extractor_outputs,
+    check_seed_payloads,
+    validate_extractor_output,
+    validate_seed_payload,
+)
+
+
+class ContractBenchmarkError(Exception):
+    pass
+
+
+# Reference: the validators as they were before compile_contract, verbatim.
+
+def reference_validate_seed_payload(seed: dict[str, Any]) -> None:
+    if not isinstance(seed, dict):
+        raise ContractValidationError("seed payload must be a dict")
+
+    required_fields = (
+        "marina_uid",
+        "name",
+        "lat",
+        "lon",
+        "fuel_candidate",
+        "seed_reason",
+        "seeded_at_utc",
+    )
+    for field in required_fields:
+        if field not in seed:
+            raise ContractValidationError(f"Missing required seed field: {field}")
+
+    marina_uid = seed.get("marina_uid")
+    if not isinstance(marina_uid, str) or not marina_uid.strip():
+        raise ContractValidationError("marina_uid must be a non-empty string")
+
+    name = seed.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ContractValidationError("name must be a non-empty string")
+
+    lat = seed.get("lat")
+    lon = seed.get("lon")
+    if not isinstance(lat, (float, int)):
+        raise ContractValidationError("lat must be numeric")
+    if not isinstance(lon, (float, int)):
+        raise ContractValidationError("lon must be numeric")
+
+    fuel_candidate = seed.get("fuel_candidate")
+    if fuel_candidate not in (0, 1):
+        raise ContractValidationError("fuel_candidate must be 0 or 1")
+
+    seed_reason = seed.get("seed_reason")
+    if not isinstance(seed_reason, str) or not seed_reason.strip():
+        raise ContractValidationError("seed_reason must be a non-empty string")
+
+    seeded_at_utc = seed.get("seeded_at_utc")
+    if not isinstance(seeded_at_utc, str) or not seeded_at_utc.strip():
+        raise ContractValidationError("seeded_at_utc must be a non-empty string")
+
+    has_source_url = False
+    for url_field in ("dockwa_url", "marinas_url", "website_url"):
+        value = seed.get(url_field)
+        if isinstance(value, str) and value.strip():
+            has_source_url = True
+            break
+
+    if not has_source_url:
+        raise ContractValidationError("At least one source URL is required: dockwa_url, marinas_url, or website_url")
+
+
+def reference_validate_extractor_output(payload: dict[str, Any]) -> None:
+    if not isinstance(payload, dict):
+        raise ContractValidationError("extractor output must be a dict")
+
+    required_fields = (
+        "marina_uid",
+        "outcome_state",
+        "reason_tag",
+        "diesel_price",
+        "gasoline_price",
+        "fuel_dock",
+        "last_updated",
+        "source_url",
+        "source_text",
+        "provenance",
+        "fetched_at_utc",
+    )
+
+    for field in required_fields:
+        if field not in payload:
+            raise ContractValidationError(f"Missing required output field: {field}")
+
+    marina_uid = payload.get("marina_uid")
+    if not isinstance(marina_uid, str) or not marina_uid.strip():
+        raise ContractValidationError("marina_uid must be a non-empty string")
+
+    outcome_state = payload.get("outcome_state")
+    if outcome_state not in _OUTCOME_STATES:
+        raise ContractValidationError("outcome_state is invalid")
+
+    reason_tag = payload.get("reason_tag")
+    if not isinstance(reason_tag, str) or not reason_tag.strip():
+        raise ContractValidationError("reason_tag must be a non-empty string")
+
+    for price_field in ("diesel_price", "gasoline_price"):
+        value = payload.get(price_field)
+        if value is not None and not isinstance(value, (float, int)):
+            raise ContractValidationError(f"{price_field} must be numeric or null")
+
+    fuel_dock = payload.get("fuel_dock")
+    if fuel_dock is not None and not isinstance(fuel_dock, bool):
+        raise ContractValidationError("fuel_dock must be boolean or null")
+
+    last_updated = payload.get("last_updated")
+    if last_updated is not None and not isinstance(last_updated, str):
+        raise ContractValidationError("last_updated must be a string or null")
+
+    source_url = payload.get("source_url")
+    if source_url is not None and not isinstance(source_url, str):
+        raise ContractValidationError("source_url must be a string or null")
+
+    source_text = payload.get("source_text")
+    if source_text is not None and not isinstance(source_text, str):
+        raise ContractValidationError("source_text must be a string or null")
+
+    provenance = payload.get("provenance")
+    if not isinstance(provenance, dict):
+        raise ContractValidationError("provenance must be an object")
+
+    fetched_at_utc = payload.get("fetched_at_utc")
+    if not isinstance(fetched_at_utc, str) or not fetched_at_utc.strip():
+        raise ContractValidationError("fetched_at_utc must be a non-empty string")
+
+    blocked_reason = payload.get("blocked_reason")
+    if blocked_reason is not None and blocked_reason not in _BLOCKED_REASONS:
+        raise ContractValidationError("blocked_reason is invalid")
+
+    if outcome_state == "has_public_price":
+        if payload.get("diesel_price") is None and payload.get("gasoline_price") is None:
+            raise ContractValidationError("has_public_price requires at least one non-null price")
+
+    if outcome_state == "fuel_available_price_hidden":
+        if payload.get("fuel_dock") is not True:
+            raise ContractValidationError("fuel_available_price_hidden requires fuel_dock=true")
+
+    if outcome_state == "fetch_blocked":
+        if blocked_reason is None:
+            raise ContractValidationError("fetch_blocked requires blocked_reason")
+
+
+def _valid_seed(rng: random.Random, index: int) -> dict[str, Any]:
+    seed: dict[str, Any] = {
+        "marina_uid": f"00000000-0000-4000-8000-{index:012d}",
+        "name": f"Marina {index}",
+        "lat": rng.uniform(24.0, 45.0),
+        "lon": rng.uniform(-90.0, -66.0),
+        "fuel_candidate": rng.choice((0, 1)),
+        "seed_reason": "new_discovery",
+        "seeded_at_utc": "2026-10-16T12:00:00Z",
+        "dockwa_url": None,
+        "marinas_url": None,
+        "website_url": None,
+    }
+    url_field = rng.choice(("dockwa_url", "marinas_url", "website_url"))
+    seed[url_field] = f"https://example{index % 97}.test/{url_field}"
+    return seed
+
+
+def _valid_output(rng: random.Random, index: int) -> dict[str, Any]:
+    outcome_state = rng.choice(sorted(_OUTCOME_STATES))
+    output: dict[str, Any] = {
+        "marina_uid": f"00000000-0000-4000-8000-{index:012d}",
+        "outcome_state": outcome_state,
+        "reason_tag": "benchmark",
+        "diesel_price": None,
+        "gasoline_price": None,
+        "fuel_dock": None,
+        "last_updated": None,
+        "source_url": f"https://example{index % 97}.test/fuel",
+        "source_text": "Diesel $4.19",
+        "provenance": {"price_source": "website_text"},
+        "fetched_at_utc": "2026-10-16T12:00:00Z",
+        "blocked_reason": None,
+    }
+    if outcome_state == "has_public_price":
+        output["diesel_price"] = round(rng.uniform(3.0, 6.0), 2)
+    elif outcome_state == "fuel_available_price_hidden":
+        output["fuel_dock"] = True
+    elif outcome_state == "fetch_blocked":
+        output["blocked_reason"] = rng.choice(sorted(_BLOCKED_REASONS))
+    return output
+
+
+# Each breakage sets one field (or deletes it, for _MISSING) to a value one rule rejects.
+_MISSING = object()
+
+_SEED_BREAKAGES = (
+    ("marina_uid", _MISSING),
+    ("name", "   "),
+    ("lat", "24.5"),
+    ("lon", None),
+    ("fuel_candidate", 2),
+    ("fuel_candidate", []),
+    ("seed_reason", 7),
+    ("seeded_at_utc", ""),
+    ("__urls__", None),
+)
+
+_OUTPUT_BREAKAGES = (
+    ("provenance", _MISSING),
+    ("marina_uid", ""),
+    ("outcome_state", "price_maybe"),
+    ("reason_tag", None),
+    ("diesel_price", "4.19"),
+    ("fuel_dock", 1),
+    ("source_url", 42),
+    ("provenance", "{}"),
+    ("fetched_at_utc", " "),
+    ("blocked_reason", "teapot_418"),
+    ("__conditional__", None),
+)
+
+
+def _break(row: dict[str, Any], field: str, value: Any, kind: str) -> dict[str, Any]:
+    row = dict(row)
+    if field == "__urls__":
+        row.update(dockwa_url=None, marinas_url=" ", website_url=None)
+    elif field == "__conditional__":
+        outcome_state = row["outcome_state"]
+        if outcome_state == "has_public_price":
+            row.update(diesel_price=None, gasoline_price=None)
+        elif outcome_state == "fuel_available_price_hidden":
+            row["fuel_dock"] = False
+        else:
+            row.update(outcome_state="fetch_blocked", blocked_reason=None)
+    elif value is _MISSING:
+        del row[field]
+    else:
+        row[field] = value
+    return row
+
+
+def build_rows(count: int, invalid_share: float, seed: int) -> dict[str, list[Any]]:
+    rng = random.Random(seed)
+    seeds: list[Any] = []
+    outputs: list[Any] = []
+    for index in range(count):
+        seed_row = _valid_seed(rng, index)
+        output_row = _valid_output(rng, index)
+        if rng.random() < invalid_share:
+            seed_row = _break(seed_row, *rng.choice(_SEED_BREAKAGES), "seed")
+            output_row = _break(output_row, *rng.choice(_OUTPUT_BREAKAGES), "output")
+        seeds.append(seed_row)
+        outputs.append(output_row)
+    # One non-dict row each, so the type check is covered too.
+    seeds.append(["not", "a", "dict"])
+    outputs.append(None)
+    return {"seed_payload": seeds, "extractor_output": outputs}
+
+
+def _raising_to_messages(validate: Callable[[Any], None]) -> Callable[[list[Any]], list[str | None]]:
+    def run(rows: list[Any]) -> list[str | None]:
+        messages: list[str | None] = []
+        for row in rows:
+            try:
+                validate(row)
+            except ContractValidationError as exc:
+                messages.append(str(exc))
+            else:
+                messages.append(None)
+        return messages
+
+    return run
+
+
+def _pydantic_validators() -> dict[str, Callable[[list[Any]], list[str | None]]] | None:
+    try:
+        from pydantic import BaseModel, ConfigDict, StrictBool, StrictStr, ValidationError, model_validator
+    except ImportError:
+        return None
+    from typing import Literal, Optional, Union
+
+    # Strict models with the same rules as the contracts. Messages differ from the
+    # contracts' own, so only timing is compared for pydantic.
+    class SeedPayloadModel(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        marina_uid: StrictStr
+        name: StrictStr
+        lat: Union[float, int]
+        lon: Union[float, int]
+        fuel_candidate: Literal[0, 1]
+        seed_reason: StrictStr
+        seeded_at_utc: StrictStr
+        dockwa_url: Optional[str] = None
+        marinas_url: Optional[str] = None
+        website_url: Optional[str] = None
+
+        @model_validator(mode="after")
+        def _source_url(self) -> SeedPayloadModel:
+            if not any((url or "").strip() for url in (self.dockwa_url, self.marinas_url, self.website_url)):
+                raise ValueError("At least one source URL is required")
+            if not all(value.strip() for value in (self.marina_uid, self.name, self.seed_reason, self.seeded_at_utc)):
+                raise ValueError("blank string")
+            return self
+
+    class ExtractorOutputModel(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        marina_uid: StrictStr
+        outcome_state: Literal[tuple(sorted(_OUTCOME_STATES))]  # type: ignore[valid-type]
+        reason_tag: StrictStr
+        diesel_price: Optional[Union[float, int]]
+        gasoline_price: Optional[Union[float, int]]
+        fuel_dock: Optional[StrictBool]
+        last_updated: Optional[StrictStr]
+        source_url: Optional[StrictStr]
+        source_text: Optional[StrictStr]
+        provenance: dict
+        fetched_at_utc: StrictStr
+        blocked_reason: Optional[Literal[tuple(sorted(_BLOCKED_REASONS))]] = None  # type: ignore[valid-type]
+
+        @model_validator(mode="after")
+        def _conditional(self) -> ExtractorOutputModel:
+            if not self.marina_uid.strip() or not self.reason_tag.strip() or not self.fetched_at_utc.strip():
+                raise ValueError("blank string")
+            if self.outcome_state == "has_public_price" and self.diesel_price is None and self.gasoline_price is None:
+                raise ValueError("has_public_price requires at least one non-null price")
+            if self.outcome_state == "fuel_available_price_hidden" and self.fuel_dock is not True:
+                raise ValueError("fuel_available_price_hidden requires fuel_dock=true")
+            if self.outcome_state == "fetch_blocked" and self.blocked_reason is None:
+                raise ValueError("fetch_blocked requires blocked_reason")
+            return self
+
+    def wrap(model: type[BaseModel]) -> Callable[[list[Any]], list[str | None]]:
+        validate = model.model_validate
+
+        def run(rows: list[Any]) -> list[str | None]:
+            messages: list[str | None] = []
+            for row in rows:
+                try:
+                    validate(row)
+                except ValidationError as exc:
+                    messages.append(str(exc.errors()[0]["msg"]))
+                else:
+                    messages.append(None)
+            return messages
+
+        return run
+
+    return {"seed_payload": wrap(SeedPayloadModel), "extractor_output": wrap(ExtractorOutputModel)}
+
+
+def _best_ns_per_row(
+    runs: dict[str, Callable[[list[Any]], list[str | None]]],
+    rows: list[Any],
+    repeat: int,
+) -> dict[str, float]:
+    # Validators take turns within each pass, so machine noise hits all of them alike;
+    # the fastest pass per validator is reported.
+    best = {name: float("inf") for name in runs}
+    for _ in range(repeat):
+        for name, run in runs.items():
+            started = time.perf_counter_ns()
+            run(rows)
+            best[name] = min(best[name], time.perf_counter_ns() - started)
+    return {name: round(elapsed / len(rows), 1) for name, elapsed in best.items()}
+
+
+def run_benchmark(rows: int, invalid_share: float, repeat: int, seed: int) -> dict[str, Any]:
+    data = build_rows(rows, invalid_share, seed)
+    validators: dict[str, dict[str, Callable[[list[Any]], list[str | None]]]] = {
+        "seed_payload": {
+            "reference": _raising_to_messages(reference_validate_seed_payload),
+            "compiled": _raising_to_messages(validate_seed_payload),
+            "compiled_batch": check_seed_payloads,
+        },
+        "extractor_output": {
+            "reference": _raising_to_messages(reference_validate_extractor_output),
+            "compiled": _raising_to_messages(validate_extractor_output),
+            "compiled_batch": check_extractor_outputs,
+        },
+    }
+    pydantic_validators = _pydantic_validators()
+    if pydantic_validators is not None:
+        for contract, run in pydantic_validators.items():
+            validators[contract]["pydantic"] = run
+
+    report: dict[str, Any] = {
+        "python": platform.python_version(),
+        "rows": len(data["seed_payload"]),
+        "invalid_share": invalid_share,
+        "repeat": repeat,
+        "pydantic": "installed" if pydantic_validators is not None else "not installed, skipped",
+        "contracts": {},
+    }
+    for contract, runs in validators.items():
+        contract_rows = data[contract]
+        expected = runs["reference"](contract_rows)
+        mismatches = []
+        for name in ("compiled", "compiled_batch"):
+            for index, (want, got) in enumerate(zip(expected, runs[name](contract_rows))):
+                if want != got:
+                    mismatches.append({"validator": name, "row": index, "reference": want, "got": got})
+
+        ns_per_row = _best_ns_per_row(runs, contract_rows, repeat)
+        report["contracts"][contract] = {
+            "invalid_rows": sum(message is not None for message in expected),
+            "ns_per_row": ns_per_row,
+            "speedup_vs_reference": {
+                name: round(ns_per_row["reference"] / value, 2) for name, value in ns_per_row.items() if value > 0
+            },
+            "mismatches": len(mismatches),
+            "mismatch_examples": mismatches[:5],
+        }
+    return report
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Microbenchmark for the compiled contract validators")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows per contract (default: 20000)")
+    parser.add_argument(
+        "--invalid-share", type=float, default=0.1, help="Fraction of rows broken on purpose (default: 0.1)"
+    )
+    parser.add_argument("--repeat", type=int, default=15, help="Timed passes; the best is reported (default: 15)")
+    parser.add_argument("--random-seed", type=int, default=7, help="Seed for the generated rows")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.repeat < 1:
+        raise ContractBenchmarkError("--rows and --repeat must be >= 1")
+    if not 0.0 <= args.invalid_share <= 1.0:
+        raise ContractBenchmarkError("--invalid-share must be between 0 and 1")
+    return args
+
+
+def main() -> int:
+    args = _parse_args()
+    report = run_benchmark(args.rows, args.invalid_share, args.repeat, args.random_seed)
+
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.output:
+        Path(args.output).write_text(rendered + "\n", encoding="utf-8")
+    return 1 if any(contract["mismatches"] for contract in report["contracts"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
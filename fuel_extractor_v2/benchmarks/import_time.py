@@ -0,0 +1,195 @@
+"""Cold-start import benchmark and regression check for the Python CLI entry points.
+
+Each entry point is started in a fresh interpreter with ``-X importtime`` and
+``--help`` (argparse exits right after the module-level imports), so the numbers
+are pure start-up cost.
+
+Usage:
+    python fuel_extractor_v2/benchmarks/import_time.py                  # print report
+    python fuel_extractor_v2/benchmarks/import_time.py --write-baseline # refresh baseline
+    python fuel_extractor_v2/benchmarks/import_time.py --check          # exit 1 on regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BASELINE_PATH = Path(__file__).resolve().parent / "import_time_baseline.json"
+
+ENTRY_POINTS = {
+    "run_fuel_worker_once": "fuel_extractor_v2/run_fuel_worker_once.py",
+    "run_fuel_worker_daemon": "fuel_extractor_v2/run_fuel_worker_daemon.py",
+    "run_pricing_worker_once": "fuel_extractor_v2/run_pricing_worker_once.py",
+    "run_discover_reconcile_seed": "marina_management_v2/run_discover_reconcile_seed.py",
+    "run_geographic_sweep": "marina_management_v2/run_geographic_sweep.py",
+}
+
+# Must only load on the code path that uses them, never at start-up.
+HEAVY_MODULE_PREFIXES = (
+    "fuel_extractor.",
+    "playwright",
+    "fitz",
+    "pymupdf",
+    "markdownify",
+    "pydantic",
+    "httpx",
+    "fireworks",
+)
+
+
+class ImportTimeBenchmarkError(Exception):
+    pass
+
+
+def _parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    imports: list[dict[str, Any]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        raw_name = fields[2].rstrip()
+        imports.append(
+            {
+                "module": raw_name.strip(),
+                "depth": (len(raw_name) - len(raw_name.lstrip())) // 2,
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+            }
+        )
+    return imports
+
+
+def _run_once(script_path: Path) -> tuple[float, list[dict[str, Any]]]:
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", str(script_path), "--help"],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000.0
+    if completed.returncode != 0:
+        raise ImportTimeBenchmarkError(f"{script_path} --help exited with {completed.returncode}: {completed.stderr[-2000:]}")
+    return wall_ms, _parse_importtime(completed.stderr)
+
+
+def measure_entry_point(relative_path: str, runs: int) -> dict[str, Any]:
+    script_path = REPO_ROOT / relative_path
+    if not script_path.exists():
+        raise ImportTimeBenchmarkError(f"entry point not found: {relative_path}")
+
+    wall_samples: list[float] = []
+    import_samples: list[int] = []
+    imports: list[dict[str, Any]] = []
+    for _ in range(runs):
+        wall_ms, imports = _run_once(script_path)
+        wall_samples.append(wall_ms)
+        import_samples.append(sum(entry["cumulative_us"] for entry in imports if entry["depth"] == 0))
+
+    modules = sorted({entry["module"] for entry in imports})
+    top_level = sorted(
+        (entry for entry in imports if entry["depth"] == 0),
+        key=lambda entry: entry["cumulative_us"],
+        reverse=True,
+    )
+    return {
+        "script": relative_path,
+        "runs": runs,
+        "wall_ms_median": round(statistics.median(wall_samples), 1),
+        "import_ms_median": round(statistics.median(import_samples) / 1000.0, 1),
+        "module_count": len(modules),
+        "heavy_modules": [name for name in modules if name.startswith(HEAVY_MODULE_PREFIXES)],
+        "top_imports_ms": {entry["module"]: round(entry["cumulative_us"] / 1000.0, 1) for entry in top_level[:10]},
+    }
+
+
+def build_report(runs: int) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "entry_points": {name: measure_entry_point(path, runs) for name, path in ENTRY_POINTS.items()},
+    }
+
+
+def check_against_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    time_tolerance: float,
+    module_slack: int,
+) -> list[str]:
+    """Return regressions: heavy modules at start-up, extra modules, or slower imports.
+
+    Module counts are deterministic for a given interpreter; import times are noisy and
+    machine-specific, so they only fail beyond ``time_tolerance`` (a fraction) of the
+    baseline plus 5 ms.
+    """
+    problems: list[str] = []
+    baseline_entries = baseline.get("entry_points", {})
+    for name, current in report["entry_points"].items():
+        if current["heavy_modules"]:
+            problems.append(f"{name}: heavy modules imported at start-up: {', '.join(current['heavy_modules'])}")
+
+        previous = baseline_entries.get(name)
+        if previous is None:
+            continue
+        if current["module_count"] > previous["module_count"] + module_slack:
+            problems.append(f"{name}: module_count {current['module_count']} > baseline {previous['module_count']}")
+        limit_ms = previous["import_ms_median"] * (1.0 + time_tolerance) + 5.0
+        if current["import_ms_median"] > limit_ms:
+            problems.append(f"{name}: import_ms_median {current['import_ms_median']} > limit {limit_ms:.1f}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start import benchmark for CLI entry points")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point (default: 5)")
+    parser.add_argument("--check", action="store_true", help="Compare against the committed baseline")
+    parser.add_argument("--write-baseline", action="store_true", help="Overwrite the committed baseline")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed fractional import-time growth before --check fails (default: 0.5)",
+    )
+    parser.add_argument(
+        "--module-slack",
+        type=int,
+        default=5,
+        help="Extra start-up modules tolerated before --check fails (default: 5)",
+    )
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        raise ImportTimeBenchmarkError("--runs must be >= 1")
+
+    report = build_report(args.runs)
+    print(json.dumps(report, indent=2))
+
+    if args.write_baseline:
+        BASELINE_PATH.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.check:
+        if not BASELINE_PATH.exists():
+            raise ImportTimeBenchmarkError(f"baseline not found: {BASELINE_PATH}")
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        problems = check_against_baseline(report, baseline, args.time_tolerance, args.module_slack)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        if problems:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
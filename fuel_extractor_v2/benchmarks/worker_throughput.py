@@ -0,0 +1,503 @@
+"""Offline throughput benchmark for process_pending_seeds.
+
+Builds a synthetic database from PHASE_1_SCHEMA.sql, starts a local stand-in HTTP
+server (in its own process) with configurable latency, error and 429 rates, and points
+the worker's two network seams, ``fuel_worker._fetch_dockwa_fuel_snapshot`` and
+``fuel_worker._extract_fuel``, at it. The queue is then drained batch by batch exactly
+like the resident worker does, and the run is reported as JSON: seeds/second,
+per-seed latency percentiles, SQLite commits per seed and peak RSS.
+
+Usage:
+    python fuel_extractor_v2/benchmarks/worker_throughput.py --seeds 5000 --max-workers 8
+    python fuel_extractor_v2/benchmarks/worker_throughput.py --output run.json
+    python fuel_extractor_v2/benchmarks/worker_throughput.py --compare run.json  # deltas vs. an earlier run
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import random
+import resource
+import sqlite3
+import sys
+import tempfile
+import time
+import types
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+import zlib
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCHEMA_PATH = REPO_ROOT / "fuel_extractor_v2" / "PHASE_1_SCHEMA.sql"
+
+repo_root_str = str(REPO_ROOT)
+if repo_root_str not in sys.path:
+    sys.path.insert(0, repo_root_str)
+
+
+class WorkerBenchmarkError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class StandInConfig:
+    """Behaviour of the stand-in server. Rates are per request and deterministic per URL."""
+
+    latency_ms: float = 20.0
+    latency_jitter_ms: float = 10.0
+    error_rate: float = 0.02
+    rate_limit_rate: float = 0.01
+    dockwa_price_rate: float = 0.8
+    website_price_rate: float = 0.5
+    website_hidden_rate: float = 0.3
+    seed: int = 7
+
+
+def _roll(config: StandInConfig, path: str, salt: str) -> float:
+    # Deterministic pseudo-random draw per (URL, purpose) so repeated runs see the same world.
+    return random.Random(zlib.crc32(f"{config.seed}:{salt}:{path}".encode("utf-8"))).random()
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        config: StandInConfig = self.server.stand_in_config  # type: ignore[attr-defined]
+        path = urllib.parse.urlsplit(self.path).path
+        request_count = self.server.request_count  # type: ignore[attr-defined]
+        request_count[path] = request_count.get(path, 0) + 1
+        attempt = str(request_count[path])
+
+        jitter = (_roll(config, path, "jitter" + attempt) * 2.0 - 1.0) * config.latency_jitter_ms
+        time.sleep(max(0.0, config.latency_ms + jitter) / 1000.0)
+
+        if _roll(config, path, "429" + attempt) < config.rate_limit_rate:
+            self._send_json(429, {"error": "too many requests"})
+            return
+        if _roll(config, path, "error" + attempt) < config.error_rate:
+            self._send_json(503, {"error": "service unavailable"})
+            return
+
+        if path.startswith("/dockwa/"):
+            if _roll(config, path, "price") < config.dockwa_price_rate:
+                diesel = round(3.5 + _roll(config, path, "diesel") * 2.0, 2)
+                self._send_json(200, {"diesel_price": diesel, "gasoline_price": None, "source_text": f"Diesel ${diesel}"})
+            else:
+                self._send_json(200, {"diesel_price": None, "gasoline_price": None})
+            return
+
+        if path.startswith("/site/"):
+            outcome_roll = _roll(config, path, "outcome")
+            if outcome_roll < config.website_price_rate:
+                diesel = round(3.5 + _roll(config, path, "diesel") * 2.0, 2)
+                self._send_json(200, {"outcome": "price", "diesel_price": diesel})
+            elif outcome_roll < config.website_price_rate + config.website_hidden_rate:
+                self._send_json(200, {"outcome": "hidden"})
+            else:
+                self._send_json(200, {"outcome": "none"})
+            return
+
+        self._send_json(404, {"error": "unknown path"})
+
+
+def _serve_stand_in(config: StandInConfig, port_queue: Any) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.daemon_threads = True
+    server.request_queue_size = 256
+    server.stand_in_config = config  # type: ignore[attr-defined]
+    server.request_count = {}  # type: ignore[attr-defined]
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_stand_in_server(config: StandInConfig) -> tuple[multiprocessing.Process, str]:
+    """Run the stand-in server in a child process so it does not count toward worker RSS."""
+    port_queue: Any = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve_stand_in, args=(config, port_queue), daemon=True)
+    process.start()
+    port = port_queue.get(timeout=10)
+    return process, f"http://127.0.0.1:{port}"
+
+
+def _stand_in_path(url: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    host = (parts.hostname or "unknown").lower()
+    if host.endswith("dockwa.com"):
+        return "/dockwa/" + parts.path.rstrip("/").rsplit("/", 1)[-1]
+    return f"/site/{host}{parts.path or '/'}"
+
+
+def _get_json(base_url: str, url: str, timeout_seconds: float) -> tuple[int, dict[str, Any]]:
+    request = urllib.request.Request(base_url + _stand_in_path(url), method="GET")
+    try:
+        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+            return response.status, json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as exc:
+        return exc.code, {}
+
+
+def install_stand_in_network(base_url: str) -> None:
+    """Route the worker's Dockwa and extract_fuel seams to the stand-in server.
+
+    fuel_extractor is not needed: when it is not installed, ExtractRequest resolves to a
+    plain attribute bag with the same keyword constructor.
+    """
+    from fuel_extractor_v2.app import fuel_worker
+
+    try:
+        import fuel_extractor.app.schemas  # noqa: F401
+    except ImportError:
+        for name in ("fuel_extractor", "fuel_extractor.app"):
+            sys.modules.setdefault(name, types.ModuleType(name))
+        schemas = types.ModuleType("fuel_extractor.app.schemas")
+        schemas.ExtractRequest = types.SimpleNamespace  # type: ignore[attr-defined]
+        schemas.ExtractResponse = types.SimpleNamespace  # type: ignore[attr-defined]
+        sys.modules["fuel_extractor.app.schemas"] = schemas
+
+    def fetch_dockwa_fuel_snapshot(dockwa_url: str, timeout_seconds: int) -> Any:
+        status, payload = _get_json(base_url, dockwa_url, timeout_seconds)
+        if status != 200:
+            raise WorkerBenchmarkError(f"dockwa stand-in returned HTTP {status}")
+        return payload
+
+    def extract_fuel(request: Any) -> Any:
+        status, payload = _get_json(base_url, request.website_url, request.timeout_seconds)
+        extraction = types.SimpleNamespace(
+            diesel_price=None,
+            gasoline_price=None,
+            fuel_dock=None,
+            source_url=request.website_url,
+            source_text=None,
+            last_updated=None,
+            confidence=0.0,
+        )
+        evidence = types.SimpleNamespace(source_url=request.website_url)
+        if status != 200:
+            error_code = "DISCOVERY_ERROR" if status == 429 else "CONVERSION_ERROR"
+            return types.SimpleNamespace(
+                status="error",
+                error_code=error_code,
+                reason=f"HTTP {status}",
+                extraction=extraction,
+                evidence=evidence,
+            )
+
+        outcome = payload.get("outcome")
+        if outcome == "price":
+            extraction.diesel_price = payload.get("diesel_price")
+            extraction.fuel_dock = True
+            extraction.source_text = f"Diesel ${extraction.diesel_price}"
+            extraction.confidence = 0.8
+        elif outcome == "hidden":
+            extraction.fuel_dock = True
+            extraction.confidence = 0.6
+        return types.SimpleNamespace(
+            status="ok",
+            error_code=None,
+            reason=None,
+            extraction=extraction,
+            evidence=evidence,
+        )
+
+    fuel_worker._fetch_dockwa_fuel_snapshot = fetch_dockwa_fuel_snapshot
+    fuel_worker._extract_fuel = extract_fuel
+
+
+class CountingConnection(sqlite3.Connection):
+    """sqlite3 connection that counts commits issued by the worker."""
+
+    commit_count = 0
+
+    def commit(self) -> None:
+        if self.in_transaction:
+            self.commit_count += 1
+        super().commit()
+
+
+def build_synthetic_db(db_path: str, seed_count: int, host_count: int, dockwa_share: float, seed: int) -> None:
+    """Create db_path from PHASE_1_SCHEMA.sql with seed_count marinas, each with one pending seed."""
+    if not SCHEMA_PATH.exists():
+        raise WorkerBenchmarkError(f"Schema file not found: {SCHEMA_PATH}")
+
+    rng = random.Random(seed)
+    created_at_utc = "2026-01-01T00:00:00Z"
+    marinas: list[tuple[Any, ...]] = []
+    seeds: list[tuple[Any, ...]] = []
+    for index in range(seed_count):
+        marina_uid = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        website_url = f"https://marina{index % host_count}.bench.invalid/m{index}"
+        dockwa_url = None
+        if rng.random() < dockwa_share:
+            dockwa_url = f"https://dockwa.com/explore/destination/bench-{index}"
+        lat = 24.0 + rng.random() * 6.0
+        lon = -82.0 + rng.random() * 4.0
+        marinas.append(
+            (marina_uid, f"Bench Marina {index}", lat, lon, website_url, dockwa_url, created_at_utc, created_at_utc)
+        )
+        seeds.append(
+            (
+                marina_uid,
+                f"Bench Marina {index}",
+                lat,
+                lon,
+                website_url,
+                dockwa_url,
+                f"2026-01-01T{index // 3600 % 24:02d}:{index // 60 % 60:02d}:{index % 60:02d}Z",
+            )
+        )
+
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+        connection.executemany(
+            """
+            INSERT INTO marinas (
+                marina_uid, primary_name, lat, lon, website_url, dockwa_url, aliases_json,
+                verification_state, missing_from_web_count, fuel_candidate, sync_dirty,
+                created_at_utc, updated_at_utc
+            ) VALUES (?, ?, ?, ?, ?, ?, '[]', 'verified', 0, 1, 0, ?, ?)
+            """,
+            marinas,
+        )
+        connection.executemany(
+            """
+            INSERT INTO fuel_seed_queue (
+                marina_uid, name, lat, lon, website_url, dockwa_url, fuel_candidate,
+                seed_reason, seeded_at_utc, priority_hint, queue_status
+            ) VALUES (?, ?, ?, ?, ?, ?, 1, 'benchmark', ?, 'normal', 'pending')
+            """,
+            seeds,
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    divisor = 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+    return round(peak / divisor, 1)
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    from fuel_extractor_v2.app.fuel_worker import FuelWorkerOptions, process_pending_seeds
+    from fuel_extractor_v2.app.host_throttle import HostThrottleConfig
+
+    stand_in = StandInConfig(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.random_seed,
+    )
+    work_dir = Path(tempfile.mkdtemp(prefix="fuel_worker_bench_"))
+    db_path = args.db_path or str(work_dir / "bench.db")
+    trace_path = str(work_dir / "seed_trace.jsonl")
+
+    build_started = time.perf_counter()
+    build_synthetic_db(db_path, args.seeds, args.hosts, args.dockwa_share, args.random_seed)
+    build_seconds = time.perf_counter() - build_started
+
+    server_process, base_url = start_stand_in_server(stand_in)
+    try:
+        install_stand_in_network(base_url)
+        options = FuelWorkerOptions(
+            max_workers=args.max_workers,
+            group_commit_size=args.group_commit_size,
+            coalesce_observations=args.coalesce_observations,
+            throttle=HostThrottleConfig() if args.host_throttle else None,
+            timing_trace_path=trace_path,
+            hedge_delay_seconds=args.hedge_delay_seconds,
+        )
+
+        connection = sqlite3.connect(db_path, factory=CountingConnection)
+        totals = {"batches": 0, "processed": 0, "succeeded": 0, "failed": 0, "deferred": 0}
+        stage_summaries: list[dict[str, Any]] = []
+        started = time.perf_counter()
+        try:
+            while True:
+                result = process_pending_seeds(connection, args.batch_size, options)
+                totals["batches"] += 1
+                totals["processed"] += result["processed_count"]
+                totals["succeeded"] += result["success_count"]
+                totals["failed"] += result["failed_count"]
+                totals["deferred"] += result["deferred_count"]
+                stage_summaries.append(result.get("stage_timings", {}))
+                if result["processed_count"] == 0:
+                    break
+            elapsed_seconds = time.perf_counter() - started
+            commit_count = connection.commit_count
+            # Seeds the throttle or cooldown pushed past the end of the run stay pending.
+            remaining_pending = connection.execute(
+                "SELECT COUNT(*) FROM fuel_seed_queue WHERE queue_status = 'pending'"
+            ).fetchone()[0]
+        finally:
+            connection.close()
+    finally:
+        server_process.terminate()
+        server_process.join(timeout=5)
+
+    seed_latencies: list[float] = []
+    stage_samples: dict[str, list[float]] = {}
+    with open(trace_path, encoding="utf-8") as trace_file:
+        for line in trace_file:
+            entry = json.loads(line)
+            if entry.get("outcome") == "deferred":
+                continue
+            seed_latencies.append(entry["total_ms"])
+            for stage_name, stage_ms in entry.get("stages_ms", {}).items():
+                stage_samples.setdefault(stage_name, []).append(stage_ms)
+    seed_latencies.sort()
+
+    processed = max(totals["processed"], 1)
+    return {
+        "benchmark": "fuel_worker_throughput",
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "config": {
+            "seeds": args.seeds,
+            "hosts": args.hosts,
+            "dockwa_share": args.dockwa_share,
+            "batch_size": args.batch_size,
+            "max_workers": args.max_workers,
+            "group_commit_size": args.group_commit_size,
+            "coalesce_observations": args.coalesce_observations,
+            "host_throttle": args.host_throttle,
+            "hedge_delay_seconds": args.hedge_delay_seconds,
+            "stand_in": asdict(stand_in),
+        },
+        "results": {
+            "elapsed_seconds": round(elapsed_seconds, 3),
+            "db_build_seconds": round(build_seconds, 3),
+            "seeds_per_second": round(totals["processed"] / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0,
+            **totals,
+            "remaining_pending": remaining_pending,
+            "commits": commit_count,
+            "commits_per_seed": round(commit_count / processed, 3),
+            "seed_latency_ms": {
+                "p50": round(_percentile(seed_latencies, 0.50), 3),
+                "p95": round(_percentile(seed_latencies, 0.95), 3),
+                "p99": round(_percentile(seed_latencies, 0.99), 3),
+                "max": round(seed_latencies[-1], 3) if seed_latencies else 0.0,
+            },
+            "stage_p95_ms": {
+                stage_name: round(_percentile(sorted(values), 0.95), 3)
+                for stage_name, values in sorted(stage_samples.items())
+            },
+            "peak_rss_mb": _peak_rss_mb(),
+        },
+    }
+
+
+# Metrics compared by --compare and whether a larger value is an improvement.
+_COMPARED_METRICS = (
+    ("seeds_per_second", True),
+    ("commits_per_seed", False),
+    ("peak_rss_mb", False),
+)
+
+
+def compare_reports(current: dict[str, Any], previous: dict[str, Any]) -> dict[str, Any]:
+    """Relative change of the headline metrics; positive improvement_pct is better."""
+    comparison: dict[str, Any] = {}
+    current_results = current["results"]
+    previous_results = previous.get("results", {})
+    pairs = [(name, current_results.get(name), previous_results.get(name), higher) for name, higher in _COMPARED_METRICS]
+    for percentile in ("p50", "p95", "p99"):
+        pairs.append(
+            (
+                f"seed_latency_{percentile}_ms",
+                current_results["seed_latency_ms"].get(percentile),
+                previous_results.get("seed_latency_ms", {}).get(percentile),
+                False,
+            )
+        )
+    for name, now_value, then_value, higher_is_better in pairs:
+        if not isinstance(now_value, (int, float)) or not isinstance(then_value, (int, float)) or then_value == 0:
+            continue
+        change = (now_value - then_value) / then_value * 100.0
+        comparison[name] = {
+            "previous": then_value,
+            "current": now_value,
+            "improvement_pct": round(change if higher_is_better else -change, 1),
+        }
+    return comparison
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline throughput benchmark for the fuel worker")
+    parser.add_argument("--seeds", type=int, default=2000, help="Synthetic marinas/seeds (default: 2000)")
+    parser.add_argument("--hosts", type=int, default=400, help="Distinct website hosts (default: 400)")
+    parser.add_argument("--dockwa-share", type=float, default=0.5, help="Fraction of seeds with a Dockwa URL")
+    parser.add_argument("--batch-size", type=int, default=100, help="Seeds per process_pending_seeds call")
+    parser.add_argument("--max-workers", type=int, default=8, help="FuelWorkerOptions.max_workers (default: 8)")
+    parser.add_argument("--group-commit-size", type=int, default=25, help="FuelWorkerOptions.group_commit_size")
+    parser.add_argument("--coalesce-observations", action="store_true", help="Enable observation coalescing")
+    parser.add_argument("--host-throttle", action="store_true", help="Keep the per-host throttle on (off by default)")
+    parser.add_argument("--hedge-delay-seconds", type=float, help="FuelWorkerOptions.hedge_delay_seconds")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Stand-in response latency (default: 20)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=10.0, help="Uniform +/- jitter (default: 10)")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="Fraction of 503 responses (default: 0.02)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.01, help="Fraction of 429 responses (default: 0.01)")
+    parser.add_argument("--random-seed", type=int, default=7, help="Seed for the synthetic data and stand-in")
+    parser.add_argument("--db-path", help="Where to build the synthetic DB (default: a temp directory)")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--compare", help="Earlier JSON report to compute deltas against")
+    args = parser.parse_args()
+
+    if args.seeds < 1 or args.hosts < 1 or args.batch_size < 1 or args.max_workers < 1 or args.group_commit_size < 1:
+        raise WorkerBenchmarkError("--seeds, --hosts, --batch-size, --max-workers and --group-commit-size must be >= 1")
+    for name in ("dockwa_share", "error_rate", "rate_limit_rate"):
+        if not 0.0 <= getattr(args, name) <= 1.0:
+            raise WorkerBenchmarkError(f"--{name.replace('_', '-')} must be between 0 and 1")
+    if args.db_path and Path(args.db_path).exists():
+        raise WorkerBenchmarkError(f"--db-path already exists: {args.db_path}")
+    return args
+
+
+def main() -> int:
+    args = _parse_args()
+    report = run_benchmark(args)
+    if args.compare:
+        previous = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        report["comparison"] = compare_reports(report, previous)
+
+    rendered = json.dumps(report, indent=2)
+    print(rendered)
+    if args.output:
+        Path(args.output).write_text(rendered + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -13,16 +14,98 @@ repo_root_str = str(REPO_ROOT)
 if repo_root_str not in sys.path:
     sys.path.insert(0, repo_root_str)
 
-from fuel_extractor_v2.app.fuel_worker import process_pending_seeds_in_db
+from fuel_extractor_v2.app.fuel_worker import FuelWorkerOptions, process_pending_seeds_in_db
+from fuel_extractor_v2.app.seed_consumer import SeedRetryConfig
 
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run fuel_extractor_v2 worker once")
     parser.add_argument("--db-path", required=True, help="Path to SQLite DB")
     parser.add_argument("--batch-size", type=int, required=True, help="Max pending seeds to process")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Seeds fetched concurrently; SQLite writes stay on one connection (default: 1)",
+    )
+    parser.add_argument(
+        "--group-commit-size",
+        type=int,
+        default=1,
+        help="Finished seeds committed per transaction (default: 1)",
+    )
+    parser.add_argument(
+        "--dockwa-cache-dir",
+        help="Conditional-GET cache for Dockwa snapshots (default: dockwa_http_cache next to the DB)",
+    )
+    parser.add_argument(
+        "--no-dockwa-cache",
+        action="store_true",
+        help="Always download and parse Dockwa pages in full",
+    )
+    parser.add_argument(
+        "--coalesce-observations",
+        action="store_true",
+        help="Extend the latest fuel_log row when the outcome is unchanged instead of inserting",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        default=30 * 60,
+        help="How long claimed seeds stay leased before another worker may reclaim them",
+    )
+    parser.add_argument(
+        "--no-host-throttle",
+        action="store_true",
+        help="Disable per-host rate limiting and blocked_reason backoff",
+    )
+    parser.add_argument(
+        "--no-fuel-cooldown",
+        action="store_true",
+        help="Keep re-crawling marinas that repeatedly hide their fuel price",
+    )
+    parser.add_argument(
+        "--no-adaptive-budget",
+        action="store_true",
+        help="Use the fixed 45 s / 8 page extract_fuel budget instead of per-host learned budgets",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=5,
+        help="Failed attempts before a seed is dead-lettered as 'failed' (default: 5)",
+    )
+    parser.add_argument(
+        "--no-retry",
+        action="store_true",
+        help="Mark failed seeds 'failed' at once instead of retrying them with backoff",
+    )
+    parser.add_argument(
+        "--hedge-delay-seconds",
+        type=float,
+        help="Start extract_fuel alongside a Dockwa fetch that has not answered after this many seconds",
+    )
+    parser.add_argument(
+        "--stage-timings",
+        action="store_true",
+        help="Report per-stage p50/p95/max timings (claim, fetch, extract, DB write) in the result",
+    )
+    parser.add_argument(
+        "--timing-trace",
+        help="Append one JSONL line per seed with its stage timings to this file (implies --stage-timings)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print one JSON line per committed seed outcome, then a final summary line",
+    )
     return parser.parse_args()
 
 
+def _print_json_line(payload: dict) -> None:
+    print(json.dumps(payload, separators=(",", ":")), flush=True)
+
+
 def main() -> None:
     args = _parse_args()
 
@@ -33,9 +116,58 @@ def main() -> None:
         raise RuntimeError("--db-path is required")
     if not isinstance(batch_size, int) or batch_size < 1:
         raise RuntimeError("--batch-size must be >= 1")
+    if not isinstance(args.max_workers, int) or args.max_workers < 1:
+        raise RuntimeError("--max-workers must be >= 1")
+    if not isinstance(args.group_commit_size, int) or args.group_commit_size < 1:
+        raise RuntimeError("--group-commit-size must be >= 1")
+    if not isinstance(args.lease_seconds, int) or args.lease_seconds < 1:
+        raise RuntimeError("--lease-seconds must be >= 1")
+    if not isinstance(args.max_attempts, int) or args.max_attempts < 1:
+        raise RuntimeError("--max-attempts must be >= 1")
+    if args.hedge_delay_seconds is not None and args.hedge_delay_seconds < 0:
+        raise RuntimeError("--hedge-delay-seconds must be >= 0")
+
+    dockwa_cache_dir = None
+    if not args.no_dockwa_cache:
+        dockwa_cache_dir = args.dockwa_cache_dir or str(Path(db_path.strip()).resolve().parent / "dockwa_http_cache")
+
+    options = FuelWorkerOptions(
+        max_workers=args.max_workers,
+        group_commit_size=args.group_commit_size,
+        dockwa_cache_dir=dockwa_cache_dir,
+        coalesce_observations=args.coalesce_observations,
+        lease_seconds=args.lease_seconds,
+        stage_timings=args.stage_timings,
+        timing_trace_path=args.timing_trace,
+        hedge_delay_seconds=args.hedge_delay_seconds,
+    )
+    if args.no_host_throttle:
+        options = replace(options, throttle=None)
+    if args.no_fuel_cooldown:
+        options = replace(options, cooldown=None)
+    if args.no_adaptive_budget:
+        options = replace(options, budget=None)
+    if args.no_retry:
+        options = replace(options, retry=None)
+    else:
+        options = replace(options, retry=SeedRetryConfig(max_attempts=args.max_attempts))
+    if not args.stream:
+        result = process_pending_seeds_in_db(db_path=db_path.strip(), batch_size=batch_size, options=options)
+        print(json.dumps(result, indent=2))
+        return
 
-    result = process_pending_seeds_in_db(db_path=db_path.strip(), batch_size=batch_size)
-    print(json.dumps(result, indent=2))
+    try:
+        result = process_pending_seeds_in_db(
+            db_path=db_path.strip(),
+            batch_size=batch_size,
+            options=options,
+            on_seed_outcome=_print_json_line,
+        )
+    except Exception as exc:
+        # Seed lines already printed are committed; tell the reader the run stopped early.
+        _print_json_line({"event": "error", "error": f"{type(exc).__name__}: {exc}"})
+        raise
+    _print_json_line({"event": "summary", **result})
 
 
 if __name__ == "__main__":
@@ -11,7 +11,12 @@ Usage:
     --marina-uid <uuid> \
     --website-url <url> \
     [--timeout 45] \
-    [--max-pages 20]
+    [--max-pages 20] \
+    [--llm-cache-dir /path/to/pricing_llm_cache | --no-llm-cache]
+
+Extractions are cached by prompt version, model and pruned site markdown in
+pricing_llm_cache/ next to the database, so an unchanged site is not sent to the LLM
+again. The cache is pruned after every run.
 """
 
 import argparse
@@ -24,7 +29,10 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.pricing_worker import extract_pricing_with_deepseek, PricingWorkerError
+from app.change_log import ensure_change_log_schema
+from app.latest_state import ensure_latest_state_schema
+from app.pricing_cache import prompt_digest, prune_pricing_cache
+from app.pricing_worker import PRICING_SYSTEM_PROMPT, extract_pricing_with_deepseek, PricingWorkerError
 
 
 def main():
@@ -34,8 +42,21 @@ def main():
     parser.add_argument("--website-url", required=True, help="Marina website URL")
     parser.add_argument("--timeout", type=int, default=45, help="Timeout in seconds")
     parser.add_argument("--max-pages", type=int, default=20, help="Max pages to crawl")
+    parser.add_argument(
+        "--llm-cache-dir",
+        default=None,
+        help="Directory for cached extractions (default: pricing_llm_cache next to the database)",
+    )
+    parser.add_argument("--no-llm-cache", action="store_true", help="Always call the LLM and cache nothing")
+    parser.add_argument("--llm-cache-max-age-days", type=float, default=90.0, help="Evict entries unused this long")
+    parser.add_argument("--llm-cache-max-mb", type=int, default=64, help="Evict least recently used entries above this size")
 
     args = parser.parse_args()
+    # Checked before any crawl or LLM call, so a bad value cannot waste a paid extraction.
+    if args.llm_cache_max_age_days <= 0:
+        parser.error("--llm-cache-max-age-days must be > 0")
+    if args.llm_cache_max_mb < 0:
+        parser.error("--llm-cache-max-mb must be >= 0")
 
     try:
         # Upgrade HTTP to HTTPS
@@ -43,11 +64,16 @@ def main():
         if website_url.startswith("http://"):
             website_url = "https://" + website_url[7:]
         
+        cache_dir = None
+        if not args.no_llm_cache:
+            cache_dir = args.llm_cache_dir or str(Path(args.db_path).resolve().parent / "pricing_llm_cache")
+
         # Extract pricing data
         pricing_data = extract_pricing_with_deepseek(
             base_url=website_url,
             timeout_seconds=args.timeout,
             max_pages=args.max_pages,
+            cache_dir=cache_dir,
         )
 
         # Add marina_uid
@@ -71,6 +97,10 @@ def main():
             print(json.dumps({"error": "pricing_logs table does not exist in database"}))
             sys.exit(1)
 
+        # Keeps marina_pricing_latest current for databases created before it existed
+        ensure_latest_state_schema(conn)
+        ensure_change_log_schema(conn)
+
         # Insert pricing log
         cursor.execute(
             """
@@ -113,7 +143,16 @@ def main():
             "pricing_log_id": pricing_log_id,
             "marina_uid": args.marina_uid,
             "fetched_at_utc": pricing_data.get("fetched_at_utc"),
+            "llm_cache_hit": pricing_data.get("llm_cache_hit", False),
         }
+        if cache_dir is not None:
+            # Entries from an older PRICING_SYSTEM_PROMPT can never hit again; drop them.
+            result["llm_cache_pruned"] = prune_pricing_cache(
+                cache_dir,
+                max_age_days=args.llm_cache_max_age_days,
+                max_total_bytes=args.llm_cache_max_mb * 1024 * 1024,
+                current_prompt_version=prompt_digest(PRICING_SYSTEM_PROMPT),
+            )
 
         print(json.dumps(result, indent=2))
         sys.exit(0)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if not REPO_ROOT.exists():
+    raise RuntimeError(f"Repo root not found: {REPO_ROOT}")
+
+repo_root_str = str(REPO_ROOT)
+if repo_root_str not in sys.path:
+    sys.path.insert(0, repo_root_str)
+
+from fuel_extractor_v2.app.latest_state import rebuild_latest_state
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild marina_fuel_latest / marina_pricing_latest from the full log tables"
+    )
+    parser.add_argument("--db-path", required=True, help="Path to SQLite DB")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    db_path = args.db_path
+    if not isinstance(db_path, str) or not db_path.strip():
+        raise RuntimeError("--db-path is required")
+    db_path = db_path.strip()
+    if not Path(db_path).exists():
+        raise RuntimeError(f"Database not found: {db_path}")
+
+    connection = sqlite3.connect(db_path)
+    try:
+        counts = rebuild_latest_state(connection)
+    finally:
+        connection.close()
+    print(json.dumps({"db_path": db_path, "rows_written": counts}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if not REPO_ROOT.exists():
+    raise RuntimeError(f"Repo root not found: {REPO_ROOT}")
+
+repo_root_str = str(REPO_ROOT)
+if repo_root_str not in sys.path:
+    sys.path.insert(0, repo_root_str)
+
+from fuel_extractor_v2.app.retention import RetentionConfig, enable_incremental_vacuum, run_retention
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Archive old queue rows, acknowledged sync events and superseded fuel_logs, then reclaim space"
+    )
+    parser.add_argument("--db-path", required=True, help="Path to SQLite DB")
+    parser.add_argument(
+        "--archive-db",
+        help="Move rows into this SQLite file instead of <table>_archive tables in the same DB",
+    )
+    parser.add_argument(
+        "--queue-days",
+        type=int,
+        default=30,
+        help="Archive 'done'/'failed' seeds older than this; 0 keeps them (default: 30)",
+    )
+    parser.add_argument(
+        "--sync-event-days",
+        type=int,
+        default=90,
+        help="Archive acknowledged sync events older than this; 0 keeps them (default: 90)",
+    )
+    parser.add_argument(
+        "--fuel-log-days",
+        type=int,
+        default=365,
+        help="Archive superseded fuel_logs rows older than this; 0 keeps them (default: 365)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=500, help="Rows moved per transaction (default: 500)")
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="First switch the DB to auto_vacuum=INCREMENTAL with one full VACUUM (stop workers first)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    db_path = args.db_path
+    if not isinstance(db_path, str) or not db_path.strip():
+        raise RuntimeError("--db-path is required")
+    db_path = db_path.strip()
+    if not Path(db_path).exists():
+        raise RuntimeError(f"Database not found: {db_path}")
+    for flag, value in (
+        ("--queue-days", args.queue_days),
+        ("--sync-event-days", args.sync_event_days),
+        ("--fuel-log-days", args.fuel_log_days),
+    ):
+        if value < 0:
+            raise RuntimeError(f"{flag} must be >= 0")
+    if not isinstance(args.chunk_size, int) or not 1 <= args.chunk_size <= 5000:
+        raise RuntimeError("--chunk-size must be between 1 and 5000")
+
+    config = RetentionConfig(
+        queue_horizon_days=args.queue_days or None,
+        sync_event_horizon_days=args.sync_event_days or None,
+        fuel_log_horizon_days=args.fuel_log_days or None,
+        chunk_size=args.chunk_size,
+        archive_db_path=args.archive_db,
+    )
+    connection = sqlite3.connect(db_path, timeout=30.0)
+    try:
+        if args.enable_incremental_vacuum:
+            enable_incremental_vacuum(connection)
+        report = run_retention(connection, config)
+    finally:
+        connection.close()
+    print(json.dumps({"db_path": db_path, **report}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
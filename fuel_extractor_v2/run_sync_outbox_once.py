@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if not REPO_ROOT.exists():
+    raise RuntimeError(f"Repo root not found: {REPO_ROOT}")
+
+repo_root_str = str(REPO_ROOT)
+if repo_root_str not in sys.path:
+    sys.path.insert(0, repo_root_str)
+
+from fuel_extractor_v2.app.sync_outbox import SyncOutboxConfig, ship_sync_events
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ship unacknowledged sync_events to the Master API once")
+    parser.add_argument("--db-path", required=True, help="Path to SQLite DB")
+    parser.add_argument("--master-url", required=True, help="Master API base URL, e.g. https://master.example")
+    parser.add_argument(
+        "--endpoint-path",
+        default="/api/master/sync-events",
+        help="Path batches are POSTed to (default: /api/master/sync-events)",
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Events per request (default: 500)")
+    parser.add_argument("--max-batches", type=int, help="Stop after this many requests (default: drain)")
+    parser.add_argument("--timeout-seconds", type=float, default=30.0, help="Per-request timeout (default: 30)")
+    parser.add_argument(
+        "--header",
+        action="append",
+        default=[],
+        help="Extra request header as 'Name: value'; repeatable",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    db_path = args.db_path
+    if not isinstance(db_path, str) or not db_path.strip():
+        raise RuntimeError("--db-path is required")
+    db_path = db_path.strip()
+    if not Path(db_path).exists():
+        raise RuntimeError(f"Database not found: {db_path}")
+    if not isinstance(args.batch_size, int) or args.batch_size < 1:
+        raise RuntimeError("--batch-size must be >= 1")
+    if args.max_batches is not None and args.max_batches < 1:
+        raise RuntimeError("--max-batches must be >= 1")
+    if args.timeout_seconds <= 0:
+        raise RuntimeError("--timeout-seconds must be > 0")
+
+    headers: list[tuple[str, str]] = []
+    for raw_header in args.header:
+        name, separator, value = raw_header.partition(":")
+        if not separator or not name.strip():
+            raise RuntimeError(f"--header must look like 'Name: value', got {raw_header!r}")
+        headers.append((name.strip(), value.strip()))
+
+    config = SyncOutboxConfig(
+        master_url=args.master_url,
+        endpoint_path=args.endpoint_path,
+        batch_size=args.batch_size,
+        timeout_seconds=args.timeout_seconds,
+        headers=tuple(headers),
+    )
+    connection = sqlite3.connect(db_path)
+    try:
+        summary = ship_sync_events(connection, config, max_batches=args.max_batches)
+    finally:
+        connection.close()
+    print(json.dumps({"db_path": db_path, **summary}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCHEMA_PATH = REPO_ROOT / "fuel_extractor_v2" / "PHASE_1_SCHEMA.sql"
+
+repo_root_str = str(REPO_ROOT)
+if repo_root_str not in sys.path:
+    sys.path.insert(0, repo_root_str)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    path = tmp_path / "nav_data.db"
+    connection = sqlite3.connect(str(path))
+    try:
+        connection.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    finally:
+        connection.close()
+    return str(path)
+
+
+@pytest.fixture
+def connection(db_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def add_seed(connection: sqlite3.Connection) -> Callable[..., int]:
+    """Insert a marina plus one pending seed for it; returns the seed_id."""
+    counter = {"next": 0}
+
+    def _add_seed(
+        *,
+        website_url: str | None = None,
+        dockwa_url: str | None = None,
+        marinas_url: str | None = None,
+        seeded_at_utc: str | None = None,
+        priority_hint: str = "normal",
+    ) -> int:
+        counter["next"] += 1
+        index = counter["next"]
+        marina_uid = f"00000000-0000-4000-8000-{index:012d}"
+        created_at_utc = "2026-01-01T00:00:00Z"
+        connection.execute(
+            """
+            INSERT INTO marinas (
+                marina_uid, primary_name, lat, lon, website_url, marinas_url, dockwa_url,
+                aliases_json, verification_state, missing_from_web_count, fuel_candidate,
+                sync_dirty, created_at_utc, updated_at_utc
+            ) VALUES (?, ?, 27.0, -82.0, ?, ?, ?, '[]', 'verified', 0, 1, 0, ?, ?)
+            """,
+            (marina_uid, f"Test Marina {index}", website_url, marinas_url, dockwa_url, created_at_utc, created_at_utc),
+        )
+        cursor = connection.execute(
+            """
+            INSERT INTO fuel_seed_queue (
+                marina_uid, name, lat, lon, website_url, marinas_url, dockwa_url, fuel_candidate,
+                seed_reason, seeded_at_utc, priority_hint, queue_status
+            ) VALUES (?, ?, 27.0, -82.0, ?, ?, ?, 1, 'test', ?, ?, 'pending')
+            """,
+            (
+                marina_uid,
+                f"Test Marina {index}",
+                website_url,
+                marinas_url,
+                dockwa_url,
+                seeded_at_utc or f"2026-01-01T00:00:{index % 60:02d}Z",
+                priority_hint,
+            ),
+        )
+        connection.commit()
+        return cursor.lastrowid
+
+    return _add_seed
+
+
+def seed_row(connection: sqlite3.Connection, seed_id: int) -> dict[str, Any]:
+    cursor = connection.execute("SELECT * FROM fuel_seed_queue WHERE seed_id = ?", (seed_id,))
+    columns = [description[0] for description in cursor.description]
+    return dict(zip(columns, cursor.fetchone()))
+
+
+@dataclass
+class FakeNetwork:
+    """Stands in for the worker's two network seams and records what they were asked.
+
+    dockwa maps a Dockwa URL to the snapshot it returns (or an exception to raise);
+    website maps a start URL to an extract_fuel outcome: "price", "hidden" or "none".
+    Unknown URLs answer with no price. on_extract, when set, runs in the fetching thread
+    before each extract_fuel answer.
+    """
+
+    dockwa: dict[str, Any] = field(default_factory=dict)
+    website: dict[str, str] = field(default_factory=dict)
+    dockwa_delay_seconds: float = 0.0
+    website_delay_seconds: float = 0.0
+    dockwa_calls: list[str] = field(default_factory=list)
+    extract_requests: list[Any] = field(default_factory=list)
+    on_extract: Callable[[Any], None] | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def fetch_dockwa_fuel_snapshot(self, dockwa_url: str, timeout_seconds: int) -> Any:
+        import time
+
+        with self.lock:
+            self.dockwa_calls.append(dockwa_url)
+        time.sleep(self.dockwa_delay_seconds)
+        snapshot = self.dockwa.get(dockwa_url, {"diesel_price": None, "gasoline_price": None})
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot
+
+    def extract_fuel(self, request: Any) -> Any:
+        import time
+
+        with self.lock:
+            self.extract_requests.append(request)
+        time.sleep(self.website_delay_seconds)
+        if self.on_extract is not None:
+            self.on_extract(request)
+        outcome = self.website.get(request.website_url, "none")
+        extraction = types.SimpleNamespace(
+            diesel_price=4.25 if outcome == "price" else None,
+            gasoline_price=None,
+            fuel_dock=True if outcome in ("price", "hidden") else None,
+            source_url=request.website_url,
+            source_text="Diesel $4.25" if outcome == "price" else None,
+            last_updated=None,
+            confidence=0.8,
+        )
+        return types.SimpleNamespace(
+            status="ok",
+            error_code=None,
+            reason=None,
+            extraction=extraction,
+            evidence=types.SimpleNamespace(source_url=request.website_url),
+        )
+
+
+@pytest.fixture
+def fake_network(monkeypatch: pytest.MonkeyPatch) -> FakeNetwork:
+    """Route fuel_worker's Dockwa and extract_fuel seams to a FakeNetwork.
+
+    As in benchmarks/worker_throughput.py, ExtractRequest resolves to a plain attribute
+    bag with the same keyword constructor when fuel_extractor is not installed.
+    """
+    from fuel_extractor_v2.app import fuel_worker
+
+    try:
+        import fuel_extractor.app.schemas  # noqa: F401
+    except ImportError:
+        for name in ("fuel_extractor", "fuel_extractor.app"):
+            if name not in sys.modules:
+                monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+        schemas = types.ModuleType("fuel_extractor.app.schemas")
+        schemas.ExtractRequest = types.SimpleNamespace  # type: ignore[attr-defined]
+        schemas.ExtractResponse = types.SimpleNamespace  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "fuel_extractor.app.schemas", schemas)
+
+    network = FakeNetwork()
+    monkeypatch.setattr(fuel_worker, "_fetch_dockwa_fuel_snapshot", network.fetch_dockwa_fuel_snapshot)
+    monkeypatch.setattr(fuel_worker, "_extract_fuel", network.extract_fuel)
+    return network
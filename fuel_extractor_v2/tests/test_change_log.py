@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from fuel_extractor_v2.app.change_log import ensure_change_log_schema, read_changes
+
+
+def _trigger_sql(connection, name: str) -> str:
+    row = connection.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,)).fetchone()
+    return row[0]
+
+
+def test_triggers_are_recreated_when_a_watched_column_is_added(connection, add_seed):
+    ensure_change_log_schema(connection)
+    connection.commit()
+    add_seed(website_url="https://harbor.test/")
+    connection.execute("ALTER TABLE marinas ADD COLUMN slip_count INTEGER")
+    connection.execute("DELETE FROM sync_change_log")
+    connection.commit()
+
+    # Before the re-run the trigger does not know the column, so the change is not logged.
+    connection.execute("UPDATE marinas SET slip_count = 40")
+    connection.commit()
+    assert read_changes(connection, "master") == []
+
+    ensure_change_log_schema(connection)
+    connection.commit()
+    connection.execute("UPDATE marinas SET slip_count = 41")
+    connection.commit()
+
+    assert "slip_count" in _trigger_sql(connection, "trg_marinas_change_update")
+    assert [change["change_op"] for change in read_changes(connection, "master")] == ["update"]
+
+
+def test_unchanged_triggers_are_left_alone(connection):
+    ensure_change_log_schema(connection)
+    connection.commit()
+    before = _trigger_sql(connection, "trg_fuel_logs_change_update")
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+
+    ensure_change_log_schema(connection)
+
+    connection.set_trace_callback(None)
+    assert _trigger_sql(connection, "trg_fuel_logs_change_update") == before
+    assert not [statement for statement in statements if statement.startswith("DROP TRIGGER")]
+
+
+def test_fresh_database_keeps_its_triggers_on_later_runs(connection):
+    ensure_change_log_schema(connection)
+    connection.commit()
+    # The same definitions laid out differently (as a hand-written schema file would).
+    for name, sql in connection.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'").fetchall():
+        connection.execute(f"DROP TRIGGER {name}")
+        connection.execute(sql.replace("(", "(\n    ").replace(")", "\n)").replace(", ", ",\n    "))
+    connection.commit()
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+
+    ensure_change_log_schema(connection)
+
+    connection.set_trace_callback(None)
+    assert not [statement for statement in statements if statement.startswith("DROP TRIGGER")]
+
+
+def test_triggers_set_sync_dirty_and_clearing_it_is_not_a_change(connection, add_seed):
+    ensure_change_log_schema(connection)
+    add_seed(website_url="https://harbor.test/")
+    connection.execute("UPDATE marinas SET sync_dirty = 0")
+    connection.execute("DELETE FROM sync_change_log")
+    connection.commit()
+
+    connection.execute("UPDATE marinas SET website_url = 'https://harbor.test/fuel'")
+    assert connection.execute("SELECT sync_dirty FROM marinas").fetchone()[0] == 1
+    connection.execute("UPDATE marinas SET sync_dirty = 0")
+    connection.commit()
+
+    assert [change["change_op"] for change in read_changes(connection, "master")] == ["update"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fuel_extractor_v2.app.dockwa_cache import (
+    DockwaCacheError,
+    close_http_client,
+    fetch_dockwa_snapshot_cached,
+)
+
+
+class _DockwaPage:
+    """Stand-in Dockwa destination page that answers HEAD and honours If-None-Match."""
+
+    def __init__(self) -> None:
+        self.diesel_price = 4.10
+        self.etag = '"v1"'
+        self.status = 200
+        self.requests: list[dict[str, str]] = []
+        self.fetches: list[str] = []
+
+    def serve(self) -> ThreadingHTTPServer:
+        page = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_HEAD(self) -> None:
+                page.requests.append(dict(self.headers))
+                if page.status != 200:
+                    self.send_response(page.status)
+                elif self.headers.get("If-None-Match") == page.etag:
+                    self.send_response(304)
+                    self.send_header("ETag", page.etag)
+                else:
+                    self.send_response(200)
+                    self.send_header("ETag", page.etag)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+    def fetch_snapshot(self, dockwa_url: str, timeout_seconds: int) -> dict:
+        """Stands in for fetch_dockwa_fuel_snapshot: one full download and parse."""
+        self.fetches.append(dockwa_url)
+        return {"diesel_price": self.diesel_price, "source_url": dockwa_url}
+
+
+@pytest.fixture
+def dockwa_page():
+    pytest.importorskip("httpx")
+    page = _DockwaPage()
+    server = page.serve()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    page.url = f"http://127.0.0.1:{server.server_address[1]}/explore/destination/test-marina"
+    yield page
+    server.shutdown()
+    server.server_close()
+    close_http_client()
+
+
+def test_not_modified_reuses_the_cached_snapshot_without_fetching(dockwa_page, tmp_path):
+    first = fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+    again = fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+
+    assert first["diesel_price"] == again["diesel_price"] == 4.10
+    assert len(dockwa_page.fetches) == 1
+    assert dockwa_page.requests[1].get("If-None-Match") == '"v1"'
+
+
+def test_changed_page_is_fetched_once(dockwa_page, tmp_path):
+    fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+    dockwa_page.diesel_price = 4.25
+    dockwa_page.etag = '"v2"'
+
+    changed = fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+
+    assert changed["diesel_price"] == 4.25
+    assert len(dockwa_page.fetches) == 2
+
+
+def test_parse_failure_propagates_and_keeps_the_cached_entry(dockwa_page, tmp_path):
+    fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+    dockwa_page.etag = '"v2"'
+
+    def unparseable(dockwa_url: str, timeout_seconds: int) -> dict:
+        raise ValueError("no fuel table on the page")
+
+    with pytest.raises(ValueError):
+        fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, unparseable)
+
+    # The old validators are still what gets sent, so the change is picked up next run.
+    dockwa_page.diesel_price = 4.25
+    recovered = fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+    assert dockwa_page.requests[2].get("If-None-Match") == '"v1"'
+    assert recovered["diesel_price"] == 4.25
+
+
+def test_error_status_raises_without_fetching(dockwa_page, tmp_path):
+    dockwa_page.status = 503
+
+    with pytest.raises(DockwaCacheError):
+        fetch_dockwa_snapshot_cached(dockwa_page.url, 5, tmp_path, dockwa_page.fetch_snapshot)
+    assert len(dockwa_page.requests) == 1
+    assert dockwa_page.fetches == []
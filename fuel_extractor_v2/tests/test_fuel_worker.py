@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+from conftest import seed_row
+
+from fuel_extractor_v2.app.fuel_worker import FuelWorkerOptions, process_pending_seeds
+from fuel_extractor_v2.app.host_throttle import (
+    HostThrottleConfig,
+    ensure_host_throttle_schema,
+    record_host_outcome,
+)
+
+
+def _options(**overrides):
+    settings = {"throttle": None, "cooldown": None, "budget": None, "retry": None}
+    settings.update(overrides)
+    return FuelWorkerOptions(**settings)
+
+
+def test_throttle_waits_follow_the_bucket_not_the_pool_queue(connection, add_seed, fake_network):
+    # Three seeds on each of two hosts at 2 req/s: every host's last request may go after
+    # 1.0 s. Sleeping a relative delay after queueing for a pool thread took about 2 s.
+    for index in range(3):
+        add_seed(website_url=f"https://alpha.test/m{index}")
+    for index in range(3):
+        add_seed(website_url=f"https://bravo.test/m{index}")
+    throttle = HostThrottleConfig(rate_per_second=2.0, burst=1.0, max_wait_seconds=10.0)
+
+    started = time.monotonic()
+    result = process_pending_seeds(connection, 6, _options(max_workers=2, throttle=throttle))
+    elapsed = time.monotonic() - started
+
+    assert result["success_count"] == 6
+    assert elapsed < 1.6
+
+
+def test_deferred_seeds_are_not_claimed_again_before_their_host_recovers(connection, add_seed, fake_network):
+    ensure_host_throttle_schema(connection)
+    throttle = HostThrottleConfig()
+    cooldown_until_utc = record_host_outcome(connection, "dockwa.com", "rate_limited_429", throttle)
+    connection.commit()
+
+    # Dockwa seeds rank first in the claim order, so without a next attempt time they
+    # would be claimed (and deferred) again on every batch.
+    dockwa_seed_ids = [add_seed(dockwa_url=f"https://dockwa.com/explore/destination/d{index}") for index in range(3)]
+    website_seed_ids = [add_seed(website_url=f"https://site{index}.test/") for index in range(3)]
+    options = _options(max_workers=2, throttle=throttle)
+
+    first = process_pending_seeds(connection, 3, options)
+    second = process_pending_seeds(connection, 3, options)
+
+    assert sorted(first["deferred_seed_ids"]) == dockwa_seed_ids
+    assert first["processed_count"] == 0
+    assert second["deferred_count"] == 0
+    assert second["success_count"] == 3
+    assert not fake_network.dockwa_calls
+    for seed_id in dockwa_seed_ids:
+        row = seed_row(connection, seed_id)
+        assert row["queue_status"] == "pending"
+        assert row["lease_owner"] is None
+        assert row["attempt_count"] == 0
+        assert row["next_attempt_at_utc"] == cooldown_until_utc
+    for seed_id in website_seed_ids:
+        assert seed_row(connection, seed_id)["queue_status"] == "done"
+
+
+def _open(db_path):
+    return sqlite3.connect(db_path, timeout=10)
+
+
+def test_lost_lease_skips_the_seed_and_keeps_the_batch(db_path, connection, add_seed, fake_network):
+    kept = add_seed(website_url="https://kept.test/")
+    stolen = add_seed(website_url="https://stolen.test/")
+    also_kept = add_seed(website_url="https://also-kept.test/")
+    fake_network.website = {
+        "https://kept.test/": "price",
+        "https://stolen.test/": "price",
+        "https://also-kept.test/": "price",
+    }
+
+    def steal_lease(request):
+        # Another worker reaped this seed's lease and claimed it while the fetch was running.
+        if request.website_url == "https://stolen.test/":
+            other = _open(db_path)
+            other.execute("UPDATE fuel_seed_queue SET lease_owner = 'other-worker' WHERE seed_id = ?", (stolen,))
+            other.commit()
+            other.close()
+
+    fake_network.on_extract = steal_lease
+    result = process_pending_seeds(connection, 3, FuelWorkerOptions())
+
+    assert result["lost_lease_seed_ids"] == [stolen]
+    assert result["success_count"] == 2
+    assert result["failed_count"] == 0
+    assert seed_row(connection, kept)["queue_status"] == "done"
+    assert seed_row(connection, also_kept)["queue_status"] == "done"
+    row = seed_row(connection, stolen)
+    assert row["queue_status"] == "processing"
+    assert row["lease_owner"] == "other-worker"
+    stolen_uid = row["marina_uid"]
+    assert connection.execute("SELECT COUNT(*) FROM fuel_logs WHERE marina_uid = ?", (stolen_uid,)).fetchone()[0] == 0
+
+
+def test_leases_are_renewed_while_fetches_are_in_flight(db_path, connection, add_seed, fake_network):
+    slow = add_seed(website_url="https://slow.test/")
+    add_seed(website_url="https://quick.test/")
+    seen_expiries: list[str] = []
+    expiry_sql = "SELECT lease_expires_at_utc FROM fuel_seed_queue WHERE seed_id = ?"
+
+    def watch_lease(request):
+        if request.website_url != "https://slow.test/":
+            return
+        other = _open(db_path)
+        seen_expiries.append(other.execute(expiry_sql, (slow,)).fetchone()[0])
+        time.sleep(1.6)
+        seen_expiries.append(other.execute(expiry_sql, (slow,)).fetchone()[0])
+        other.close()
+
+    fake_network.on_extract = watch_lease
+    result = process_pending_seeds(connection, 2, _options(max_workers=2, lease_seconds=3))
+
+    assert result["success_count"] == 2
+    assert seen_expiries[1] > seen_expiries[0]
+
+
+def test_aborted_run_releases_the_seeds_it_has_not_written(connection, add_seed, fake_network):
+    seed_ids = [add_seed(website_url=f"https://site{index}.test/") for index in range(4)]
+
+    def fail_on_first(outcome):
+        raise RuntimeError("outcome sink went away")
+
+    with pytest.raises(RuntimeError):
+        process_pending_seeds(connection, 4, _options(max_workers=2), on_seed_outcome=fail_on_first)
+
+    statuses = [seed_row(connection, seed_id)["queue_status"] for seed_id in seed_ids]
+    assert statuses.count("done") == 1
+    assert statuses.count("pending") == 3
+    assert all(seed_row(connection, seed_id)["lease_owner"] is None for seed_id in seed_ids)
+
+
+def test_group_commit_holds_no_write_lock_while_fetching(db_path, connection, add_seed, fake_network):
+    seed_ids = [add_seed(website_url=f"https://site{index}.test/") for index in range(3)]
+    fake_network.website = {f"https://site{index}.test/": "price" for index in range(3)}
+    writable_during_fetch: list[bool] = []
+
+    def try_to_write(request):
+        other = sqlite3.connect(db_path, timeout=0)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            other.rollback()
+            writable_during_fetch.append(True)
+        except sqlite3.OperationalError:
+            writable_during_fetch.append(False)
+        finally:
+            other.close()
+
+    fake_network.on_extract = try_to_write
+    result = process_pending_seeds(connection, 3, _options(group_commit_size=2))
+
+    assert writable_during_fetch == [True, True, True]
+    assert result["success_count"] == 3
+    assert [seed_row(connection, seed_id)["queue_status"] for seed_id in seed_ids] == ["done"] * 3
+
+
+def test_cooldown_marker_is_logged_even_when_the_extraction_repeats(connection, add_seed, fake_network):
+    from fuel_extractor_v2.app.fuel_cooldown import FuelCooldownConfig
+
+    seed_id = add_seed(website_url="https://hidden.test/")
+    fake_network.website = {"https://hidden.test/": "hidden"}
+    options = _options(coalesce_observations=True, cooldown=FuelCooldownConfig(hidden_streak_threshold=3))
+
+    for _ in range(3):
+        connection.execute("UPDATE fuel_seed_queue SET queue_status = 'pending' WHERE seed_id = ?", (seed_id,))
+        connection.commit()
+        assert process_pending_seeds(connection, 1, options)["success_count"] == 1
+
+    rows = [
+        tuple(row)
+        for row in connection.execute("SELECT price_source, observation_count FROM fuel_logs ORDER BY fuel_log_id")
+    ]
+    # The first two identical outcomes coalesce; the one that starts the cooldown does not.
+    assert rows == [("website_text", 2), ("not_published_online", 1)]
+
+
+def test_hedge_crawls_the_website_under_its_own_host(connection, add_seed, fake_network):
+    from fuel_extractor_v2.app.host_budget import HostBudgetConfig
+
+    add_seed(dockwa_url="https://dockwa.com/explore/destination/slow", website_url="https://www.harbor.test/fuel")
+    fake_network.dockwa_delay_seconds = 0.5
+    fake_network.website = {"https://www.harbor.test/fuel": "price"}
+    options = _options(hedge_delay_seconds=0.05, throttle=HostThrottleConfig(), budget=HostBudgetConfig())
+
+    result = process_pending_seeds(connection, 1, options)
+
+    assert result["hedge_website_win_count"] == 1
+    assert [request.website_url for request in fake_network.extract_requests] == ["https://www.harbor.test/fuel"]
+    throttled_hosts = {row[0] for row in connection.execute("SELECT host FROM host_throttle_state")}
+    assert throttled_hosts == {"dockwa.com", "harbor.test"}
+    sampled_hosts = [row[0] for row in connection.execute("SELECT host FROM host_fetch_profile")]
+    assert sampled_hosts == ["harbor.test"]
+
+
+def test_no_hedge_without_a_non_dockwa_source(connection, add_seed, fake_network):
+    add_seed(
+        dockwa_url="https://dockwa.com/explore/destination/slow",
+        marinas_url="https://marinas.com/map/27/-82",
+    )
+    fake_network.dockwa_delay_seconds = 0.2
+    fake_network.dockwa = {"https://dockwa.com/explore/destination/slow": {"diesel_price": 4.5, "gasoline_price": None}}
+
+    result = process_pending_seeds(connection, 1, _options(hedge_delay_seconds=0.0))
+
+    assert result["success_count"] == 1
+    assert result["hedged_count"] == 0
+    assert fake_network.extract_requests == []
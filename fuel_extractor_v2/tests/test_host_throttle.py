@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import math
+import time
+
+from fuel_extractor_v2.app.host_throttle import (
+    HostThrottleConfig,
+    ensure_host_throttle_schema,
+    record_host_outcome,
+    reserve_host_slot,
+)
+
+
+def test_reserved_slot_carries_an_absolute_deadline(connection):
+    ensure_host_throttle_schema(connection)
+    config = HostThrottleConfig(rate_per_second=2.0, burst=1.0, max_wait_seconds=10.0)
+    now = time.time()
+
+    first = reserve_host_slot(connection, "example.com", config, now=now)
+    before = time.monotonic()
+    second = reserve_host_slot(connection, "example.com", config, now=now)
+    after = time.monotonic()
+
+    assert first.allowed and first.delay_seconds == 0.0
+    assert second.allowed
+    assert math.isclose(second.delay_seconds, 0.5)
+    assert before + 0.5 <= second.not_before <= after + 0.5
+
+
+def test_rate_limited_deferral_says_when_to_retry(connection):
+    ensure_host_throttle_schema(connection)
+    config = HostThrottleConfig(rate_per_second=1.0, burst=1.0, max_wait_seconds=0.0)
+    now = 1_800_000_000.0
+
+    reserve_host_slot(connection, "example.com", config, now=now)
+    decision = reserve_host_slot(connection, "example.com", config, now=now)
+
+    assert not decision.allowed
+    assert decision.deferred_reason == "host_rate_limit"
+    # One token is owed at 1/s; the retry time is rounded up to whole seconds.
+    assert decision.retry_at_utc == "2027-01-15T08:00:01Z"
+
+
+def test_cooldown_deferral_retries_when_the_cooldown_ends(connection):
+    ensure_host_throttle_schema(connection)
+    config = HostThrottleConfig()
+    now = time.time()
+
+    cooldown_until_utc = record_host_outcome(connection, "dockwa.com", "rate_limited_429", config, now=now)
+    decision = reserve_host_slot(connection, "dockwa.com", config, now=now + 1)
+
+    assert not decision.allowed
+    assert decision.deferred_reason == "rate_limited_429"
+    assert decision.retry_at_utc == cooldown_until_utc
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from fuel_extractor_v2.app.pricing_cache import (
+    clear_pricing_cache,
+    pricing_cache_key,
+    prune_pricing_cache,
+    write_cached_pricing,
+)
+
+CURRENT = "a" * 64
+OLD = "b" * 64
+APP_DIR = Path(__file__).resolve().parents[1]
+
+
+def _store(cache_dir: Path, name: str, prompt_version: str, age_days: float = 0.0) -> Path:
+    write_cached_pricing(cache_dir, name, {"monthly_base": 1.0}, prompt_version=prompt_version, model="m")
+    path = cache_dir / prompt_version[:16] / f"{name}.json"
+    stamp = time.time() - age_days * 86400.0
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def test_prune_removes_stale_prompts_before_expired_entries(tmp_path):
+    _store(tmp_path, "old-and-expired", OLD, age_days=200)
+    _store(tmp_path, "old-and-fresh", OLD)
+    _store(tmp_path, "current-and-expired", CURRENT, age_days=200)
+    kept = _store(tmp_path, "current-and-fresh", CURRENT)
+
+    report = prune_pricing_cache(tmp_path, max_age_days=90, max_total_bytes=None, current_prompt_version=CURRENT)
+
+    # An old-prompt entry is stale whatever its age, so age only decides among current ones.
+    assert report["stale_prompt"] == 2
+    assert report["expired"] == 1
+    assert report["over_size"] == 0
+    assert report["kept"] == 1
+    assert sorted(path.relative_to(tmp_path) for path in tmp_path.rglob("*.json")) == [kept.relative_to(tmp_path)]
+
+
+def test_prune_evicts_least_recently_used_entries_over_the_size_cap(tmp_path):
+    oldest = _store(tmp_path, "oldest", CURRENT, age_days=3)
+    _store(tmp_path, "middle", CURRENT, age_days=2)
+    _store(tmp_path, "newest", CURRENT, age_days=1)
+    entry_bytes = oldest.stat().st_size
+
+    report = prune_pricing_cache(
+        tmp_path, max_age_days=None, max_total_bytes=2 * entry_bytes, current_prompt_version=CURRENT
+    )
+
+    assert report["over_size"] == 1
+    assert not oldest.exists()
+    assert clear_pricing_cache(tmp_path) == 2
+
+
+def test_cached_extraction_is_served_without_calling_the_llm(tmp_path, monkeypatch):
+    from fuel_extractor_v2.app import pricing_worker
+
+    monkeypatch.delenv("FIREWORKS_API_KEY", raising=False)
+    markdown = "# Harbor\nTransient slips $3.50/ft/night"
+    key = pricing_cache_key(
+        pricing_worker.PRICING_SYSTEM_PROMPT,
+        pricing_worker.PRICING_MODEL,
+        pricing_worker._PRICING_REQUEST_PARAMS,
+        markdown,
+    )
+    write_cached_pricing(
+        tmp_path,
+        key,
+        {"monthly_base": 3.5, "extraction_hash": "cached"},
+        prompt_version=pricing_worker.prompt_digest(pricing_worker.PRICING_SYSTEM_PROMPT),
+        model=pricing_worker.PRICING_MODEL,
+    )
+
+    result = pricing_worker.extract_pricing_with_deepseek(
+        "https://harbor.test/", html_content=markdown, cache_dir=str(tmp_path)
+    )
+
+    assert result["llm_cache_hit"] is True
+    assert result["monthly_base"] == 3.5
+
+
+def test_runner_rejects_a_non_positive_cache_age_before_doing_any_work(tmp_path):
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "run_pricing_worker_once.py",
+            "--db-path",
+            str(tmp_path / "missing.db"),
+            "--marina-uid",
+            "00000000-0000-4000-8000-000000000001",
+            "--website-url",
+            "https://harbor.test/",
+            "--llm-cache-max-age-days",
+            "0",
+        ],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert completed.returncode == 2
+    assert "--llm-cache-max-age-days must be > 0" in completed.stderr
+    assert completed.stdout == ""
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from conftest import seed_row
+
+from fuel_extractor_v2.app.retention import RetentionConfig, run_retention
+
+
+def _fuel_log(connection, marina_uid: str, fetched_at_utc: str, *, sync_dirty: int) -> int:
+    cursor = connection.execute(
+        """
+        INSERT INTO fuel_logs (
+            marina_uid, fetched_at_utc, outcome_state, reason_tag, provenance_json,
+            price_source, confidence, sync_dirty, created_at_utc
+        ) VALUES (?, ?, 'fuel_unknown', 'test', '{}', 'none', 0.0, ?, ?)
+        """,
+        (marina_uid, fetched_at_utc, sync_dirty, fetched_at_utc),
+    )
+    return cursor.lastrowid
+
+
+def test_fuel_logs_not_yet_pushed_to_the_master_are_kept(connection, add_seed):
+    marina_uid = seed_row(connection, add_seed(website_url="https://harbor.test/"))["marina_uid"]
+    pushed = _fuel_log(connection, marina_uid, "2024-01-01T00:00:00Z", sync_dirty=0)
+    unpushed = _fuel_log(connection, marina_uid, "2024-02-01T00:00:00Z", sync_dirty=1)
+    _fuel_log(connection, marina_uid, "2026-06-01T00:00:00Z", sync_dirty=0)
+    connection.commit()
+    config = RetentionConfig(queue_horizon_days=None, sync_event_horizon_days=None)
+
+    report = run_retention(connection, config, now_utc=datetime(2026, 7, 1, tzinfo=timezone.utc))
+
+    assert report["tables"]["fuel_logs"]["archived_rows"] == 1
+    archived = [row[0] for row in connection.execute("SELECT fuel_log_id FROM fuel_logs_archive")]
+    assert archived == [pushed]
+    remaining = [row[0] for row in connection.execute("SELECT fuel_log_id FROM fuel_logs ORDER BY fuel_log_id")]
+    assert unpushed in remaining
+    assert pushed not in remaining
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from conftest import seed_row
+
+from fuel_extractor_v2.app.seed_consumer import (
+    SeedRetryConfig,
+    claim_pending_seeds,
+    ensure_seed_lease_schema,
+    ensure_seed_retry_schema,
+    mark_seed_status,
+    reap_expired_leases,
+    record_seed_failure,
+    renew_seed_leases,
+    requeue_dead_lettered_seeds,
+)
+from marina_management_v2.app.seed_publish_runner import _list_candidate_rows
+
+
+def _claim(connection, lease_owner, batch_size=10, lease_seconds=60):
+    ensure_seed_lease_schema(connection)
+    ensure_seed_retry_schema(connection)
+    return [seed["seed_id"] for seed in claim_pending_seeds(connection, batch_size, lease_owner, lease_seconds)]
+
+
+def test_renewal_only_touches_leases_the_owner_still_holds(connection, add_seed):
+    first, second = add_seed(website_url="https://a.test/"), add_seed(website_url="https://b.test/")
+    _claim(connection, "worker-a", lease_seconds=5)
+    connection.execute("UPDATE fuel_seed_queue SET lease_owner = 'worker-b' WHERE seed_id = ?", (second,))
+    connection.commit()
+    before = seed_row(connection, first)["lease_expires_at_utc"]
+
+    renewed = renew_seed_leases(connection, [first, second], "worker-a", 3600)
+
+    assert renewed == 1
+    assert seed_row(connection, first)["lease_expires_at_utc"] > before
+    assert seed_row(connection, second)["lease_owner"] == "worker-b"
+
+
+def test_processing_rows_without_an_expiry_are_reaped_after_the_grace(connection, add_seed):
+    orphan = add_seed(website_url="https://a.test/")
+    _claim(connection, "worker-a", batch_size=1)
+    mark_seed_status(connection, orphan, "pending", lease_owner="worker-a")
+    # A bare status update (no claim) leaves 'processing' with no lease to expire.
+    mark_seed_status(connection, orphan, "processing")
+    assert seed_row(connection, orphan)["lease_expires_at_utc"] is None
+
+    assert reap_expired_leases(connection, "2026-05-01T12:00:00Z", orphan_grace_seconds=600) == 0
+    assert seed_row(connection, orphan)["lease_expires_at_utc"] == "2026-05-01T12:10:00Z"
+    assert reap_expired_leases(connection, "2026-05-01T12:05:00Z", orphan_grace_seconds=600) == 0
+    assert reap_expired_leases(connection, "2026-05-01T12:10:01Z", orphan_grace_seconds=600) == 1
+
+    row = seed_row(connection, orphan)
+    assert row["queue_status"] == "pending"
+    assert row["lease_expires_at_utc"] is None
+
+
+def test_dead_lettered_seeds_are_not_republished_until_requeued(connection, add_seed):
+    dead, one_shot = add_seed(website_url="https://a.test/"), add_seed(website_url="https://b.test/")
+    _claim(connection, "worker-a")
+    assert record_seed_failure(connection, dead, "contract_violation", SeedRetryConfig()) == "failed"
+    mark_seed_status(connection, one_shot, "failed")
+    dead_uid = seed_row(connection, dead)["marina_uid"]
+
+    candidates = {row["marina_uid"] for row in _list_candidate_rows(connection, 10)}
+
+    assert candidates == {seed_row(connection, one_shot)["marina_uid"]}
+
+    assert requeue_dead_lettered_seeds(connection, [dead_uid]) == 1
+    requeued = seed_row(connection, dead)
+    assert (requeued["queue_status"], requeued["attempt_count"], requeued["last_error_class"]) == ("pending", 0, None)
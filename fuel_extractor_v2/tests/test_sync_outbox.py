@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from conftest import seed_row
+
+from fuel_extractor_v2.app.sync_event_writer import write_sync_event
+from fuel_extractor_v2.app.sync_outbox import SyncOutboxConfig, batch_idempotency_key, ship_sync_events
+
+
+class _StandInMaster:
+    """Stand-in Master API: records each POST and answers from a queue of (status, body)."""
+
+    def __init__(self) -> None:
+        self.replies: list[tuple[int, dict | None]] = []
+        self.requests: list[dict] = []
+
+    def serve(self) -> ThreadingHTTPServer:
+        master = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                raw = self.rfile.read(int(self.headers["Content-Length"]))
+                master.requests.append(
+                    {
+                        "path": self.path,
+                        "headers": dict(self.headers),
+                        "payload": json.loads(gzip.decompress(raw)),
+                    }
+                )
+                status, body = master.replies.pop(0) if master.replies else (200, None)
+                encoded = json.dumps(body).encode("utf-8") if body is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+
+@pytest.fixture
+def master():
+    stand_in = _StandInMaster()
+    server = stand_in.serve()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stand_in.config = SyncOutboxConfig(master_url=f"http://127.0.0.1:{server.server_address[1]}")
+    yield stand_in
+    server.shutdown()
+    server.server_close()
+
+
+def _dirty_marina(connection, add_seed, index: int, event_count: int = 1) -> str:
+    seed_id = add_seed(website_url=f"https://marina{index}.test/")
+    marina_uid = seed_row(connection, seed_id)["marina_uid"]
+    connection.execute("UPDATE marinas SET sync_dirty = 1 WHERE marina_uid = ?", (marina_uid,))
+    for event_index in range(event_count):
+        write_sync_event(
+            connection,
+            marina_uid=marina_uid,
+            entity_type="marina",
+            entity_ref=f"{marina_uid}:{event_index}",
+            event_type="new_discovery",
+            reason_tag="test",
+            after_data={"event": event_index},
+            sync_dirty_before=True,
+            sync_dirty_after=True,
+            commit=False,
+        )
+    connection.commit()
+    return marina_uid
+
+
+def _acknowledged(connection, marina_uid: str) -> list[int]:
+    rows = connection.execute(
+        "SELECT master_acknowledged FROM sync_events WHERE marina_uid = ? ORDER BY sync_event_id",
+        (marina_uid,),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _sync_dirty(connection, marina_uid: str) -> int:
+    return connection.execute("SELECT sync_dirty FROM marinas WHERE marina_uid = ?", (marina_uid,)).fetchone()[0]
+
+
+def test_failed_batch_is_resent_gzipped_with_the_same_idempotency_key(connection, add_seed, master):
+    first_uid = _dirty_marina(connection, add_seed, 1, event_count=2)
+    second_uid = _dirty_marina(connection, add_seed, 2)
+    master.replies = [(503, None), (200, None)]
+
+    failed = ship_sync_events(connection, master.config)
+
+    assert failed["stopped_reason"] == "http_503"
+    assert failed["events_acknowledged"] == 0
+    for marina_uid in (first_uid, second_uid):
+        assert set(_acknowledged(connection, marina_uid)) == {0}
+        assert _sync_dirty(connection, marina_uid) == 1
+
+    retried = ship_sync_events(connection, master.config)
+
+    assert retried["stopped_reason"] == "drained"
+    assert retried["events_acknowledged"] == 3
+    first, second = master.requests
+    assert first["path"] == "/api/master/sync-events"
+    assert first["headers"]["Content-Encoding"] == "gzip"
+    assert first["headers"]["Idempotency-Key"] == second["headers"]["Idempotency-Key"]
+    assert first["payload"]["events"] == second["payload"]["events"]
+    assert first["headers"]["Idempotency-Key"] == batch_idempotency_key(first["payload"]["events"])
+    assert first["payload"]["idempotency_key"] == first["headers"]["Idempotency-Key"]
+
+
+def test_accepted_batch_is_acknowledged_in_one_commit_and_leaves_sync_dirty_alone(connection, add_seed, master):
+    accepted_uid = _dirty_marina(connection, add_seed, 1, event_count=2)
+    rejected_uid = _dirty_marina(connection, add_seed, 2)
+    unshipped_uid = _dirty_marina(connection, add_seed, 3)
+    # Sorts after the batch, so a batch_size of 3 leaves this marina's event unshipped.
+    connection.execute(
+        "UPDATE sync_events SET occurred_at_utc = '2999-01-01T00:00:00Z' WHERE marina_uid = ?",
+        (unshipped_uid,),
+    )
+    connection.commit()
+    master.replies = [(200, {"results": {accepted_uid: 200, rejected_uid: 409}})]
+    config = SyncOutboxConfig(master_url=master.config.master_url, batch_size=3)
+
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    summary = ship_sync_events(connection, config, max_batches=1)
+    connection.set_trace_callback(None)
+
+    assert summary["events_acknowledged"] == 2
+    assert summary["events_rejected"] == 1
+    shipped = {event["marina_uid"] for event in master.requests[0]["payload"]["events"]}
+    assert shipped == {accepted_uid, rejected_uid}
+    assert _acknowledged(connection, accepted_uid) == [1, 1]
+    # The marina row itself is still MasterSyncService.js's to push and clear.
+    assert _sync_dirty(connection, accepted_uid) == 1
+    assert _acknowledged(connection, rejected_uid) == [0]
+    assert _sync_dirty(connection, rejected_uid) == 1
+    assert _acknowledged(connection, unshipped_uid) == [0]
+    assert _sync_dirty(connection, unshipped_uid) == 1
+    assert [statement for statement in statements if statement.strip().upper() == "COMMIT"] == ["COMMIT"]
@@ -2,6 +2,7 @@ from .seed_publisher import publish_seed_row
 from .discovery_runner import discover_bounds_now, discover_query_now
 from .reconcile_runner import reconcile_now
 from .seed_publish_runner import publish_candidates_now
+from .cadence_scheduler import CadenceConfig, collect_due_work, run_cadence_cycle
 
 __all__ = [
     "publish_seed_row",
@@ -9,4 +10,7 @@ __all__ = [
     "discover_bounds_now",
     "reconcile_now",
     "publish_candidates_now",
+    "CadenceConfig",
+    "collect_due_work",
+    "run_cadence_cycle",
 ]
@@ -0,0 +1,508 @@
+from __future__ import annotations
+
+import heapq
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from .geographic_orchestrator import haversine_distance, sweep_region
+from .seed_publish_runner import publish_candidate_rows, seed_queue_guard_sql
+
+
+class CadenceSchedulerError(Exception):
+    pass
+
+
+MODE_FUEL = "fuel"
+MODE_DISCOVERY = "discovery"
+MODE_FEATURE = "feature"
+
+# NEW_PIPELINE_PLAN §4: Fuel Mode outranks Discovery Mode outranks Feature Mode. Within a
+# mode, Dockwa refreshes (one JSON fetch) beat website crawls and staler rows beat
+# fresher ones; staleness adds at most _MAX_STALENESS_BONUS so modes never swap order.
+_MODE_BASE_VALUE = {
+    MODE_FUEL: 300.0,
+    MODE_DISCOVERY: 200.0,
+    MODE_FEATURE: 100.0,
+}
+_DOCKWA_BONUS = 50.0
+_MAX_STALENESS_BONUS = 48.0
+
+FeatureHandler = Callable[[sqlite3.Connection, list["DueWork"]], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class CadenceConfig:
+    dockwa_fuel_interval_hours: float = 12.0
+    website_fuel_interval_hours: float = 24.0
+    feature_interval_days: float = 30.0
+    discovery_move_miles: float = 10.0
+    discovery_sweep_radius_miles: float = 25.0
+    time_budget_seconds: float = 10 * 60.0
+    max_concurrency: int = 2
+    fuel_seconds_per_seed: float = 15.0
+    discovery_seconds: float = 5 * 60.0
+    feature_seconds_per_marina: float = 60.0
+    max_items_per_mode: int = 500
+
+
+@dataclass
+class DueWork:
+    mode: str
+    value: float
+    due_at_utc: str
+    estimated_seconds: float
+    marina_uid: str | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+def _utc_iso(moment: datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _utc_now_iso() -> str:
+    return _utc_iso(datetime.now(timezone.utc))
+
+
+def _parse_utc(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _latest(*moments: datetime | None) -> datetime | None:
+    present = [moment for moment in moments if moment is not None]
+    return max(present) if present else None
+
+
+def _validate_config(config: CadenceConfig) -> None:
+    if not isinstance(config, CadenceConfig):
+        raise CadenceSchedulerError("config must be a CadenceConfig")
+    for field_name in (
+        "dockwa_fuel_interval_hours",
+        "website_fuel_interval_hours",
+        "feature_interval_days",
+        "discovery_move_miles",
+        "discovery_sweep_radius_miles",
+        "time_budget_seconds",
+        "fuel_seconds_per_seed",
+        "discovery_seconds",
+        "feature_seconds_per_marina",
+    ):
+        value = getattr(config, field_name)
+        if not isinstance(value, (int, float)) or value <= 0:
+            raise CadenceSchedulerError(f"{field_name} must be > 0")
+    if not isinstance(config.max_concurrency, int) or config.max_concurrency < 1:
+        raise CadenceSchedulerError("max_concurrency must be an int >= 1")
+    if not isinstance(config.max_items_per_mode, int) or config.max_items_per_mode < 1:
+        raise CadenceSchedulerError("max_items_per_mode must be an int >= 1")
+
+
+def _read_discovery_state(connection: sqlite3.Connection) -> dict[str, Any] | None:
+    # Shared with MarinaDiscoveryService.js, which also gates sweeps on this row.
+    exists = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'discovery_state'"
+    ).fetchone()
+    if exists is None:
+        return None
+    connection.row_factory = sqlite3.Row
+    row = connection.execute("SELECT * FROM discovery_state WHERE id = 1").fetchone()
+    return dict(row) if row is not None else None
+
+
+def _record_discovery_run(connection: sqlite3.Connection, lat: float, lon: float, ran_at_utc: str) -> None:
+    connection.execute(
+        """
+        INSERT INTO discovery_state (id, last_discovery_lat, last_discovery_lon, last_discovery_time, discovery_count)
+        VALUES (1, ?, ?, ?, 1)
+        ON CONFLICT(id) DO UPDATE SET
+            last_discovery_lat = excluded.last_discovery_lat,
+            last_discovery_lon = excluded.last_discovery_lon,
+            last_discovery_time = excluded.last_discovery_time,
+            discovery_count = discovery_count + 1
+        """,
+        (lat, lon, ran_at_utc),
+    )
+    connection.commit()
+
+
+def _table_columns(connection: sqlite3.Connection, table_name: str) -> set[str]:
+    return {row[1] for row in connection.execute(f"PRAGMA table_info({table_name})").fetchall()}
+
+
+def _marinas_name_column(columns: set[str]) -> str:
+    if "primary_name" in columns:
+        return "primary_name"
+    if "name" in columns:
+        return "name"
+    raise CadenceSchedulerError("marinas must include either primary_name or name")
+
+
+def _staleness_bonus(now: datetime, due_at: datetime | None) -> float:
+    if due_at is None:
+        return _MAX_STALENESS_BONUS
+    overdue_hours = (now - due_at).total_seconds() / 3600.0
+    return max(0.0, min(overdue_hours, _MAX_STALENESS_BONUS))
+
+
+def _fuel_due_work(connection: sqlite3.Connection, now: datetime, config: CadenceConfig) -> list[DueWork]:
+    """Fuel Mode: fuel candidates whose latest fuel check is older than their cadence.
+
+    Marinas in an anti-clog cooldown (fuel_cooldown_until_utc) or with a seed the queue
+    still owns (see seed_queue_guard_sql) are not due.
+    """
+    marinas_columns = _table_columns(connection, "marinas")
+    name_column_name = _marinas_name_column(marinas_columns)
+    cooldown_predicate = ""
+    parameters: tuple[Any, ...] = ()
+    if "fuel_cooldown_until_utc" in marinas_columns:
+        cooldown_predicate = "AND (m.fuel_cooldown_until_utc IS NULL OR m.fuel_cooldown_until_utc <= ?)"
+        parameters = (_utc_iso(now),)
+    log_columns = _table_columns(connection, "fuel_logs")
+    # A coalesced fuel_logs run was last confirmed at last_confirmed_at_utc.
+    last_log_expr = "f.fetched_at_utc"
+    if "last_confirmed_at_utc" in log_columns:
+        last_log_expr = "COALESCE(f.last_confirmed_at_utc, f.fetched_at_utc)"
+    seed_queue_guard = seed_queue_guard_sql(connection)
+
+    connection.row_factory = sqlite3.Row
+    rows = connection.execute(
+        f"""
+        SELECT
+            m.marina_uid,
+            m.{name_column_name} AS name,
+            m.lat,
+            m.lon,
+            m.website_url,
+            m.marinas_url,
+            m.dockwa_url,
+            m.fuel_candidate,
+            m.seed_reason,
+            m.source_marinas_id,
+            m.dockwa_destination_id,
+            m.last_fuel_checked_at_utc,
+            (
+                SELECT MAX({last_log_expr})
+                FROM fuel_logs f
+                WHERE f.marina_uid = m.marina_uid
+            ) AS last_fuel_log_at_utc
+        FROM marinas m
+        WHERE
+            m.fuel_candidate = 1
+            AND (
+                (m.dockwa_url IS NOT NULL AND TRIM(m.dockwa_url) != '')
+                OR (
+                    m.marinas_url IS NOT NULL
+                    AND TRIM(m.marinas_url) != ''
+                    AND LOWER(m.marinas_url) NOT LIKE 'https://marinas.com/map/%'
+                )
+                OR (m.website_url IS NOT NULL AND TRIM(m.website_url) != '')
+            )
+            {cooldown_predicate}
+            {seed_queue_guard}
+        """,
+        parameters,
+    ).fetchall()
+
+    due: list[DueWork] = []
+    for row in rows:
+        candidate = dict(row)
+        last_fuel_log_at_utc = candidate.pop("last_fuel_log_at_utc")
+        last_checked = _latest(
+            _parse_utc(candidate.get("last_fuel_checked_at_utc")),
+            _parse_utc(last_fuel_log_at_utc),
+        )
+
+        dockwa_url = candidate.get("dockwa_url")
+        has_dockwa = isinstance(dockwa_url, str) and bool(dockwa_url.strip())
+        interval_hours = config.dockwa_fuel_interval_hours if has_dockwa else config.website_fuel_interval_hours
+
+        due_at = None if last_checked is None else last_checked + timedelta(hours=interval_hours)
+        if due_at is not None and due_at > now:
+            continue
+
+        if last_checked is not None:
+            candidate["last_fuel_checked_at_utc"] = _utc_iso(last_checked)
+        if has_dockwa:
+            candidate["priority_hint"] = "high"
+        elif last_checked is None:
+            candidate["priority_hint"] = "normal"
+        else:
+            candidate["priority_hint"] = "low"
+
+        value = _MODE_BASE_VALUE[MODE_FUEL] + _staleness_bonus(now, due_at)
+        if has_dockwa:
+            value += _DOCKWA_BONUS
+        due.append(
+            DueWork(
+                mode=MODE_FUEL,
+                value=value,
+                due_at_utc=_utc_iso(due_at or now),
+                estimated_seconds=config.fuel_seconds_per_seed,
+                marina_uid=candidate["marina_uid"],
+                payload=candidate,
+            )
+        )
+
+    due.sort(key=lambda item: (-item.value, item.due_at_utc))
+    return due[: config.max_items_per_mode]
+
+
+def _discovery_due_work(
+    connection: sqlite3.Connection,
+    now: datetime,
+    config: CadenceConfig,
+    vessel_lat: float | None,
+    vessel_lon: float | None,
+) -> list[DueWork]:
+    """Discovery Mode: due once the vessel has moved far enough from the last sweep.
+
+    Thresholds come from the discovery_state row when present, else from config.
+    """
+    if vessel_lat is None or vessel_lon is None:
+        return []
+
+    state = _read_discovery_state(connection)
+    moved_miles: float | None = None
+    if state is not None:
+        threshold_miles = state.get("discovery_threshold_miles") or config.discovery_move_miles
+        last_discovery = _parse_utc(state.get("last_discovery_time"))
+        min_interval_hours = state.get("min_discovery_interval_hours") or 0
+        if last_discovery is not None and now - last_discovery < timedelta(hours=min_interval_hours):
+            return []
+        if state.get("last_discovery_lat") is not None and state.get("last_discovery_lon") is not None:
+            moved_miles = haversine_distance(
+                state["last_discovery_lat"], state["last_discovery_lon"], vessel_lat, vessel_lon
+            )
+            if moved_miles < threshold_miles:
+                return []
+
+    return [
+        DueWork(
+            mode=MODE_DISCOVERY,
+            value=_MODE_BASE_VALUE[MODE_DISCOVERY],
+            due_at_utc=_utc_iso(now),
+            estimated_seconds=config.discovery_seconds,
+            payload={"lat": float(vessel_lat), "lon": float(vessel_lon), "moved_miles": moved_miles},
+        )
+    ]
+
+
+def _feature_due_work(connection: sqlite3.Connection, now: datetime, config: CadenceConfig) -> list[DueWork]:
+    """Feature Mode: marinas with a website whose features were never or long ago checked."""
+    marinas_columns = _table_columns(connection, "marinas")
+    if "features_last_checked_at_utc" not in marinas_columns:
+        return []
+
+    cutoff_utc = _utc_iso(now - timedelta(days=config.feature_interval_days))
+    connection.row_factory = sqlite3.Row
+    rows = connection.execute(
+        """
+        SELECT marina_uid, website_url, features_last_checked_at_utc
+        FROM marinas
+        WHERE website_url IS NOT NULL
+          AND TRIM(website_url) != ''
+          AND (features_last_checked_at_utc IS NULL OR features_last_checked_at_utc < ?)
+        ORDER BY COALESCE(features_last_checked_at_utc, '')
+        LIMIT ?
+        """,
+        (cutoff_utc, config.max_items_per_mode),
+    ).fetchall()
+
+    due: list[DueWork] = []
+    for row in rows:
+        last_checked = _parse_utc(row["features_last_checked_at_utc"])
+        due_at = None if last_checked is None else last_checked + timedelta(days=config.feature_interval_days)
+        due.append(
+            DueWork(
+                mode=MODE_FEATURE,
+                value=_MODE_BASE_VALUE[MODE_FEATURE] + _staleness_bonus(now, due_at),
+                due_at_utc=_utc_iso(due_at or now),
+                estimated_seconds=config.feature_seconds_per_marina,
+                marina_uid=row["marina_uid"],
+                payload=dict(row),
+            )
+        )
+    return due
+
+
+def collect_due_work(
+    connection: sqlite3.Connection,
+    config: CadenceConfig | None = None,
+    vessel_lat: float | None = None,
+    vessel_lon: float | None = None,
+    now: datetime | None = None,
+) -> list[DueWork]:
+    """Return every due item across the three modes, highest value first."""
+    if connection is None:
+        raise CadenceSchedulerError("connection is required")
+    if config is None:
+        config = CadenceConfig()
+    _validate_config(config)
+    if (vessel_lat is None) != (vessel_lon is None):
+        raise CadenceSchedulerError("vessel_lat and vessel_lon must be given together")
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    due = (
+        _fuel_due_work(connection, now, config)
+        + _discovery_due_work(connection, now, config, vessel_lat, vessel_lon)
+        + _feature_due_work(connection, now, config)
+    )
+    due.sort(key=lambda item: (-item.value, item.due_at_utc))
+    return due
+
+
+def plan_cadence_work(due_work: list[DueWork], config: CadenceConfig) -> tuple[list[DueWork], list[DueWork]]:
+    """Fit due work into the run's time budget, highest value first.
+
+    Fuel seeds run max_concurrency at a time on the worker's thread pool, so each costs
+    estimated_seconds / max_concurrency of wall time; discovery and feature items run
+    serially. An item that does not fit is skipped in favour of cheaper ones behind it.
+    Returns (planned, over_budget), both in value order.
+    """
+    _validate_config(config)
+
+    heap: list[tuple[float, str, int, DueWork]] = []
+    for sequence, item in enumerate(due_work):
+        heapq.heappush(heap, (-item.value, item.due_at_utc, sequence, item))
+
+    remaining_seconds = float(config.time_budget_seconds)
+    planned: list[DueWork] = []
+    over_budget: list[DueWork] = []
+    while heap:
+        _negative_value, _due_at_utc, _sequence, item = heapq.heappop(heap)
+        lanes = config.max_concurrency if item.mode == MODE_FUEL else 1
+        cost_seconds = item.estimated_seconds / lanes
+        if cost_seconds > remaining_seconds:
+            over_budget.append(item)
+            continue
+        remaining_seconds -= cost_seconds
+        planned.append(item)
+    return planned, over_budget
+
+
+def _run_fuel_work(
+    connection: sqlite3.Connection,
+    items: list[DueWork],
+    config: CadenceConfig,
+    deadline: float,
+    drain_fuel_queue: bool,
+) -> dict[str, Any]:
+    seed_ids = publish_candidate_rows(connection, [item.payload for item in items], _utc_now_iso())
+    result: dict[str, Any] = {
+        "published_count": len(seed_ids),
+        "processed_count": 0,
+        "success_count": 0,
+        "failed_count": 0,
+        "deferred_count": 0,
+    }
+
+    if not drain_fuel_queue:
+        from fuel_extractor_v2.app.worker_daemon import notify_fuel_worker
+
+        result["worker_notified"] = notify_fuel_worker()
+        return result
+
+    from fuel_extractor_v2.app.fuel_worker import FuelWorkerOptions, process_pending_seeds
+
+    # The queue hands out seeds by priority_hint, so the highest-value seeds (ours or
+    # older ones) go first. Batches of max_concurrency keep the deadline checkable.
+    options = FuelWorkerOptions(max_workers=config.max_concurrency)
+    while result["processed_count"] < len(seed_ids) and time.monotonic() < deadline:
+        batch = process_pending_seeds(connection, config.max_concurrency, options)
+        if batch["processed_count"] == 0:
+            break
+        for key in ("processed_count", "success_count", "failed_count", "deferred_count"):
+            result[key] += batch[key]
+    return result
+
+
+def run_cadence_cycle(
+    db_path: str,
+    config: CadenceConfig | None = None,
+    vessel_lat: float | None = None,
+    vessel_lon: float | None = None,
+    feature_handler: FeatureHandler | None = None,
+    drain_fuel_queue: bool = True,
+) -> dict[str, Any]:
+    """Run one scheduler cycle: collect due work, plan it into the budget, execute by value.
+
+    Fuel items are published as seeds with a priority_hint and, unless drain_fuel_queue
+    is False (a resident fuel worker is running), drained with max_concurrency workers.
+    Discovery sweeps around the vessel. Feature items go to feature_handler; without one
+    they are reported as unhandled. No new mode starts once the time budget is spent.
+    """
+    if not isinstance(db_path, str) or not db_path.strip():
+        raise CadenceSchedulerError("db_path is required")
+    if config is None:
+        config = CadenceConfig()
+    _validate_config(config)
+
+    started = time.monotonic()
+    deadline = started + config.time_budget_seconds
+
+    connection = sqlite3.connect(db_path)
+    try:
+        due_work = collect_due_work(connection, config, vessel_lat, vessel_lon)
+        planned, over_budget = plan_cadence_work(due_work, config)
+        connection.commit()
+
+        by_mode: dict[str, list[DueWork]] = {MODE_FUEL: [], MODE_DISCOVERY: [], MODE_FEATURE: []}
+        for item in planned:
+            by_mode[item.mode].append(item)
+
+        result: dict[str, Any] = {
+            "due_counts": {mode: sum(1 for item in due_work if item.mode == mode) for mode in by_mode},
+            "planned_counts": {mode: len(items) for mode, items in by_mode.items()},
+            "over_budget_count": len(over_budget),
+            "fuel": None,
+            "discovery": None,
+            "feature": None,
+            "skipped_modes": [],
+        }
+
+        # Modes run in the order of their best planned item, i.e. by value.
+        mode_order: list[str] = []
+        for item in planned:
+            if item.mode not in mode_order:
+                mode_order.append(item.mode)
+
+        for mode in mode_order:
+            if time.monotonic() >= deadline:
+                result["skipped_modes"].append(mode)
+                continue
+
+            items = by_mode[mode]
+            if mode == MODE_FUEL:
+                result["fuel"] = _run_fuel_work(connection, items, config, deadline, drain_fuel_queue)
+            elif mode == MODE_DISCOVERY:
+                payload = items[0].payload
+                sweep = sweep_region(
+                    db_path=db_path,
+                    center_lat=payload["lat"],
+                    center_lon=payload["lon"],
+                    sweep_radius_miles=config.discovery_sweep_radius_miles,
+                )
+                _record_discovery_run(connection, payload["lat"], payload["lon"], _utc_now_iso())
+                result["discovery"] = {
+                    key: value for key, value in sweep.items() if key != "point_results"
+                }
+            elif feature_handler is not None:
+                result["feature"] = feature_handler(connection, items)
+            else:
+                result["feature"] = {"unhandled_count": len(items)}
+
+        result["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        result["budget_exhausted"] = time.monotonic() >= deadline
+        return result
+    finally:
+        connection.close()
@@ -3,8 +3,6 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from fuel_extractor.app.marinas_discovery import discover_marinas_by_bounds, discover_marinas_by_query
-
 
 class DiscoveryRunnerError(Exception):
     pass
@@ -77,6 +75,9 @@ def discover_by_query(
     if not isinstance(discovered_at_utc, str) or not discovered_at_utc.strip():
         raise DiscoveryRunnerError("discovered_at_utc is required")
 
+    # Deferred: marinas_discovery loads Playwright, which reconcile/seed runs never use.
+    from fuel_extractor.app.marinas_discovery import discover_marinas_by_query
+
     raw_records = discover_marinas_by_query(location_query.strip(), timeout_seconds, scroll_cycles)
     normalized_records: list[dict[str, Any]] = []
     for raw_record in raw_records:
@@ -96,6 +97,8 @@ def discover_by_bounds(
     if not isinstance(discovered_at_utc, str) or not discovered_at_utc.strip():
         raise DiscoveryRunnerError("discovered_at_utc is required")
 
+    from fuel_extractor.app.marinas_discovery import discover_marinas_by_bounds
+
     raw_records = discover_marinas_by_bounds(
         min_lat=min_lat,
         max_lat=max_lat,
@@ -6,7 +6,8 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any
 
-from fuel_extractor_v2.app.sync_event_writer import write_sync_event
+from fuel_extractor_v2.app.change_log import ensure_change_log_schema
+from fuel_extractor_v2.app.sync_event_writer import SyncEventBuffer
 
 
 class ReconcileRunnerError(Exception):
@@ -210,8 +211,6 @@ def _build_update_fields(
         update_fields["missing_from_web_count"] = 0
     if "updated_at_utc" in columns:
         update_fields["updated_at_utc"] = discovered_at_utc
-    if "sync_dirty" in columns:
-        update_fields["sync_dirty"] = 1
 
     fuel_candidate_value, seed_reason_value = _derive_fuel_candidacy(discovered_record, existing_row)
     if "fuel_candidate" in columns:
@@ -233,6 +232,7 @@ def _insert_new_marina(
     discovered_record: dict[str, Any],
     discovered_at_utc: str,
     name_column_name: str,
+    sync_events: SyncEventBuffer,
 ) -> str:
     marina_uid_value = str(uuid.uuid4())
 
@@ -312,10 +312,9 @@ def _insert_new_marina(
 
     connection.execute(insert_sql, insert_values)
 
-    # Write sync event for new discovery
+    # Queue sync event for new discovery; the sweep inserts them in bulk before committing
     try:
-        write_sync_event(
-            connection,
+        sync_events.add(
             marina_uid=marina_uid_value,
             entity_type="marina",
             entity_ref=source_marinas_id.strip(),
@@ -340,11 +339,14 @@ def _can_insert_new_marina(discovered_record: dict[str, Any]) -> bool:
 
 def _update_existing_marina(
     connection: sqlite3.Connection,
-    rowid_value: int,
+    existing_row: sqlite3.Row,
     update_fields: dict[str, Any],
+    name_column_name: str,
+    sync_events: SyncEventBuffer,
 ) -> None:
     if not update_fields:
         return
+    rowid_value = existing_row["rowid"]
 
     set_clause_parts: list[str] = []
     set_values: list[Any] = []
@@ -352,16 +354,41 @@ def _update_existing_marina(
         set_clause_parts.append(f"{field_name} = ?")
         set_values.append(field_value)
 
-    # Always set sync_dirty = 1 on update to trigger VPS sync
-    set_clause_parts.append("sync_dirty = ?")
-    set_values.append(1)
-
     set_values.append(rowid_value)
     sql = f"UPDATE marinas SET {', '.join(set_clause_parts)} WHERE rowid = ?"
     cursor = connection.execute(sql, set_values)
     if cursor.rowcount != 1:
         raise ReconcileRunnerError(f"expected to update 1 row for rowid={rowid_value}, updated {cursor.rowcount}")
 
+    # sync_dirty is set by the change_log capture trigger when a synced column changed.
+    # Queue a sync event like _insert_new_marina does, so updates are audited like inserts.
+    # A new name is a rebrand; any other rediscovery puts the marina back to pending review.
+    existing_name = existing_row[name_column_name]
+    new_name = update_fields.get(name_column_name, existing_name)
+    renamed = isinstance(existing_name, str) and existing_name.strip() != new_name
+    changed_fields = sorted(
+        field_name
+        for field_name, field_value in update_fields.items()
+        if field_name in existing_row.keys() and existing_row[field_name] != field_value
+    )
+    entity_ref = update_fields.get("source_marinas_id") or existing_row["marina_uid"]
+    sync_dirty_before = "sync_dirty" in existing_row.keys() and existing_row["sync_dirty"] == 1
+    try:
+        sync_events.add(
+            marina_uid=existing_row["marina_uid"],
+            entity_type="marina",
+            entity_ref=entity_ref,
+            event_type="rebrand_detected" if renamed else "marked_unverified",
+            reason_tag="discovery_rename" if renamed else "discovery_rescan",
+            before_data={field_name: existing_row[field_name] for field_name in changed_fields},
+            after_data={field_name: update_fields[field_name] for field_name in changed_fields},
+            sync_dirty_before=sync_dirty_before,
+            sync_dirty_after=sync_dirty_before or bool(changed_fields),
+        )
+    except Exception:
+        # Don't fail the update if sync event fails
+        pass
+
 
 def reconcile_discovered_records(
     connection: sqlite3.Connection,
@@ -378,10 +405,13 @@ def reconcile_discovered_records(
     columns = _get_marinas_columns(connection)
     _required_columns_exist(columns, ("marina_uid", "lat", "lon", "created_at_utc", "updated_at_utc"))
     name_column_name = _name_column(columns)
+    # The capture triggers mark updated marinas sync_dirty; make sure they exist.
+    ensure_change_log_schema(connection)
 
     inserted_count = 0
     updated_count = 0
     skipped_missing_coordinates_count = 0
+    sync_events = SyncEventBuffer(connection)
 
     for discovered_record in discovered_records:
         if not isinstance(discovered_record, dict):
@@ -431,6 +461,7 @@ def reconcile_discovered_records(
                 discovered_record=discovered_record,
                 discovered_at_utc=reconciled_at_utc,
                 name_column_name=name_column_name,
+                sync_events=sync_events,
             )
             inserted_count += 1
             continue
@@ -446,9 +477,20 @@ def reconcile_discovered_records(
             name_column_name=name_column_name,
             existing_row=existing_row,
         )
-        _update_existing_marina(connection, rowid_value, update_fields)
+        _update_existing_marina(
+            connection=connection,
+            existing_row=existing_row,
+            update_fields=update_fields,
+            name_column_name=name_column_name,
+            sync_events=sync_events,
+        )
         updated_count += 1
 
+    try:
+        sync_events.flush()
+    except Exception:
+        # Don't fail the sweep if sync events fail
+        pass
     connection.commit()
     return {
         "inserted": inserted_count,
@@ -42,6 +42,31 @@ def _name_column(columns: set[str]) -> str:
     raise SeedPublishRunnerError("marinas must include either primary_name or name")
 
 
+def seed_queue_guard_sql(connection: sqlite3.Connection, marina_alias: str = "m") -> str:
+    """NOT EXISTS clause that keeps a marina out of publishing while the queue still owns it.
+
+    A marina is skipped while it has a 'pending' or 'processing' seed, or a dead-lettered
+    one: 'failed' with a last_error_class, written by fuel_extractor_v2 once a seed runs
+    out of retries. Republishing it would only start the same retries again; the seed
+    goes back through requeue_dead_lettered_seeds instead. Plain 'failed' rows from a
+    worker running without retries are republished as before.
+    """
+    queue_columns = {row[1] for row in connection.execute("PRAGMA table_info(fuel_seed_queue)").fetchall()}
+    dead_letter_predicate = ""
+    if "last_error_class" in queue_columns:
+        dead_letter_predicate = "OR (q.queue_status = 'failed' AND q.last_error_class IS NOT NULL)"
+    return f"""
+            AND NOT EXISTS (
+                SELECT 1
+                FROM fuel_seed_queue q
+                WHERE q.marina_uid = {marina_alias}.marina_uid
+                  AND (
+                      q.queue_status IN ('pending', 'processing')
+                      {dead_letter_predicate}
+                  )
+            )"""
+
+
 def _list_candidate_rows(connection: sqlite3.Connection, max_rows: int) -> list[dict[str, Any]]:
     if not isinstance(max_rows, int):
         raise SeedPublishRunnerError("max_rows must be an int")
@@ -63,6 +88,18 @@ def _list_candidate_rows(connection: sqlite3.Connection, max_rows: int) -> list[
 
     name_column_name = _name_column(columns)
 
+    # Anti-clog cooldown written by fuel_extractor_v2, checked per row on the
+    # idx_marinas_fuel_candidate rows.
+    cooldown_predicate = ""
+    parameters: tuple[Any, ...] = (max_rows,)
+    if "fuel_cooldown_until_utc" in columns:
+        cooldown_predicate = (
+            "AND (m.fuel_cooldown_until_utc IS NULL OR m.fuel_cooldown_until_utc <= ?)"
+        )
+        parameters = (_utc_now_iso(), max_rows)
+
+    seed_queue_guard = seed_queue_guard_sql(connection)
+
     connection.row_factory = sqlite3.Row
     cursor = connection.cursor()
     cursor.execute(
@@ -92,16 +129,12 @@ def _list_candidate_rows(connection: sqlite3.Connection, max_rows: int) -> list[
                 )
                 OR (m.website_url IS NOT NULL AND TRIM(m.website_url) != '')
             )
-            AND NOT EXISTS (
-                SELECT 1
-                FROM fuel_seed_queue q
-                WHERE q.marina_uid = m.marina_uid
-                  AND q.queue_status IN ('pending', 'processing')
-            )
+            {cooldown_predicate}
+            {seed_queue_guard}
         ORDER BY m.updated_at_utc DESC
         LIMIT ?
         """,
-        (max_rows,),
+        parameters,
     )
 
     rows = cursor.fetchall()
@@ -122,6 +155,25 @@ def publish_candidates_to_seed_queue(
         raise SeedPublishRunnerError("seeded_at_utc is required")
 
     candidates = _list_candidate_rows(connection, max_rows)
+    published_seed_ids = publish_candidate_rows(connection, candidates, seeded_at_utc)
+
+    return {
+        "candidate_count": len(candidates),
+        "published_count": len(published_seed_ids),
+        "seed_ids": published_seed_ids,
+    }
+
+
+def publish_candidate_rows(
+    connection: sqlite3.Connection,
+    candidates: list[dict[str, Any]],
+    seeded_at_utc: str,
+) -> list[int]:
+    """Publish marinas rows as pending seeds; a candidate may carry its own priority_hint."""
+    if connection is None:
+        raise SeedPublishRunnerError("connection is required")
+    if not isinstance(seeded_at_utc, str) or not seeded_at_utc.strip():
+        raise SeedPublishRunnerError("seeded_at_utc is required")
 
     published_seed_ids: list[int] = []
     for candidate in candidates:
@@ -160,18 +212,14 @@ def publish_candidates_to_seed_queue(
             "source_marinas_id": candidate.get("source_marinas_id"),
             "dockwa_destination_id": candidate.get("dockwa_destination_id"),
             "last_fuel_checked_at_utc": candidate.get("last_fuel_checked_at_utc"),
-            "priority_hint": "normal",
+            "priority_hint": candidate.get("priority_hint") or "normal",
             "queue_status": "pending",
         }
 
         seed_id = publish_seed_row(connection, seed_row)
         published_seed_ids.append(seed_id)
 
-    return {
-        "candidate_count": len(candidates),
-        "published_count": len(published_seed_ids),
-        "seed_ids": published_seed_ids,
-    }
+    return published_seed_ids
 
 
 def publish_candidates_now(connection: sqlite3.Connection, max_rows: int) -> dict[str, Any]:
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""CLI for one cadence scheduler cycle across Fuel, Discovery and Feature modes.
+
+Usage:
+    python run_cadence_cycle.py \
+        --db-path data/nav_data.db \
+        --vessel-lat 37.2425 \
+        --vessel-lon -76.5069 \
+        --time-budget-seconds 600 \
+        --max-concurrency 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from marina_management_v2.app.cadence_scheduler import CadenceConfig, run_cadence_cycle
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run one Fuel/Discovery/Feature cadence cycle")
+    parser.add_argument("--db-path", required=True, help="Path to SQLite database")
+    parser.add_argument("--vessel-lat", type=float, help="Current vessel latitude (enables Discovery Mode)")
+    parser.add_argument("--vessel-lon", type=float, help="Current vessel longitude (enables Discovery Mode)")
+    parser.add_argument(
+        "--time-budget-seconds",
+        type=float,
+        default=600.0,
+        help="Wall-clock budget for this cycle (default: 600)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=2,
+        help="Fuel seeds fetched concurrently (default: 2)",
+    )
+    parser.add_argument(
+        "--publish-only",
+        action="store_true",
+        help="Publish due fuel seeds and wake the resident fuel worker instead of draining here",
+    )
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path)
+    if not db_path.exists():
+        raise RuntimeError(f"Database file not found: {db_path}")
+    if (args.vessel_lat is None) != (args.vessel_lon is None):
+        raise RuntimeError("--vessel-lat and --vessel-lon must be given together")
+    if args.time_budget_seconds <= 0:
+        raise RuntimeError("--time-budget-seconds must be > 0")
+    if args.max_concurrency < 1:
+        raise RuntimeError("--max-concurrency must be >= 1")
+
+    config = CadenceConfig(
+        time_budget_seconds=args.time_budget_seconds,
+        max_concurrency=args.max_concurrency,
+    )
+    result = run_cadence_cycle(
+        db_path=str(db_path),
+        config=config,
+        vessel_lat=args.vessel_lat,
+        vessel_lon=args.vessel_lon,
+        drain_fuel_queue=not args.publish_only,
+    )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import { spawn } from "child_process";
+import net from "net";
 import path from "path";
 
 /**
@@ -121,8 +122,39 @@ export async function triggerDiscovery(options) {
   return runPythonScript("marina_management_v2/run_geographic_sweep.py", args);
 }
 
+/**
+ * Send one command to the resident fuel worker (run_fuel_worker_daemon.py)
+ */
+function sendFuelWorkerCommand(socketPath, command, timeoutMs = 2000) {
+  return new Promise((resolve, reject) => {
+    const client = net.createConnection(socketPath);
+    let reply = "";
+
+    client.setTimeout(timeoutMs);
+    client.on("connect", () => client.write(`${command}\n`));
+    client.on("data", (data) => {
+      reply += data.toString();
+    });
+    client.on("timeout", () => {
+      client.destroy();
+      reject(new Error(`Fuel worker daemon did not answer "${command}"`));
+    });
+    client.on("error", reject);
+    client.on("end", () => {
+      try {
+        resolve(JSON.parse(reply));
+      } catch (_err) {
+        reject(new Error(`Invalid reply from fuel worker daemon: ${reply}`));
+      }
+    });
+  });
+}
+
 /**
  * Trigger fuel extraction worker
+ *
+ * When FUEL_WORKER_SOCKET points at a running daemon, it is woken instead of
+ * spawning a one-shot worker; the daemon drains the queue in the background.
  */
 export async function triggerFuelExtraction(options) {
   const { dbPath, batchSize = 50 } = options;
@@ -131,6 +163,18 @@ export async function triggerFuelExtraction(options) {
     throw new Error("dbPath is required");
   }
 
+  const socketPath = options.socketPath || process.env.FUEL_WORKER_SOCKET;
+  if (socketPath) {
+    try {
+      const result = await sendFuelWorkerCommand(socketPath, "wake");
+      return { result, stderr: null };
+    } catch (err) {
+      console.warn(
+        `[FuelPipeline] Fuel worker daemon unavailable (${err.message}), running once instead`
+      );
+    }
+  }
+
   const args = ["--db-path", dbPath, "--batch-size", String(batchSize)];
 
   return runPythonScript("fuel_extractor_v2/run_fuel_worker_once.py", args);